@@ -166,6 +166,8 @@ def search_interface():
                 print(f"\n📊 Database Statistics:")
                 print(f"  📚 Total lectures: {count}")
                 print(f"  💾 Storage location: {vector_db.client._settings.persist_directory}")
+                flight = processor.llm_stats()["single_flight"]
+                print(f"  🤖 Groq calls issued: {flight['issued']} (coalesced duplicates: {flight['coalesced']})")
             except Exception as e:
                 print(f"❌ Error fetching stats: {e}")
         
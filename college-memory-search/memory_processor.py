@@ -1,13 +1,13 @@
-from groq import Groq
-from config import GROQ_API_KEY, GROQ_MODEL
 import json
+from common.llm_client import get_llm
+from config import GROQ_API_KEY, GROQ_MODEL
 
 class MemoryProcessor:
     def __init__(self):
-        """Initialize Groq client"""
+        """Initialize the shared Groq client"""
         if not GROQ_API_KEY:
             raise ValueError("❌ GROQ_API_KEY is not set in config!")
-        self.client = Groq(api_key=GROQ_API_KEY)
+        self.llm = get_llm(GROQ_API_KEY)
         self.model = GROQ_MODEL
     
     def generate_lecture_summary(self, lecture_data):
@@ -34,7 +34,7 @@ class MemoryProcessor:
             Make it detailed, educational, and easy to understand. Use clear language suitable for college students.
             """
             
-            response = self.client.chat.completions.create(
+            response = self.llm.create(
                 messages=[
                     {
                         "role": "system",
@@ -98,7 +98,7 @@ class MemoryProcessor:
             Be conversational but accurate. Help the student understand the concept.
             """
             
-            response = self.client.chat.completions.create(
+            response = self.llm.create(
                 messages=[
                     {
                         "role": "system",
@@ -143,7 +143,7 @@ class MemoryProcessor:
             Format as JSON.
             """
             
-            response = self.client.chat.completions.create(
+            response = self.llm.create(
                 messages=[
                     {
                         "role": "system",
@@ -165,7 +165,11 @@ class MemoryProcessor:
             return f"Error generating quiz: {e}"
     
     def explain_concept(self, concept, context=""):
-        """Explain a specific concept in simple terms (bonus feature)"""
+        """Explain a specific concept in simple terms (bonus feature)
+
+        Students asking about the same concept at the same time share a single
+        Groq call through the shared client's single-flight layer.
+        """
         try:
             prompt = f"""
             Explain the following concept in simple terms suitable for a college student:
@@ -182,7 +186,7 @@ class MemoryProcessor:
             Keep it concise but thorough.
             """
             
-            response = self.client.chat.completions.create(
+            response = self.llm.create(
                 messages=[
                     {
                         "role": "system",
@@ -195,10 +199,15 @@ class MemoryProcessor:
                 ],
                 model=self.model,
                 temperature=0.3,
-                max_tokens=512
+                max_tokens=512,
+                group="explain_concept"  # identical concurrent requests share one call
             )
             
             return response.choices[0].message.content
             
         except Exception as e:
-            return f"Error explaining concept: {e}"
\ No newline at end of file
+            return f"Error explaining concept: {e}"
+
+    def llm_stats(self):
+        """Latency/token metrics and issued vs. coalesced calls of the shared client"""
+        return self.llm.stats()
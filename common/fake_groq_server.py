@@ -0,0 +1,128 @@
+"""
+Local stand-in for the Groq chat completions API
+
+Answers POST /openai/v1/chat/completions with a canned reply after a fixed
+delay, and fails a configurable fraction of requests with 429 or 503 so the
+retry and rate-limit behaviour of common.llm_client can be exercised offline.
+
+Run with:  python -m common.fake_groq_server --port 9000 --failure-rate 0.2
+Or:        python -m common.fake_groq_server --demo   (fake server + client metrics)
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeGroqHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if self.path != "/openai/v1/chat/completions":
+            self._send_json(404, {"error": {"message": "Not found"}})
+            return
+
+        server = self.server
+        with server.lock:
+            server.requests += 1
+        time.sleep(server.latency)
+
+        if random.random() < server.failure_rate:
+            if random.random() < 0.5:
+                self._send_json(429, {"error": {"message": "Rate limit reached", "type": "rate_limit"}},
+                                {"retry-after": "0"})
+            else:
+                self._send_json(503, {"error": {"message": "Service unavailable"}})
+            return
+
+        prompt = body["messages"][-1]["content"] if body.get("messages") else ""
+        content = f"Fake reply to: {prompt[:60]}"
+        prompt_tokens = sum(len(m.get("content") or "") for m in body.get("messages", [])) // 4
+        completion_tokens = len(content) // 4
+        self._send_json(200, {
+            "id": "fake", "object": "chat.completion", "created": int(time.time()),
+            "model": body.get("model"),
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                      "total_tokens": prompt_tokens + completion_tokens}
+        })
+
+
+def start_fake_server(port=0, latency=0.05, failure_rate=0.0):
+    """Start the fake API in a daemon thread; returns (server, base_url)"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), FakeGroqHandler)
+    server.latency = latency
+    server.failure_rate = failure_rate
+    server.requests = 0
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def demo(base_url, n_requests=50, distinct_prompts=10, threads=16):
+    """Send concurrent, partly identical requests through the shared client and print its metrics"""
+    from common.llm_client import get_llm, LRUResponseCache
+
+    llm = get_llm(api_key="fake-key", base_url=base_url, requests_per_minute=600,
+                  backoff_base=0.05, cache=LRUResponseCache(ttl=300))
+    prompts = [f"Question {i % distinct_prompts}" for i in range(n_requests)]
+
+    def ask(prompt):
+        return llm.complete([{"role": "user", "content": prompt}], model="fake-model", max_tokens=50)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(ask, prompts))
+    print(f"{n_requests} calls in {time.perf_counter() - start:.2f}s")
+    stats = llm.stats()
+    flight = stats.pop("single_flight")
+    for name, value in stats.items():
+        print(f"  {name:18s} {value:.3f}" if isinstance(value, float) else f"  {name:18s} {value}")
+    print(f"  {'issued':18s} {flight['issued']}")
+    print(f"  {'coalesced':18s} {flight['coalesced']} ({flight['coalesced_ratio']:.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Groq chat completions server")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per response")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of requests answered with 429/503")
+    parser.add_argument("--demo", action="store_true", help="Start on a free port and run a client demo against it")
+    args = parser.parse_args()
+
+    if args.demo:
+        server, base_url = start_fake_server(0, args.latency, args.failure_rate or 0.2)
+        demo(base_url)
+        print(f"  server saw {server.requests} requests")
+        server.shutdown()
+        return
+
+    server, base_url = start_fake_server(args.port, args.latency, args.failure_rate)
+    print(f"Fake Groq API listening on {base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
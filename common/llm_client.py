@@ -0,0 +1,278 @@
+"""
+Shared Groq client layer used by every project in this repo
+
+    from common.llm_client import get_llm
+
+    llm = get_llm()
+    answer = llm.complete(messages=[...], model="llama-3.3-70b-versatile", max_tokens=300)
+
+One LLMClient per (api_key, base_url) is shared by the whole process, so all
+callers get:
+  - a pooled HTTP connection (httpx keep-alive) instead of one client each
+  - token-bucket rate limiting on requests/minute and tokens/minute
+  - retries with exponential backoff and full jitter on 429/5xx/network errors
+  - coalescing of identical in-flight requests
+  - an optional, pluggable response cache
+  - per-call latency and token metrics (llm.stats())
+
+Set GROQ_BASE_URL (or pass base_url) to run against a local fake server.
+"""
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+
+import httpx
+from groq import Groq, APIConnectionError, APITimeoutError, APIStatusError, RateLimitError
+
+from common.single_flight import SingleFlight
+
+
+def estimate_tokens(messages, max_tokens):
+    """Rough upper bound of the tokens a request will consume (~4 characters per token)"""
+    prompt_chars = sum(len(m.get("content") or "") for m in messages)
+    return prompt_chars // 4 + 4 * len(messages) + (max_tokens or 0)
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until enough capacity is available"""
+
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, amount=1):
+        """Take amount tokens, sleeping until the bucket has refilled enough"""
+        amount = min(amount, self.capacity)
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                wait = (amount - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def give_back(self, amount):
+        """Return unused tokens once the real usage is known"""
+        with self.lock:
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class ResponseCache:
+    """Interface for response caches; subclass to store responses elsewhere"""
+
+    def get(self, key):
+        raise NotImplementedError
+
+    def set(self, key, value):
+        raise NotImplementedError
+
+
+class LRUResponseCache(ResponseCache):
+    """In-memory LRU cache with an optional time-to-live"""
+
+    def __init__(self, max_entries=1024, ttl=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (value, time.monotonic())
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+
+class Metrics:
+    """Counters and recent latencies for every call made through an LLMClient"""
+
+    def __init__(self, window=1000):
+        self.lock = threading.Lock()
+        self.latencies = deque(maxlen=window)
+        self.counters = {
+            "calls": 0, "api_requests": 0, "errors": 0, "retries": 0,
+            "cache_hits": 0,
+            "prompt_tokens": 0, "completion_tokens": 0,
+        }
+
+    def incr(self, name, amount=1):
+        with self.lock:
+            self.counters[name] += amount
+
+    def record_latency(self, seconds):
+        with self.lock:
+            self.latencies.append(seconds)
+
+    def snapshot(self):
+        """Counters plus p50/p95 latency (seconds) of the recent window"""
+        with self.lock:
+            stats = dict(self.counters)
+            latencies = sorted(self.latencies)
+        if latencies:
+            stats["latency_p50"] = latencies[len(latencies) // 2]
+            stats["latency_p95"] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        return stats
+
+
+class LLMClient:
+    RETRYABLE = (RateLimitError, APIConnectionError, APITimeoutError)
+
+    def __init__(self, api_key=None, base_url=None, requests_per_minute=30, tokens_per_minute=6000,
+                 max_retries=4, backoff_base=1.0, backoff_max=30.0, cache=None,
+                 max_connections=20, timeout=60.0):
+        """
+        Args:
+            api_key (str): Groq API key (defaults to GROQ_API_KEY)
+            base_url (str): API URL override (defaults to GROQ_BASE_URL, then Groq)
+            requests_per_minute (int): Request quota to stay under
+            tokens_per_minute (int): Token quota to stay under
+            max_retries (int): Retries for rate-limit, 5xx and network errors
+            backoff_base (float): First backoff in seconds, doubled each retry
+            backoff_max (float): Cap on a single backoff
+            cache (ResponseCache): Cache for responses (None disables caching)
+            max_connections (int): Size of the HTTP connection pool
+        """
+        self.http_client = httpx.Client(
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections),
+            timeout=httpx.Timeout(timeout, connect=5.0)
+        )
+        # Retries are handled here, with jitter and rate limiting, not by the SDK
+        self.client = Groq(api_key=api_key or os.getenv("GROQ_API_KEY"), base_url=base_url,
+                           http_client=self.http_client, max_retries=0)
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.cache = cache
+        self.metrics = Metrics()
+        self.single_flight = SingleFlight()
+
+    @staticmethod
+    def request_key(**request):
+        """Stable hash of everything that determines a completion"""
+        blob = json.dumps(request, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(blob).hexdigest()
+
+    def _is_retryable(self, error):
+        if isinstance(error, self.RETRYABLE):
+            return True
+        return isinstance(error, APIStatusError) and error.status_code >= 500
+
+    def _backoff(self, attempt, error):
+        """Full-jitter exponential backoff, honouring Retry-After when the API sends it"""
+        retry_after = None
+        response = getattr(error, "response", None)
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get("retry-after"))
+            except (TypeError, ValueError):
+                retry_after = None
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        return max(delay, retry_after or 0)
+
+    def _create_with_retries(self, request):
+        estimated = estimate_tokens(request["messages"], request.get("max_tokens"))
+        for attempt in range(self.max_retries + 1):
+            self.request_bucket.acquire()
+            self.token_bucket.acquire(estimated)
+            start = time.perf_counter()
+            self.metrics.incr("api_requests")
+            try:
+                response = self.client.chat.completions.create(**request)
+            except Exception as e:
+                if attempt < self.max_retries and self._is_retryable(e):
+                    self.metrics.incr("retries")
+                    time.sleep(self._backoff(attempt, e))
+                    continue
+                self.metrics.incr("errors")
+                raise
+
+            self.metrics.record_latency(time.perf_counter() - start)
+            usage = getattr(response, "usage", None)
+            if usage is not None:
+                self.metrics.incr("prompt_tokens", usage.prompt_tokens or 0)
+                self.metrics.incr("completion_tokens", usage.completion_tokens or 0)
+                self.token_bucket.give_back(max(0, estimated - (usage.total_tokens or estimated)))
+            return response
+
+    def create(self, use_cache=True, group="chat", **request):
+        """
+        chat.completions.create() with rate limiting, retries, coalescing and caching
+
+        Identical concurrent requests (same model, messages, temperature,
+        max_tokens and other params) are sent once; the others wait for that
+        result. group names the call site in the coalescing stats.
+        Returns the SDK response object. Streaming requests bypass the cache and coalescing.
+        """
+        self.metrics.incr("calls")
+        if request.get("stream"):
+            return self._create_with_retries(request)
+
+        key = self.request_key(**request)
+        if use_cache and self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.metrics.incr("cache_hits")
+                return cached
+
+        def issue():
+            response = self._create_with_retries(request)
+            if use_cache and self.cache is not None:
+                self.cache.set(key, response)
+            return response
+
+        return self.single_flight.do(key, issue, group=group)
+
+    def stats(self):
+        """Call metrics together with issued vs. coalesced counts per call site"""
+        stats = self.metrics.snapshot()
+        stats["single_flight"] = self.single_flight.snapshot()
+        return stats
+
+    def complete(self, messages, model, use_cache=True, group="chat", **params):
+        """Run a chat completion and return the message text"""
+        response = self.create(use_cache=use_cache, group=group, messages=messages, model=model, **params)
+        return response.choices[0].message.content
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_llm(api_key=None, base_url=None, **config):
+    """Process-wide shared LLMClient for this API key and URL (config applies on first use)"""
+    api_key = api_key or os.getenv("GROQ_API_KEY")
+    base_url = base_url or os.getenv("GROQ_BASE_URL")
+    with _clients_lock:
+        key = (api_key, base_url)
+        if key not in _clients:
+            _clients[key] = LLMClient(api_key=api_key, base_url=base_url, **config)
+        return _clients[key]
@@ -0,0 +1,73 @@
+"""
+Single-flight execution: identical concurrent calls share one result
+
+    flight = SingleFlight()
+    answer = flight.do(key, lambda: expensive_call(...), group="explain_concept")
+
+The first caller for a key (the leader) runs the function; callers arriving
+with the same key while it runs (followers) block until it finishes and get
+its result or exception. Nothing is kept after the leader returns, so this is
+de-duplication of in-flight work, not a cache.
+"""
+import threading
+from collections import defaultdict
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.stats = defaultdict(lambda: {"issued": 0, "coalesced": 0})
+
+    def do(self, key, fn, group="default"):
+        """Run fn() once per in-flight key and return its result to every caller"""
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = _Call()
+                self.stats[group]["issued"] += 1
+            else:
+                self.stats[group]["coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.done.set()
+
+    @property
+    def in_flight(self):
+        with self.lock:
+            return len(self.calls)
+
+    def snapshot(self):
+        """Issued vs. coalesced calls per group, plus totals"""
+        with self.lock:
+            groups = {group: dict(counts) for group, counts in self.stats.items()}
+        issued = sum(counts["issued"] for counts in groups.values())
+        coalesced = sum(counts["coalesced"] for counts in groups.values())
+        return {
+            "issued": issued,
+            "coalesced": coalesced,
+            "coalesced_ratio": coalesced / (issued + coalesced) if issued + coalesced else 0.0,
+            "groups": groups
+        }
@@ -0,0 +1,93 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+SAMPLE = {'en': "Good morning! How are you today?", 'gu': "સુપ્રભાત! આજે તમે કેમ છો?"}
+
+MODES = {
+    "eager fp32": dict(quantize=False, preload=True),
+    "lazy fp32": dict(quantize=False, preload=False),
+    "lazy int8": dict(quantize=True, preload=False),
+}
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def run_child(quantize, preload, source_lang, target_lang):
+    """Measure one mode in this (fresh) process and print the numbers as JSON"""
+    start = time.perf_counter()
+    from model_loader import ModelLoader
+    from translator_engine import Translator
+    from translation_memory import TranslationMemory
+
+    loader = ModelLoader(quantize=quantize, max_resident=2)
+    if preload:
+        loader.preload()
+    startup = time.perf_counter() - start
+
+    # A throwaway memory so the translation really runs the model
+    translator = Translator(memory=TranslationMemory(":memory:"), loader=loader)
+    start = time.perf_counter()
+    result = translator.translate_text(SAMPLE[source_lang], source_lang, target_lang)
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    translator._run_model([SAMPLE[source_lang]], source_lang, target_lang)
+    warm = time.perf_counter() - start
+
+    print(json.dumps({
+        "startup": startup, "first": first, "warm": warm, "rss_mb": peak_rss_mb(),
+        "resident": loader.resident_models(), "ok": result['success'],
+        "output": result.get('translated_text', result.get('error'))
+    }))
+
+
+def run_mode(params, source_lang, target_lang):
+    command = [sys.executable, os.path.abspath(__file__), '--child',
+               '--source', source_lang, '--target', target_lang]
+    if params['quantize']:
+        command.append('--quantize')
+    if params['preload']:
+        command.append('--preload')
+    output = subprocess.run(command, capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare startup, first-translation latency and RSS of model loading modes")
+    parser.add_argument('--source', default='en')
+    parser.add_argument('--target', default='gu')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--quantize', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--preload', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.quantize, args.preload, args.source, args.target)
+        return
+
+    # Each mode runs in its own process so RSS and load times do not leak between them.
+    # The int8 mode runs twice: the first run converts and caches, the second loads the cache.
+    runs = list(MODES.items())
+    runs.append(("lazy int8 (cached)", MODES["lazy int8"]))
+
+    print(f"Translating {args.source} → {args.target}\n")
+    print(f"{'mode':>20} | {'startup':>8} | {'1st translation':>15} | {'warm':>7} | {'peak RSS':>9}")
+    for name, params in runs:
+        stats = run_mode(params, args.source, args.target)
+        print(f"{name:>20} | {stats['startup']:>7.2f}s | {stats['first']:>14.2f}s | "
+              f"{stats['warm']:>6.2f}s | {stats['rss_mb']:>6.0f} MB")
+        print(f"{'':>20}   → {stats['output']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+import torch
+from dynamic_batcher import DynamicBatcher
+from translator_engine import translator
+
+WORDS = ("the student opened the book and read about history science and the city market "
+         "where farmers sell fresh vegetables every morning before school starts").split()
+
+
+def make_sentences(n, seed=0):
+    """English sentences of 3-30 words, like short UI strings mixed with longer messages"""
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 30))).capitalize() + "."
+            for _ in range(n)]
+
+
+def measure_batch_size(sentences, batch_size, source_lang, target_lang):
+    """Sentences/sec running the model directly (no translation memory)"""
+    start = time.perf_counter()
+    translator._run_model(sentences, source_lang, target_lang, batch_size=batch_size)
+    return len(sentences) / (time.perf_counter() - start)
+
+
+def measure_batcher(sentences, concurrency, max_batch_size, source_lang, target_lang):
+    """Sentences/sec and average batch size when concurrent callers go through the DynamicBatcher"""
+    batcher = DynamicBatcher(lambda texts, src, tgt: translator._run_model(texts, src, tgt, max_batch_size),
+                             max_batch_size=max_batch_size)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(lambda s: batcher.translate(s, source_lang, target_lang), sentences))
+    rate = len(sentences) / (time.perf_counter() - start)
+    stats = batcher.stats()
+    batcher.close()
+    return rate, stats['avg_batch_size']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark translation throughput by batch size on CPU")
+    parser.add_argument('--sentences', type=int, default=256)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32, 64])
+    parser.add_argument('--concurrency', type=int, default=32, help="Concurrent callers for the batcher run")
+    parser.add_argument('--source', default='en')
+    parser.add_argument('--target', default='gu')
+    parser.add_argument('--threads', type=int, default=None, help="torch CPU threads (default: torch's choice)")
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    sentences = make_sentences(args.sentences)
+    # Warm up so model loading and first-call allocation are not timed
+    translator._run_model(sentences[:4], args.source, args.target)
+
+    print(f"{args.sentences} sentences, {args.source} → {args.target}, {torch.get_num_threads()} CPU threads")
+    print(f"{'batch size':>10} | {'sentences/sec':>13} | {'speed-up':>8}")
+    baseline = None
+    for batch_size in args.batch_sizes:
+        rate = measure_batch_size(sentences, batch_size, args.source, args.target)
+        baseline = baseline or rate
+        print(f"{batch_size:>10} | {rate:>13.1f} | {rate / baseline:>7.1f}x")
+
+    rate, avg_batch = measure_batcher(sentences, args.concurrency, max(args.batch_sizes),
+                                      args.source, args.target)
+    print(f"\nDynamic batcher, {args.concurrency} concurrent callers: "
+          f"{rate:.1f} sentences/sec (avg batch {avg_batch:.1f})")
+
+
+if __name__ == "__main__":
+    main()
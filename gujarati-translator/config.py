@@ -0,0 +1,50 @@
+import os
+
+# Web Interface Configuration
+HOST = os.getenv("TRANSLATOR_HOST", "127.0.0.1")
+PORT = int(os.getenv("TRANSLATOR_PORT", "5000"))
+DEBUG = os.getenv("TRANSLATOR_DEBUG", "false").lower() == "true"
+
+# Translation Model Configuration
+# Each entry lists the language pairs it can translate; the first listed model
+# supporting a pair is used for it
+AVAILABLE_MODELS = [
+    {
+        "name": "NLLB-200 Distilled (600M)",
+        "model_name": "facebook/nllb-200-distilled-600M",
+        "lang_codes": {"en": "eng_Latn", "gu": "guj_Gujr"},
+    },
+    {
+        "name": "M2M-100 (418M)",
+        "model_name": "facebook/m2m100_418M",
+        "lang_codes": {"en": "en", "gu": "gu"},
+    },
+]
+MAX_NEW_TOKENS = 256
+# Models are loaded on first use; at most this many stay in memory (LRU)
+MAX_RESIDENT_MODELS = int(os.getenv("TRANSLATOR_MAX_MODELS", "1"))
+# int8 dynamic quantization for CPU; converted weights are cached on disk
+QUANTIZE_MODELS = os.getenv("TRANSLATOR_QUANTIZE", "false").lower() == "true"
+QUANTIZED_MODEL_DIR = "quantized_models"
+BATCH_SIZE = 16  # Sentences per model call
+MAX_INPUT_TOKENS = 200  # Longer sentences are split before translation (keeps output under MAX_NEW_TOKENS)
+
+# Dynamic Batching Configuration (web interface)
+BATCHER_MAX_BATCH_SIZE = 32
+BATCHER_MAX_WAIT_MS = 20  # How long a request may wait for others to share its batch
+MAX_QUEUE_DEPTH = 256  # Queued translations before new requests get 503 (backpressure)
+MAX_TEXT_CHARS = 5000  # Longest text accepted per web request (or per /translate_batch item)
+MAX_BATCH_TEXTS = 64  # Most texts accepted by one /translate_batch request
+
+# Production Serving Configuration (serve.py)
+SERVER_THREADS = 8
+REQUEST_TIMEOUT = 60  # Seconds a synchronous /translate waits for its result
+MAX_JOBS = 10000  # Finished /translate_async results kept for polling
+
+# Document Translation Configuration
+DOCUMENT_CHUNK_SENTENCES = 64  # Sentences read and translated per chunk
+DOCUMENT_WORKERS = 2
+
+# Translation Memory Configuration
+TRANSLATION_MEMORY_PATH = "translation_memory.db"
+TRANSLATION_MEMORY_SIZE = 10000  # Entries kept in the in-memory LRU tier
@@ -0,0 +1,209 @@
+import argparse
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from config import DOCUMENT_CHUNK_SENTENCES, DOCUMENT_WORKERS, MAX_INPUT_TOKENS
+from translation_memory import segment_sentences, join_sentences
+
+_CLAUSE_SPLIT = re.compile(r'(?<=[,;:])\s+')
+
+
+def split_long_sentence(sentence, token_counts, max_tokens):
+    """
+    Break a sentence into pieces of at most max_tokens
+
+    Splits at clause punctuation first, then packs words greedily. token_counts
+    is f(list of texts) -> list of token counts.
+    """
+    pieces = []
+    for clause in _CLAUSE_SPLIT.split(sentence):
+        if token_counts([clause])[0] <= max_tokens:
+            pieces.append(clause)
+            continue
+        words = clause.split()
+        counts = token_counts(words)
+        current, current_tokens = [], 0
+        for word, count in zip(words, counts):
+            if current and current_tokens + count > max_tokens:
+                pieces.append(' '.join(current))
+                current, current_tokens = [], 0
+            current.append(word)
+            current_tokens += count
+        if current:
+            pieces.append(' '.join(current))
+
+    # Re-merge neighbouring short clauses so the model sees as much context as fits
+    merged = [pieces[0]]
+    for piece in pieces[1:]:
+        candidate = f"{merged[-1]} {piece}"
+        if token_counts([candidate])[0] <= max_tokens:
+            merged[-1] = candidate
+        else:
+            merged.append(piece)
+    return merged
+
+
+class DocumentTranslator:
+    """
+    Translates text files of any size with bounded memory
+
+    The input is read line by line into chunks of about chunk_sentences
+    sentences, always ending at a line break so paragraphs stay intact. Chunks
+    are translated by a worker pool (each chunk is one batched translate_batch
+    call) with at most 2 * workers chunks in flight, and written to the output
+    in order as soon as they are done. A sentence or chunk that fails to
+    translate is written untranslated and reported in the returned stats
+    instead of aborting the document.
+    """
+
+    def __init__(self, translator, chunk_sentences=DOCUMENT_CHUNK_SENTENCES,
+                 workers=DOCUMENT_WORKERS, max_input_tokens=MAX_INPUT_TOKENS):
+        """
+        Args:
+            translator (Translator): Translator whose translate_batch() does the work
+            chunk_sentences (int): Sentences per chunk handed to a worker
+            workers (int): Chunks translated in parallel
+            max_input_tokens (int): Longer sentences are split before translation
+        """
+        self.translator = translator
+        self.chunk_sentences = chunk_sentences
+        self.workers = workers
+        self.max_input_tokens = max_input_tokens
+
+    def _read_chunks(self, file):
+        """Yield (text, bytes_read) chunks ending on a line boundary"""
+        lines, sentence_count, bytes_read = [], 0, 0
+        for line in file:
+            lines.append(line)
+            bytes_read += len(line.encode('utf-8'))
+            sentence_count += len(segment_sentences(line)[0])
+            # Prefer to cut at a paragraph break; force a cut at twice the target size
+            at_paragraph_end = not line.strip()
+            if (sentence_count >= self.chunk_sentences and at_paragraph_end) or \
+                    sentence_count >= 2 * self.chunk_sentences:
+                yield ''.join(lines), bytes_read
+                lines, sentence_count = [], 0
+        if lines:
+            yield ''.join(lines), bytes_read
+
+    def translate_chunk(self, text, source_lang, target_lang):
+        """
+        Translate one chunk, keeping its line and paragraph layout
+
+        Returns:
+            tuple: (translated_text, errors) where errors lists the pieces that
+                   failed and were left untranslated
+        """
+        sentences, separators = segment_sentences(text)
+        token_counts = lambda texts: self.translator.count_tokens(texts, source_lang, target_lang)
+
+        counts = token_counts(sentences) if sentences else []
+        pieces, owners = [], []
+        for i, (sentence, tokens) in enumerate(zip(sentences, counts)):
+            split = [sentence] if tokens <= self.max_input_tokens else \
+                split_long_sentence(sentence, token_counts, self.max_input_tokens)
+            pieces.extend(split)
+            owners.extend([i] * len(split))
+
+        # Whitespace-only pieces pass through untouched; the rest go to the model
+        to_translate = [j for j, piece in enumerate(pieces) if piece.strip()]
+        outputs = list(pieces)
+        errors = []
+        # Document chunks almost never repeat whole, so only sentences are remembered
+        results = self.translator.translate_batch([pieces[j] for j in to_translate], source_lang, target_lang,
+                                                  store_whole=False)
+        for j, result in zip(to_translate, results):
+            if result['success']:
+                outputs[j] = result['translated_text']
+            else:
+                errors.append(f"{pieces[j][:60]!r}: {result['error']}")
+
+        translated = [[] for _ in sentences]
+        for owner, output in zip(owners, outputs):
+            translated[owner].append(output)
+        return join_sentences([' '.join(parts) for parts in translated], separators), errors
+
+    def translate_file(self, input_path, output_path, source_lang, target_lang, progress=True):
+        """
+        Stream-translate input_path into output_path
+
+        Returns:
+            dict: Bytes read, chunks, elapsed seconds, failed_chunks (written
+                  untranslated), failed_pieces and the first few errors
+        """
+        total_bytes = os.path.getsize(input_path) or 1
+        start = time.perf_counter()
+        in_flight = deque()
+        chunks = failed_chunks = failed_pieces = 0
+        errors = []
+
+        def write_finished(wait_for_oldest):
+            """Write completed chunks in order, optionally waiting for the oldest one"""
+            nonlocal chunks, failed_chunks, failed_pieces
+            if wait_for_oldest and in_flight:
+                in_flight[0][0].exception()
+            while in_flight and in_flight[0][0].done():
+                future, text, bytes_read = in_flight.popleft()
+                try:
+                    translated, chunk_errors = future.result()
+                except Exception as e:
+                    translated, chunk_errors = text, [f"chunk {chunks + 1}: {e}"]
+                    failed_chunks += 1
+                else:
+                    failed_pieces += len(chunk_errors)
+                errors.extend(chunk_errors[:max(0, 5 - len(errors))])
+                output.write(translated)
+                output.flush()
+                chunks += 1
+                if progress:
+                    elapsed = time.perf_counter() - start
+                    print(f"\r📄 {bytes_read / total_bytes:6.1%} translated "
+                          f"({bytes_read / 1024:.0f} KB in {elapsed:.0f}s)", end='', flush=True)
+
+        with open(input_path, 'r', encoding='utf-8') as source, \
+                open(output_path, 'w', encoding='utf-8') as output, \
+                ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for text, bytes_read in self._read_chunks(source):
+                in_flight.append((executor.submit(self.translate_chunk, text, source_lang, target_lang),
+                                  text, bytes_read))
+                # Bound memory: wait for the oldest chunk once the pipeline is full
+                write_finished(wait_for_oldest=len(in_flight) >= 2 * self.workers)
+            while in_flight:
+                write_finished(wait_for_oldest=True)
+
+        if progress:
+            print()
+        return {'bytes': total_bytes, 'chunks': chunks, 'seconds': time.perf_counter() - start,
+                'failed_chunks': failed_chunks, 'failed_pieces': failed_pieces, 'errors': errors}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Translate a text document between English and Gujarati")
+    parser.add_argument('input', help="UTF-8 text file to translate")
+    parser.add_argument('output', help="Where to write the translation")
+    parser.add_argument('--source', default='en')
+    parser.add_argument('--target', default='gu')
+    parser.add_argument('--workers', type=int, default=DOCUMENT_WORKERS)
+    parser.add_argument('--chunk-sentences', type=int, default=DOCUMENT_CHUNK_SENTENCES)
+    args = parser.parse_args()
+
+    from translator_engine import translator
+    document_translator = DocumentTranslator(translator, args.chunk_sentences, args.workers)
+    try:
+        stats = document_translator.translate_file(args.input, args.output, args.source, args.target)
+    except (OSError, RuntimeError) as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
+    print(f"✅ Translated {stats['bytes'] / 1024:.0f} KB in {stats['chunks']} chunks "
+          f"({stats['seconds']:.1f}s) → {args.output}")
+    if stats['failed_chunks'] or stats['failed_pieces']:
+        print(f"⚠️  Left untranslated: {stats['failed_chunks']} chunks, {stats['failed_pieces']} sentences")
+        for error in stats['errors']:
+            print(f"   {error}")
+
+
+if __name__ == "__main__":
+    main()
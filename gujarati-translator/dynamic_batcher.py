@@ -0,0 +1,136 @@
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+
+class QueueFullError(RuntimeError):
+    """Raised by submit() when max_queue_depth requests are already waiting"""
+
+
+class DynamicBatcher:
+    """
+    Groups concurrent translation requests into batched model calls
+
+    Requests are queued by (source_lang, target_lang, length bucket), where the
+    bucket is log2 of the word count, so a batch only holds texts of similar
+    length and padding stays small. A single worker thread picks the group
+    whose oldest request has waited longest, gives it up to max_wait_ms to
+    fill (or stops as soon as max_batch_size is reached), and runs it through
+    translate_batch_fn. Each caller gets a Future with its own result.
+    """
+
+    def __init__(self, translate_batch_fn, max_batch_size=32, max_wait_ms=20, max_queue_depth=None):
+        """
+        Args:
+            translate_batch_fn (callable): f(texts, source_lang, target_lang) -> list of results
+            max_batch_size (int): Most requests sent to the model together
+            max_wait_ms (float): Longest a request waits for others to join its batch
+            max_queue_depth (int): Waiting requests allowed before submit() rejects new
+                ones with QueueFullError (None for unbounded)
+        """
+        self.translate_batch_fn = translate_batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_queue_depth = max_queue_depth
+        self.depth = 0
+        self.groups = {}  # (source_lang, target_lang, bucket) -> deque of (enqueued_at, text, future)
+        self.condition = threading.Condition()
+        self.stats_counts = {'requests': 0, 'rejected': 0, 'batches': 0, 'batched_requests': 0}
+        self.closed = False
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    @staticmethod
+    def length_bucket(text):
+        return int(math.log2(len(text.split()) + 1))
+
+    def submit(self, text, source_lang, target_lang):
+        """Queue a translation; returns a Future resolving to the result dict"""
+        return self.submit_many([text], source_lang, target_lang)[0]
+
+    def submit_many(self, texts, source_lang, target_lang):
+        """
+        Queue several translations at once; returns one Future per text
+
+        Either all texts are queued or, if they would push the queue past
+        max_queue_depth, none are and QueueFullError is raised.
+        """
+        futures = [Future() for _ in texts]
+        keys = [(source_lang, target_lang, self.length_bucket(text)) for text in texts]
+        with self.condition:
+            if self.closed:
+                raise RuntimeError("Batcher is closed")
+            if self.max_queue_depth is not None and self.depth + len(texts) > self.max_queue_depth:
+                self.stats_counts['rejected'] += 1
+                raise QueueFullError(f"{self.depth} translations already queued")
+            now = time.monotonic()
+            for key, text, future in zip(keys, texts, futures):
+                self.groups.setdefault(key, deque()).append((now, text, future))
+            self.depth += len(texts)
+            self.stats_counts['requests'] += len(texts)
+            self.condition.notify()
+        return futures
+
+    def translate(self, text, source_lang, target_lang, timeout=None):
+        """Blocking helper: submit and wait for the result"""
+        return self.submit(text, source_lang, target_lang).result(timeout)
+
+    def _next_batch(self):
+        """Wait for work and pop the next batch (None once closed and drained)"""
+        with self.condition:
+            while not self.groups:
+                if self.closed:
+                    return None
+                self.condition.wait()
+
+            # Serve the group whose oldest request has been waiting longest
+            key = min(self.groups, key=lambda k: self.groups[k][0][0])
+            deadline = self.groups[key][0][0] + self.max_wait
+            while (len(self.groups[key]) < self.max_batch_size and not self.closed
+                   and time.monotonic() < deadline):
+                self.condition.wait(deadline - time.monotonic())
+
+            queue = self.groups[key]
+            batch = [queue.popleft() for _ in range(min(self.max_batch_size, len(queue)))]
+            if not queue:
+                del self.groups[key]
+            self.depth -= len(batch)
+            self.stats_counts['batches'] += 1
+            self.stats_counts['batched_requests'] += len(batch)
+            return key, batch
+
+    def _run(self):
+        while True:
+            item = self._next_batch()
+            if item is None:
+                return
+            (source_lang, target_lang, _), batch = item
+            try:
+                results = self.translate_batch_fn([text for _, text, _ in batch], source_lang, target_lang)
+                for (_, _, future), result in zip(batch, results):
+                    future.set_result(result)
+            except Exception as e:
+                for _, _, future in batch:
+                    future.set_exception(e)
+
+    @property
+    def queue_depth(self):
+        """Requests waiting for a batch"""
+        return self.depth
+
+    def stats(self):
+        """Requests, batches and average batch size since startup"""
+        with self.condition:
+            stats = dict(self.stats_counts)
+        stats['avg_batch_size'] = stats['batched_requests'] / stats['batches'] if stats['batches'] else 0.0
+        stats['queue_depth'] = self.queue_depth
+        return stats
+
+    def close(self):
+        """Finish queued requests and stop the worker"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.worker.join()
@@ -0,0 +1,117 @@
+"""
+Load test for the translator server (serve.py)
+
+Drives concurrent clients against /translate (or /translate_async with
+polling), reports latency percentiles, throughput and rejected requests, and
+prints the server's queue and batching gauges from /metrics.
+
+Run with:  python load_test.py --url http://127.0.0.1:5000 --clients 32 --requests 20
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+PHRASES = [
+    "Good morning!", "How are you?", "Thank you very much.", "Where is the railway station?",
+    "Please close the door.", "The meeting starts at ten o'clock tomorrow.",
+    "I would like to order a cup of tea and some snacks.",
+    "Our school organises a science exhibition every winter, and students from nearby villages visit it.",
+]
+
+
+def post(url, payload, timeout=120):
+    request = urllib.request.Request(url, data=json.dumps(payload).encode('utf-8'),
+                                     headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, None
+
+
+def get(url, timeout=30):
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status, response.read().decode('utf-8')
+    except urllib.error.HTTPError as e:
+        return e.code, None
+
+
+def make_text(rng, unique_ratio):
+    """Mostly repeated phrases, with some unique text that misses the translation memory"""
+    text = rng.choice(PHRASES)
+    if rng.random() < unique_ratio:
+        text = f"{text} Reference number {rng.randint(0, 10 ** 9)}."
+    return text
+
+
+def run_client(base_url, n_requests, use_async, unique_ratio, seed):
+    rng = random.Random(seed)
+    latencies, statuses = [], Counter()
+    for _ in range(n_requests):
+        payload = {'text': make_text(rng, unique_ratio), 'source_lang': 'en', 'target_lang': 'gu'}
+        start = time.perf_counter()
+        if use_async:
+            status, body = post(f"{base_url}/translate_async", payload)
+            if status == 202:
+                # Poll until the job finishes (jobs answer 202 while pending)
+                while status == 202:
+                    time.sleep(0.02)
+                    status, _ = get(f"{base_url}{body['status_url']}")
+        else:
+            status, _ = post(f"{base_url}/translate", payload)
+        statuses[status] += 1
+        if status == 200:
+            latencies.append(time.perf_counter() - start)
+    return latencies, statuses
+
+
+def percentile(values, pct):
+    return sorted(values)[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the translator server")
+    parser.add_argument('--url', default="http://127.0.0.1:5000")
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=20, help="Requests per client")
+    parser.add_argument('--async', dest='use_async', action='store_true', help="Use /translate_async and poll")
+    parser.add_argument('--unique-ratio', type=float, default=0.5,
+                        help="Fraction of requests with text the translation memory has not seen")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.clients) as executor:
+        runs = list(executor.map(
+            lambda seed: run_client(args.url, args.requests, args.use_async, args.unique_ratio, seed),
+            range(args.clients)
+        ))
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for run, _ in runs for latency in run]
+    statuses = sum((counts for _, counts in runs), Counter())
+    print(f"{args.clients} clients x {args.requests} requests "
+          f"({'async' if args.use_async else 'sync'}) in {elapsed:.1f}s")
+    print(f"Status codes: {dict(statuses)}")
+    if latencies:
+        print(f"Throughput: {len(latencies) / elapsed:.1f} translations/sec")
+        print(f"Latency p50 {statistics.median(latencies) * 1000:.0f} ms   "
+              f"p95 {percentile(latencies, 95) * 1000:.0f} ms   "
+              f"p99 {percentile(latencies, 99) * 1000:.0f} ms")
+
+    status, text = get(f"{args.url}/metrics")
+    if status == 200:
+        print("\nServer gauges:")
+        for line in text.splitlines():
+            if line.startswith("translator_") and not line.startswith("translator_request_seconds"):
+                print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
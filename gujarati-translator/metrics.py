@@ -0,0 +1,73 @@
+import threading
+from collections import defaultdict
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.sum += value
+        self.count += 1
+
+    def lines(self, name, labels):
+        cumulative = 0
+        for bound, count in zip([*map(str, self.buckets), '+Inf'], self.counts):
+            cumulative += count
+            yield f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}'
+        yield f'{name}_sum{{{labels}}} {self.sum:.6f}'
+        yield f'{name}_count{{{labels}}} {self.count}'
+
+
+class Metrics:
+    """
+    Thread-safe request metrics rendered in the Prometheus text format
+
+    Request latency histograms and response counters are kept per endpoint;
+    gauges are callables read at scrape time (queue depth, resident models, ...).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latency = defaultdict(Histogram)  # endpoint -> Histogram
+        self.responses = defaultdict(int)  # (endpoint, status) -> count
+        self.gauges = {}  # name -> (help, callable)
+
+    def observe_request(self, endpoint, status, seconds):
+        with self.lock:
+            self.latency[endpoint].observe(seconds)
+            self.responses[(endpoint, status)] += 1
+
+    def gauge(self, name, help_text, fn):
+        """Register a value read on every scrape"""
+        self.gauges[name] = (help_text, fn)
+
+    def render(self):
+        lines = [
+            "# HELP translator_request_seconds Request latency by endpoint",
+            "# TYPE translator_request_seconds histogram",
+        ]
+        with self.lock:
+            for endpoint, histogram in sorted(self.latency.items()):
+                lines.extend(histogram.lines("translator_request_seconds", f'endpoint="{endpoint}"'))
+            lines += ["# HELP translator_responses_total Responses by endpoint and status",
+                      "# TYPE translator_responses_total counter"]
+            for (endpoint, status), count in sorted(self.responses.items()):
+                lines.append(f'translator_responses_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+
+        for name, (help_text, fn) in self.gauges.items():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {fn()}"]
+        return "\n".join(lines) + "\n"
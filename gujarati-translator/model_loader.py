@@ -0,0 +1,113 @@
+import gc
+import os
+import threading
+import time
+from collections import OrderedDict
+import torch
+from transformers import AutoConfig, AutoModelForSeq2SeqLM, AutoTokenizer
+from config import AVAILABLE_MODELS, MAX_RESIDENT_MODELS, QUANTIZE_MODELS, QUANTIZED_MODEL_DIR
+
+
+class ModelLoader:
+    """
+    Loads translation models on first use
+
+    A language pair is resolved to the first configured model that supports
+    it, and that model is loaded the first time the pair is translated. Models
+    are shared between pairs (NLLB serves en→gu and gu→en with one copy) and
+    at most max_resident stay in memory; the least recently used is dropped.
+    With quantize=True the Linear layers are converted to int8 dynamic
+    quantization for CPU inference, and the converted weights are cached on
+    disk so later starts skip the conversion.
+    """
+
+    def __init__(self, max_resident=MAX_RESIDENT_MODELS, quantize=QUANTIZE_MODELS,
+                 cache_dir=QUANTIZED_MODEL_DIR):
+        """
+        Args:
+            max_resident (int): Most models kept loaded at once
+            quantize (bool): Use int8 dynamic-quantized models on CPU
+            cache_dir (str): Where quantized weights are stored after conversion
+        """
+        self.max_resident = max_resident
+        self.quantize = quantize
+        self.cache_dir = cache_dir
+        self.models = OrderedDict()  # model_name -> (model, tokenizer)
+        self.load_times = {}  # model_name -> seconds spent loading
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def model_for_pair(source_lang, target_lang):
+        """First configured model that knows both languages"""
+        for info in AVAILABLE_MODELS:
+            if source_lang in info['lang_codes'] and target_lang in info['lang_codes']:
+                return info
+        raise ValueError(f"No model available for {source_lang} → {target_lang}")
+
+    def get_available_models(self):
+        """Models listed in config, with whether each is currently loaded"""
+        with self.lock:
+            return [{**info, 'loaded': info['model_name'] in self.models} for info in AVAILABLE_MODELS]
+
+    def _quantized_path(self, model_name):
+        return os.path.join(self.cache_dir, model_name.replace('/', '--'), 'model_int8.pt')
+
+    def _load_quantized(self, model_name):
+        """int8 model from the disk cache, converting and caching it on first use"""
+        path = self._quantized_path(model_name)
+        if os.path.exists(path):
+            # Build the quantized architecture without loading fp32 weights, then fill it in
+            model = AutoModelForSeq2SeqLM.from_config(AutoConfig.from_pretrained(model_name))
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            model.load_state_dict(torch.load(path, weights_only=False))
+            return model
+
+        print(f"⚙️  Quantizing {model_name} to int8 (first run only)...")
+        model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        torch.save(model.state_dict(), tmp_path)
+        os.replace(tmp_path, path)
+        return model
+
+    def _load(self, info):
+        start = time.perf_counter()
+        print(f"⏳ Loading {info['name']}{' (int8)' if self.quantize else ''}...")
+        tokenizer = AutoTokenizer.from_pretrained(info['model_name'])
+        if self.quantize:
+            model = self._load_quantized(info['model_name'])
+        else:
+            model = AutoModelForSeq2SeqLM.from_pretrained(info['model_name'])
+        model.eval()
+        self.load_times[info['model_name']] = time.perf_counter() - start
+        return model, tokenizer
+
+    def get_model(self, source_lang, target_lang):
+        """Model, tokenizer and model info for a language pair, loading the model if needed"""
+        info = self.model_for_pair(source_lang, target_lang)
+        name = info['model_name']
+        with self.lock:
+            if name not in self.models:
+                # Free the least recently used models before loading another one
+                while self.models and len(self.models) >= self.max_resident:
+                    evicted, _ = self.models.popitem(last=False)
+                    print(f"♻️  Unloaded {evicted}")
+                    gc.collect()
+                self.models[name] = self._load(info)
+            self.models.move_to_end(name)
+            model, tokenizer = self.models[name]
+        return model, tokenizer, info
+
+    def preload(self, pairs=(('en', 'gu'), ('gu', 'en'))):
+        """Load the models for these pairs now instead of on first translation"""
+        for source_lang, target_lang in pairs:
+            self.get_model(source_lang, target_lang)
+
+    def resident_models(self):
+        """Names of the models currently in memory, least recently used first"""
+        with self.lock:
+            return list(self.models)
+
+
+model_loader = ModelLoader()
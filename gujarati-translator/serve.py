@@ -0,0 +1,57 @@
+"""
+Production server for the translator web interface
+
+Loads the translation models once, before the first request, and serves the
+Flask app from a single process with a pool of worker threads, so every
+thread shares the same models, translation memory and dynamic batcher.
+
+Run with:  python serve.py [--threads 8] [--port 5000]
+Or with gunicorn (one process, threads share the models):
+           gunicorn -w 1 --threads 8 -b 0.0.0.0:5000 "serve:create_app()"
+"""
+import argparse
+import time
+from config import HOST, PORT, SERVER_THREADS
+from model_loader import model_loader
+
+
+def preload(pairs=(('en', 'gu'), ('gu', 'en'))):
+    """Load models for the served language pairs and run one warm-up translation"""
+    from translator_engine import translator
+    start = time.perf_counter()
+    model_loader.preload(pairs)
+    for source_lang, target_lang in pairs:
+        translator._run_model(["Hello"], source_lang, target_lang)
+    print(f"✅ Models ready in {time.perf_counter() - start:.1f}s: {', '.join(model_loader.resident_models())}")
+
+
+def create_app():
+    """Preload the models, then import the app so no request ever waits for a model load"""
+    preload()
+    from web_interface import app
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the translator with a production WSGI server")
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--threads', type=int, default=SERVER_THREADS)
+    args = parser.parse_args()
+
+    try:
+        from waitress import serve
+    except ImportError:
+        print("❌ waitress is not installed: pip install waitress")
+        return
+
+    application = create_app()
+    print(f"🌐 Serving on http://{args.host}:{args.port} with {args.threads} threads "
+          f"(metrics at /metrics)")
+    # Bound waitress' own backlog too; the batcher queue handles the rest with 503s
+    serve(application, host=args.host, port=args.port, threads=args.threads,
+          connection_limit=args.threads * 32, backlog=1024)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+
+# Sentence ends: Latin punctuation and the Devanagari/Gujarati danda
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?।॥])(\s+)|(\n+)')
+
+
+def normalize_text(text):
+    """
+    Canonical form used as the memory key: NFC, single spaces, trimmed
+
+    Line breaks are kept (one per original break, blank lines included), so a
+    whole-text hit only matches input with the same line and paragraph
+    layout as the stored translation.
+    """
+    text = unicodedata.normalize('NFC', text).replace('\r\n', '\n').replace('\r', '\n')
+    lines = [re.sub(r'\s+', ' ', line).strip() for line in text.split('\n')]
+    return '\n'.join(lines).strip('\n ')
+
+
+def segment_sentences(text):
+    """
+    Split text into sentences and the whitespace between them
+
+    Returns (sentences, separators) with len(separators) == len(sentences) + 1,
+    so join_sentences() rebuilds the original layout (including newlines and
+    paragraph breaks) around translated sentences.
+    """
+    sentences, separators = [], []
+    pending = text[:len(text) - len(text.lstrip())]
+    position = len(pending)
+    for match in _SENTENCE_SPLIT.finditer(text, position):
+        sentence = text[position:match.start()]
+        if sentence.strip():
+            separators.append(pending)
+            sentences.append(sentence)
+            pending = match.group(0)
+        else:
+            pending += sentence + match.group(0)
+        position = match.end()
+    tail = text[position:]
+    if tail.strip():
+        separators.append(pending)
+        sentences.append(tail.rstrip())
+        pending = tail[len(tail.rstrip()):]
+    else:
+        pending += tail
+    separators.append(pending)
+    return sentences, separators
+
+
+def join_sentences(sentences, separators):
+    """Inverse of segment_sentences()"""
+    parts = [separators[0]]
+    for sentence, separator in zip(sentences, separators[1:]):
+        parts.append(sentence)
+        parts.append(separator)
+    return ''.join(parts)
+
+
+class TranslationMemory:
+    """
+    Persistent exact-match translation memory
+
+    Entries are keyed by (source_lang, target_lang, normalized text). Lookups
+    go to an in-memory LRU first and then to a SQLite table on disk; disk hits
+    are promoted into the LRU. Safe to share between threads.
+    """
+
+    def __init__(self, path="translation_memory.db", max_memory_entries=10000):
+        """
+        Args:
+            path (str): SQLite file holding every stored translation
+            max_memory_entries (int): Entries kept in the in-memory LRU tier
+        """
+        self.max_memory_entries = max_memory_entries
+        self.memory = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats_counts = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0}
+
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "source_lang TEXT, target_lang TEXT, source_text TEXT, translated_text TEXT, "
+            "PRIMARY KEY (source_lang, target_lang, source_text))"
+        )
+        self.db.commit()
+
+    def _remember(self, key, translation):
+        """Insert into the LRU tier (call with lock held)"""
+        self.memory[key] = translation
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_memory_entries:
+            self.memory.popitem(last=False)
+
+    def get_many(self, texts, source_lang, target_lang):
+        """Translations for each text (None where the memory has no entry)"""
+        keys = [(source_lang, target_lang, normalize_text(text)) for text in texts]
+        results = [None] * len(keys)
+        missing = []
+        with self.lock:
+            for i, key in enumerate(keys):
+                if key in self.memory:
+                    self.memory.move_to_end(key)
+                    results[i] = self.memory[key]
+                    self.stats_counts['memory_hits'] += 1
+                else:
+                    missing.append(i)
+
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                wanted = {keys[i][2] for i in chunk}
+                rows = self.db.execute(
+                    "SELECT source_text, translated_text FROM translations "
+                    f"WHERE source_lang = ? AND target_lang = ? AND source_text IN ({','.join('?' * len(wanted))})",
+                    (source_lang, target_lang, *wanted)
+                ).fetchall()
+                found = dict(rows)
+                for i in chunk:
+                    translation = found.get(keys[i][2])
+                    if translation is None:
+                        self.stats_counts['misses'] += 1
+                        continue
+                    results[i] = translation
+                    self.stats_counts['disk_hits'] += 1
+                    self._remember(keys[i], translation)
+        return results
+
+    def get(self, text, source_lang, target_lang):
+        return self.get_many([text], source_lang, target_lang)[0]
+
+    def put_many(self, pairs, source_lang, target_lang):
+        """Store (source_text, translated_text) pairs in both tiers"""
+        rows = [(source_lang, target_lang, normalize_text(source), translated)
+                for source, translated in pairs]
+        with self.lock:
+            for row in rows:
+                self._remember(row[:3], row[3])
+            self.db.executemany("INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?)", rows)
+            self.db.commit()
+            self.stats_counts['stores'] += len(rows)
+
+    def put(self, text, translated_text, source_lang, target_lang):
+        self.put_many([(text, translated_text)], source_lang, target_lang)
+
+    def stats(self):
+        """Hit counts and hit rate since startup, plus the size of each tier"""
+        with self.lock:
+            stats = dict(self.stats_counts)
+            stats['memory_entries'] = len(self.memory)
+            stats['disk_entries'] = self.db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['lookups'] = lookups
+        stats['hit_rate'] = (stats['memory_hits'] + stats['disk_hits']) / lookups if lookups else 0.0
+        return stats
+
+    def close(self):
+        with self.lock:
+            self.db.close()
@@ -1,4 +1,4 @@
-from translator import translator
+from translator_engine import translator
 from model_loader import model_loader
 import os
 
@@ -21,21 +21,24 @@ def main():
     print("\n🎯 Usage Options:")
     print("  1. Command Line Interface (CLI)")
     print("  2. Web Interface")
-    print("  3. Exit")
+    print("  3. Translate a Document")
+    print("  4. Exit")
     
     while True:
         try:
-            choice = input("\nSelect option (1-3): ").strip()
+            choice = input("\nSelect option (1-4): ").strip()
             
             if choice == '1':
                 cli_interface()
             elif choice == '2':
                 web_interface()
             elif choice == '3':
+                document_interface()
+            elif choice == '4':
                 print("Goodbye! 👋")
                 break
             else:
-                print("Please select 1, 2, or 3")
+                print("Please select 1, 2, 3, or 4")
                 
         except KeyboardInterrupt:
             print("\n\nGoodbye! 👋")
@@ -74,14 +77,40 @@ def cli_interface():
             print(f"\n✅ Translated Text:")
             print(f"   {result['translated_text']}")
             print(f"\n   📝 From {result['source_lang']} to {result['target_lang']}")
+            if result['cached_sentences']:
+                print(f"   💾 {result['cached_sentences']}/{result['total_sentences']} sentences from translation memory")
         else:
             print(f"\n❌ Error: {result['error']}")
 
+def document_interface():
+    """Translate a whole text file, streaming it in chunks"""
+    from document_translator import DocumentTranslator
+    
+    print("\n📄 Document Translator")
+    input_path = input("Text file to translate: ").strip()
+    if not os.path.isfile(input_path):
+        print(f"❌ File not found: {input_path}")
+        return
+    
+    direction = input("Direction - 1. English → Gujarati  2. Gujarati → English (1/2): ").strip()
+    source_lang, target_lang = ('gu', 'en') if direction == '2' else ('en', 'gu')
+    root, ext = os.path.splitext(input_path)
+    output_path = input(f"Output file [{root}.{target_lang}{ext}]: ").strip() or f"{root}.{target_lang}{ext}"
+    
+    try:
+        stats = DocumentTranslator(translator).translate_file(input_path, output_path, source_lang, target_lang)
+        print(f"✅ Translated {stats['bytes'] / 1024:.0f} KB in {stats['seconds']:.1f}s → {output_path}")
+        if stats['failed_chunks'] or stats['failed_pieces']:
+            print(f"⚠️  Left untranslated: {stats['failed_chunks']} chunks, {stats['failed_pieces']} sentences")
+    except (OSError, RuntimeError) as e:
+        print(f"\n❌ Error: {e}")
+
 def web_interface():
     """Start web interface"""
     print("\n🌐 Starting Web Interface...")
     print("   The translator will open in your web browser")
     print("   Press Ctrl+C to stop the server")
+    print("   (Development server - for production use: python serve.py)")
     
     try:
         # Import and run the web interface
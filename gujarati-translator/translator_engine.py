@@ -0,0 +1,168 @@
+import threading
+import torch
+from config import BATCH_SIZE, MAX_NEW_TOKENS, TRANSLATION_MEMORY_PATH, TRANSLATION_MEMORY_SIZE
+from model_loader import model_loader
+from translation_memory import TranslationMemory, segment_sentences, join_sentences
+
+
+class Translator:
+    SUPPORTED_LANGUAGES = {'en': 'English', 'gu': 'Gujarati'}
+
+    def __init__(self, memory=None, loader=None):
+        """
+        Args:
+            memory (TranslationMemory): Translation memory to reuse past translations
+                from (defaults to the on-disk memory from config)
+            loader (ModelLoader): Source of models (defaults to the shared model_loader)
+        """
+        self.memory = memory or TranslationMemory(TRANSLATION_MEMORY_PATH, TRANSLATION_MEMORY_SIZE)
+        self.loader = loader or model_loader
+        # Tokenizers carry the source language as state; guard it when called from several threads
+        self.tokenizer_lock = threading.Lock()
+
+    def get_supported_languages(self):
+        """Language codes and display names"""
+        return self.SUPPORTED_LANGUAGES
+
+    def _run_model(self, sentences, source_lang, target_lang, batch_size=BATCH_SIZE):
+        """
+        Translate sentences with the model for this language pair
+
+        Sentences are sorted by length so each padded batch holds similar
+        lengths, translated batch_size at a time, and returned in input order.
+        """
+        model, tokenizer, info = self.loader.get_model(source_lang, target_lang)
+        target_code = info['lang_codes'][target_lang]
+        if hasattr(tokenizer, 'get_lang_id'):
+            # M2M-100 codes ("gu") are not tokens themselves; its language token is "__gu__"
+            target_id = tokenizer.get_lang_id(target_code)
+        else:
+            target_id = tokenizer.convert_tokens_to_ids(target_code)
+
+        order = sorted(range(len(sentences)), key=lambda i: len(sentences[i]))
+        translations = [None] * len(sentences)
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            with self.tokenizer_lock:
+                tokenizer.src_lang = info['lang_codes'][source_lang]
+                inputs = tokenizer([sentences[i] for i in batch], return_tensors="pt",
+                                   padding=True, truncation=True)
+            with torch.inference_mode():
+                output = model.generate(**inputs, forced_bos_token_id=target_id,
+                                        max_new_tokens=MAX_NEW_TOKENS)
+            for i, decoded in zip(batch, tokenizer.batch_decode(output, skip_special_tokens=True)):
+                translations[i] = decoded
+        return translations
+
+    def count_tokens(self, texts, source_lang, target_lang):
+        """Model input tokens of each text (loads the pair's model tokenizer)"""
+        _, tokenizer, _ = self.loader.get_model(source_lang, target_lang)
+        with self.tokenizer_lock:
+            return [len(ids) for ids in tokenizer(texts, add_special_tokens=False)['input_ids']]
+
+    def _check_request(self, text, source_lang, target_lang):
+        """Error message for an invalid request, or None"""
+        languages = self.SUPPORTED_LANGUAGES
+        if source_lang not in languages or target_lang not in languages:
+            return f"Unsupported language pair: {source_lang} → {target_lang}"
+        if not isinstance(text, str):
+            return "Text must be a string"
+        if not text.strip():
+            return "Please enter some text to translate"
+        return None
+
+    def translate_batch(self, texts, source_lang, target_lang, batch_size=BATCH_SIZE, store_whole=True):
+        """
+        Translate many texts with one pass of batched model calls
+
+        Every text is looked up in the translation memory, then split into
+        sentences; sentences the memory does not know are de-duplicated across
+        all texts and translated together in length-sorted batches.
+        store_whole=False stores only the sentences, for callers such as
+        document translation whose texts will rarely repeat as a whole.
+
+        Returns:
+            list: One result dict per text, as returned by translate_text()
+        """
+        results = [None] * len(texts)
+        pending = []
+        for i, text in enumerate(texts):
+            error = self._check_request(text, source_lang, target_lang)
+            if error:
+                results[i] = {'success': False, 'error': error}
+            elif source_lang == target_lang:
+                results[i] = {'success': True, 'translated_text': text,
+                              'cached_sentences': 0, 'total_sentences': 0}
+            else:
+                pending.append(i)
+        if not pending:
+            return self._with_names(results, source_lang, target_lang)
+
+        try:
+            wholes = self.memory.get_many([texts[i] for i in pending], source_lang, target_lang)
+            segmented = {}
+            for i, whole in zip(pending, wholes):
+                if whole is not None:
+                    sentences, separators = segment_sentences(texts[i])
+                    # Layout inside the text matches the key; keep the caller's outer whitespace
+                    whole = separators[0] + whole.strip() + separators[-1]
+                    total = len(sentences)
+                    results[i] = {'success': True, 'translated_text': whole,
+                                  'cached_sentences': total, 'total_sentences': total}
+                else:
+                    segmented[i] = segment_sentences(texts[i])
+
+            all_sentences = [sentence for sentences, _ in segmented.values() for sentence in sentences]
+            remembered = dict(zip(all_sentences,
+                                  self.memory.get_many(all_sentences, source_lang, target_lang)))
+            new_sentences = [s for s, t in remembered.items() if t is None]
+            if new_sentences:
+                translated = self._run_model(new_sentences, source_lang, target_lang, batch_size)
+                self.memory.put_many(zip(new_sentences, translated), source_lang, target_lang)
+                remembered.update(zip(new_sentences, translated))
+
+            new_set = set(new_sentences)
+            whole_entries = []
+            for i, (sentences, separators) in segmented.items():
+                translated_text = join_sentences([remembered[s] for s in sentences], separators)
+                cached = sum(s not in new_set for s in sentences)
+                results[i] = {'success': True, 'translated_text': translated_text,
+                              'cached_sentences': cached, 'total_sentences': len(sentences)}
+                if store_whole and len(sentences) > 1:
+                    whole_entries.append((texts[i], translated_text))
+            if whole_entries:
+                self.memory.put_many(whole_entries, source_lang, target_lang)
+
+        except Exception as e:
+            for i in pending:
+                if results[i] is None:
+                    results[i] = {'success': False, 'error': f"Translation failed: {e}"}
+        return self._with_names(results, source_lang, target_lang)
+
+    def _with_names(self, results, source_lang, target_lang):
+        """Add language display names to successful results"""
+        for result in results:
+            if result['success']:
+                result['source_lang'] = self.SUPPORTED_LANGUAGES[source_lang]
+                result['target_lang'] = self.SUPPORTED_LANGUAGES[target_lang]
+        return results
+
+    def translate_text(self, text, source_lang, target_lang):
+        """
+        Translate text, reusing the translation memory wherever possible
+
+        The whole text is looked up first; on a miss it is split into sentences,
+        remembered sentences are reused and only new ones go through the model.
+
+        Returns:
+            dict: success, translated_text, source_lang/target_lang (display names),
+                  cached_sentences/total_sentences, or error
+        """
+        return self.translate_batch([text], source_lang, target_lang)[0]
+
+    def memory_stats(self):
+        """Translation memory hit counts and hit rate"""
+        return self.memory.stats()
+
+
+translator = Translator()
@@ -0,0 +1,254 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from flask import Flask, Response, g, jsonify, render_template_string, request
+from config import (HOST, PORT, DEBUG, BATCHER_MAX_BATCH_SIZE, BATCHER_MAX_WAIT_MS,
+                    MAX_QUEUE_DEPTH, MAX_TEXT_CHARS, MAX_BATCH_TEXTS, REQUEST_TIMEOUT, MAX_JOBS)
+from dynamic_batcher import DynamicBatcher, QueueFullError
+from metrics import Metrics
+from model_loader import model_loader
+from translator_engine import translator
+
+app = Flask(__name__)
+app.config.update(HOST=HOST, PORT=PORT, DEBUG=DEBUG)
+
+# Concurrent requests are grouped into batched model calls; beyond MAX_QUEUE_DEPTH
+# waiting translations new requests are turned away with 503
+batcher = DynamicBatcher(translator.translate_batch, BATCHER_MAX_BATCH_SIZE, BATCHER_MAX_WAIT_MS,
+                         MAX_QUEUE_DEPTH)
+
+# Results of /translate_async jobs, oldest first
+jobs = OrderedDict()
+jobs_lock = threading.Lock()
+
+metrics = Metrics()
+metrics.gauge("translator_queue_depth", "Translations waiting for a batch", lambda: batcher.queue_depth)
+metrics.gauge("translator_queue_rejected", "Requests rejected because the queue was full",
+              lambda: batcher.stats()['rejected'])
+metrics.gauge("translator_avg_batch_size", "Average requests per model batch",
+              lambda: f"{batcher.stats()['avg_batch_size']:.3f}")
+metrics.gauge("translator_memory_hit_rate", "Translation memory hit rate",
+              lambda: f"{translator.memory_stats()['hit_rate']:.4f}")
+metrics.gauge("translator_resident_models", "Models loaded in memory", lambda: len(model_loader.resident_models()))
+
+
+def pending_jobs():
+    with jobs_lock:
+        return sum(not future.done() for future in jobs.values())
+
+
+metrics.gauge("translator_pending_jobs", "Async jobs not finished yet", pending_jobs)
+
+PAGE = """
+<!doctype html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>Gujarati ↔ English Translator</title>
+  <style>
+    body { font-family: sans-serif; max-width: 800px; margin: 40px auto; }
+    textarea { width: 100%; height: 140px; font-size: 16px; }
+    .stats { color: #666; font-size: 14px; margin-top: 24px; }
+  </style>
+</head>
+<body>
+  <h1>🌍 Gujarati ↔ English Translator</h1>
+  <select id="source">{% for code, name in languages.items() %}<option value="{{ code }}">{{ name }}</option>{% endfor %}</select>
+  →
+  <select id="target">{% for code, name in languages.items() %}<option value="{{ code }}" {% if code == 'gu' %}selected{% endif %}>{{ name }}</option>{% endfor %}</select>
+  <p><textarea id="text" placeholder="Enter text to translate"></textarea></p>
+  <button onclick="doTranslate()">Translate</button>
+  <p><textarea id="output" readonly></textarea></p>
+  <div class="stats" id="stats"></div>
+  <script>
+    async function doTranslate() {
+      const response = await fetch('/translate', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({
+          text: document.getElementById('text').value,
+          source_lang: document.getElementById('source').value,
+          target_lang: document.getElementById('target').value
+        })
+      });
+      const result = await response.json();
+      document.getElementById('output').value = result.success ? result.translated_text : '❌ ' + result.error;
+      loadStats();
+    }
+    async function loadStats() {
+      const stats = await (await fetch('/stats')).json();
+      document.getElementById('stats').textContent =
+        `Translation memory: ${(stats.hit_rate * 100).toFixed(1)}% hit rate ` +
+        `(${stats.memory_hits} memory + ${stats.disk_hits} disk hits, ${stats.misses} misses), ` +
+        `${stats.disk_entries} stored translations`;
+    }
+    loadStats();
+  </script>
+</body>
+</html>
+"""
+
+
+@app.before_request
+def start_timer():
+    g.start_time = time.perf_counter()
+
+
+@app.after_request
+def record_request(response):
+    if request.endpoint != 'prometheus_metrics':
+        metrics.observe_request(request.endpoint or 'unknown', response.status_code,
+                                time.perf_counter() - g.start_time)
+    return response
+
+
+def queue_full_response(error):
+    response = jsonify({'success': False, 'error': f"Server busy: {error}. Please retry shortly."})
+    response.status_code = 503
+    response.headers['Retry-After'] = '1'
+    return response
+
+
+def bad_request(error):
+    return jsonify({'success': False, 'error': error}), 400
+
+
+def check_text(text):
+    """Error message for a text the web API will not accept, or None"""
+    if not isinstance(text, str):
+        return "'text' must be a string"
+    if not text.strip():
+        return "Please enter some text to translate"
+    if len(text) > MAX_TEXT_CHARS:
+        return f"Text is longer than {MAX_TEXT_CHARS} characters"
+    return None
+
+
+def read_languages(payload):
+    """(source_lang, target_lang, error) from a request payload"""
+    source_lang = payload.get('source_lang', 'en')
+    target_lang = payload.get('target_lang', 'gu')
+    if not isinstance(source_lang, str) or not isinstance(target_lang, str):
+        return source_lang, target_lang, "'source_lang' and 'target_lang' must be strings"
+    languages = translator.get_supported_languages()
+    if source_lang not in languages or target_lang not in languages:
+        return source_lang, target_lang, f"Unsupported language pair: {source_lang} → {target_lang}"
+    return source_lang, target_lang, None
+
+
+@app.route('/')
+def index():
+    return render_template_string(PAGE, languages=translator.get_supported_languages())
+
+
+@app.route('/translate', methods=['POST'])
+def translate():
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return bad_request("Expected a JSON object")
+    text = payload.get('text', '')
+    source_lang, target_lang, error = read_languages(payload)
+    error = error or check_text(text)
+    if error:
+        return bad_request(error)
+    try:
+        result = batcher.translate(text, source_lang, target_lang, timeout=REQUEST_TIMEOUT)
+    except QueueFullError as e:
+        return queue_full_response(e)
+    except FutureTimeoutError:
+        return jsonify({'success': False, 'error': "Translation timed out"}), 504
+    # Input was validated above, so a failed result is a model error
+    return jsonify(result), 200 if result['success'] else 500
+
+
+@app.route('/translate_async', methods=['POST'])
+def translate_async():
+    """Queue a translation and return a job id to poll at /jobs/<id> (202 Accepted)"""
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return bad_request("Expected a JSON object")
+    text = payload.get('text', '')
+    source_lang, target_lang, error = read_languages(payload)
+    error = error or check_text(text)
+    if error:
+        return bad_request(error)
+    try:
+        future = batcher.submit(text, source_lang, target_lang)
+    except QueueFullError as e:
+        return queue_full_response(e)
+
+    job_id = uuid.uuid4().hex
+    with jobs_lock:
+        jobs[job_id] = future
+        while len(jobs) > MAX_JOBS:
+            jobs.popitem(last=False)
+    return jsonify({'job_id': job_id, 'status_url': f"/jobs/{job_id}"}), 202
+
+
+@app.route('/jobs/<job_id>')
+def job_status(job_id):
+    with jobs_lock:
+        future = jobs.get(job_id)
+    if future is None:
+        return jsonify({'status': 'unknown', 'error': "No such job (it may have expired)"}), 404
+    if not future.done():
+        return jsonify({'status': 'pending', 'queue_depth': batcher.queue_depth}), 202
+    try:
+        return jsonify({'status': 'done', 'result': future.result()})
+    except Exception as e:
+        return jsonify({'status': 'failed', 'error': str(e)}), 500
+
+
+@app.route('/translate_batch', methods=['POST'])
+def translate_batch():
+    """
+    Translate a list of texts in one call: {"texts": [...], "source_lang": ..., "target_lang": ...}
+
+    Items go through the dynamic batcher like any other request, so they
+    share model batches with concurrent traffic and count against the queue
+    depth; a batch that does not fit in the queue is rejected whole with 503.
+    """
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return bad_request("Expected a JSON object")
+    texts = payload.get('texts')
+    if not isinstance(texts, list):
+        return bad_request("'texts' must be a list")
+    if len(texts) > MAX_BATCH_TEXTS:
+        return bad_request(f"At most {MAX_BATCH_TEXTS} texts per request")
+    source_lang, target_lang, error = read_languages(payload)
+    if error:
+        return bad_request(error)
+    for i, text in enumerate(texts):
+        error = check_text(text)
+        if error:
+            return bad_request(f"texts[{i}]: {error}")
+
+    try:
+        futures = batcher.submit_many(texts, source_lang, target_lang)
+    except QueueFullError as e:
+        return queue_full_response(e)
+    deadline = time.monotonic() + REQUEST_TIMEOUT
+    try:
+        results = [future.result(max(0.0, deadline - time.monotonic())) for future in futures]
+    except FutureTimeoutError:
+        return jsonify({'success': False, 'error': "Translation timed out"}), 504
+    return jsonify({'results': results})
+
+
+@app.route('/stats')
+def stats():
+    """Translation memory hit-rate statistics and dynamic batching stats"""
+    return jsonify({**translator.memory_stats(), 'batcher': batcher.stats()})
+
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """Latency histograms, queue depth and cache/batching gauges in Prometheus format"""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+
+if __name__ == '__main__':
+    app.run(host=HOST, port=PORT, debug=DEBUG)
@@ -0,0 +1,74 @@
+import json
+import sqlite3
+import threading
+import time
+
+CACHE_PATH = "analysis_cache.db"
+MAX_DISTANCE = 2  # Hamming distance (of 64 bits) still treated as the same photo
+ASPECT_TOLERANCE = 0.02  # Relative aspect-ratio difference still treated as the same photo
+
+
+def hamming(a, b):
+    return bin(a ^ b).count('1')
+
+
+class AnalysisCache:
+    """
+    Vision analysis results keyed by perceptual hash, persisted in SQLite
+
+    A lookup returns the result of the closest stored hash within
+    max_distance bits whose image also has the same aspect ratio, so the
+    same photo uploaded again, re-compressed or resized is answered without
+    another vision call, while a different dish that merely looks similar
+    at 9x8 pixels is not. Hashes are kept in memory for the scan; results
+    are read from disk only on a hit.
+    """
+
+    def __init__(self, path=CACHE_PATH, max_distance=MAX_DISTANCE, aspect_tolerance=ASPECT_TOLERANCE):
+        self.max_distance = max_distance
+        self.aspect_tolerance = aspect_tolerance
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS image_analysis "
+            "(phash TEXT PRIMARY KEY, result TEXT, created REAL, aspect REAL)"
+        )
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(image_analysis)")]
+        if 'aspect' not in columns:
+            # Rows cached before aspect ratios were stored never match again
+            self.conn.execute("ALTER TABLE image_analysis ADD COLUMN aspect REAL")
+        self.conn.commit()
+        self.hashes = {int(phash, 16): aspect for phash, aspect
+                       in self.conn.execute("SELECT phash, aspect FROM image_analysis")}
+
+    def _same_shape(self, stored_aspect, aspect):
+        return stored_aspect is not None and abs(stored_aspect - aspect) <= self.aspect_tolerance * aspect
+
+    def get(self, phash, aspect):
+        """Cached result for this or a near-identical image (same aspect ratio), or None"""
+        with self.lock:
+            best, best_distance = None, self.max_distance + 1
+            for stored, stored_aspect in self.hashes.items():
+                distance = hamming(stored, phash)
+                if distance < best_distance and self._same_shape(stored_aspect, aspect):
+                    best, best_distance = stored, distance
+                    if distance == 0:
+                        break
+            if best is None:
+                return None
+            row = self.conn.execute(
+                "SELECT result FROM image_analysis WHERE phash = ?", (f"{best:016x}",)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, phash, aspect, result):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO image_analysis (phash, result, created, aspect) VALUES (?, ?, ?, ?)",
+                (f"{phash:016x}", json.dumps(result), time.time(), aspect)
+            )
+            self.conn.commit()
+            self.hashes[phash] = aspect
+
+    def __len__(self):
+        return len(self.hashes)
@@ -0,0 +1,93 @@
+import base64
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PIL import Image
+from image_preprocessor import preprocess_image, perceptual_hash, aspect_ratio, MAX_EDGE, BYTE_BUDGET
+
+NUTRIENTS = ('protein', 'carbs', 'fat', 'fiber')
+
+
+def _is_error(result):
+    return not isinstance(result, dict) or 'error' in result
+
+
+def analyze_with_retries(analyze_fn, img_str, retries=3, backoff=1.0):
+    """Call the vision model, retrying failures with exponential backoff and jitter"""
+    for attempt in range(retries + 1):
+        try:
+            result = analyze_fn(img_str)
+            if not _is_error(result) or attempt == retries:
+                return result
+        except Exception:
+            if attempt == retries:
+                raise
+        time.sleep(random.uniform(0, backoff * 2 ** attempt))
+
+
+def _analyze_one(file, analyze_fn, cache, max_edge, byte_budget, retries):
+    """Preprocess one upload, answer from the cache if possible, else call the vision model"""
+    start = time.perf_counter()
+    image = Image.open(file)
+    phash, aspect = perceptual_hash(image), aspect_ratio(image)
+    if cache is not None:
+        cached = cache.get(phash, aspect)
+        if cached is not None:
+            return cached, {'cached': True, 'seconds': time.perf_counter() - start}
+
+    jpeg_bytes, info = preprocess_image(image, max_edge, byte_budget)
+    result = analyze_with_retries(analyze_fn, base64.b64encode(jpeg_bytes).decode(), retries)
+    if cache is not None and not _is_error(result):
+        cache.put(phash, aspect, result)
+    return result, {**info, 'cached': False, 'seconds': time.perf_counter() - start}
+
+
+def analyze_images(files, analyze_fn, cache=None, max_edge=MAX_EDGE, byte_budget=BYTE_BUDGET,
+                   max_concurrent=4, retries=3):
+    """
+    Analyze many food photos concurrently
+
+    Each worker decodes, hashes and preprocesses its image and then calls the
+    vision model, so preprocessing overlaps with other images' API calls; at
+    most max_concurrent calls are in flight. Results are yielded as soon as
+    each image finishes, not in upload order.
+
+    Yields:
+        tuple: (index, result, info) where result is the analysis dict (or
+               {'error': ...}) and info describes preprocessing and timing
+    """
+    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+        futures = {
+            executor.submit(_analyze_one, file, analyze_fn, cache, max_edge, byte_budget, retries): index
+            for index, file in enumerate(files)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                result, info = future.result()
+            except Exception as e:
+                result, info = {'error': str(e)}, {'cached': False}
+            yield index, result, info
+
+
+def to_number(value):
+    """Numeric part of values like 250, "250", "12g" or "about 30 kcal" (0 if none)"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.search(r'\d+(?:\.\d+)?', str(value or ''))
+    return float(match.group()) if match else 0.0
+
+
+def daily_totals(results):
+    """Sum calories and nutrition over successful results"""
+    totals = {'meals': 0, 'calories': 0.0, **{nutrient: 0.0 for nutrient in NUTRIENTS}}
+    for result in results:
+        if _is_error(result):
+            continue
+        totals['meals'] += 1
+        totals['calories'] += to_number(result.get('calories'))
+        nutrition = result.get('nutrition') or {}
+        for nutrient in NUTRIENTS:
+            totals[nutrient] += to_number(nutrition.get(nutrient))
+    return totals
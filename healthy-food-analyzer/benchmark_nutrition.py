@@ -0,0 +1,69 @@
+import argparse
+import statistics
+import time
+from nutrition_db import NutritionDB
+
+SAMPLE_DESCRIPTIONS = [
+    "one banana", "2 rotis with dal", "a bowl of poha", "3 idlis and sambar", "masala dosa",
+    "2 boiled eggs and 2 slices of brown bread", "200g rice with rajma", "a glass of milk",
+    "cup of chai", "1/2 cup curd", "two samosas", "paneer butter masala with 2 naan",
+    "apple", "handful of almonds", "dhokla", "thepla with curd", "chole with 2 puris",
+    "vada pav", "a plate of pav bhaji", "bowl of khichdi and kadhi", "grilled chicken with salad",
+    "3 gulab jamun", "pizza slice", "burger and fries", "oats with milk", "upma",
+    "aloo paratha with butter", "half mango", "1 bowl dal makhani + jeera rice", "chicken biryani",
+    # Foods the table does not know: these should fall through to the LLM
+    "sushi platter", "quinoa buddha bowl with tahini", "a big slice of tiramisu",
+    "pad thai with tofu", "greek moussaka", "acai bowl",
+]
+
+# Dishes that share words with a table entry but are different foods: a local
+# answer for any of these is wrong nutrition, so they must go to the LLM
+NEGATIVE_CASES = [
+    "rice cake", "mutton biryani", "chocolate cake with rice", "egg fried rice", "paneer tikka pizza",
+    "banana bread", "prawn curry", "fish biryani",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark local nutrition lookup coverage and latency")
+    parser.add_argument('--repeat', type=int, default=1000, help="Timed lookups per description")
+    parser.add_argument('--verbose', action='store_true', help="Print every parsed result")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    db = NutritionDB()
+    load_ms = (time.perf_counter() - start) * 1000
+
+    answered, latencies = 0, []
+    for description in SAMPLE_DESCRIPTIONS:
+        result = db.lookup(description)
+        answered += result is not None
+        if args.verbose:
+            summary = (f"{result['food_name']}: {result['calories']} kcal (confidence {result['confidence']})"
+                       if result else "→ LLM")
+            print(f"  {description:45s} {summary}")
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            db.lookup(description)
+        latencies.append((time.perf_counter() - start) / args.repeat * 1e6)
+
+    false_matches = []
+    for description in NEGATIVE_CASES:
+        result = db.lookup(description)
+        if result is not None:
+            false_matches.append(f"{description} → {result['food_name']}")
+        if args.verbose:
+            print(f"  {description:45s} {result['food_name'] if result else '→ LLM'}  (negative case)")
+
+    print(f"Food table: {len(db.foods)} foods, loaded in {load_ms:.1f} ms")
+    print(f"Coverage: {answered}/{len(SAMPLE_DESCRIPTIONS)} descriptions answered locally "
+          f"({answered / len(SAMPLE_DESCRIPTIONS):.0%}), the rest go to the LLM")
+    print(f"Lookup latency: median {statistics.median(latencies):.1f} µs, "
+          f"max {max(latencies):.1f} µs (vs. ~1 s or more for an LLM round trip)")
+    print(f"False matches: {len(false_matches)}/{len(NEGATIVE_CASES)} look-alike dishes answered locally"
+          + "".join(f"\n  {match}" for match in false_matches))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import io
+from PIL import Image, ImageOps
+
+MAX_EDGE = 1024  # Longest side sent to the vision model, in pixels
+BYTE_BUDGET = 300 * 1024  # Target JPEG size
+MIN_QUALITY = 40
+MAX_QUALITY = 90
+
+
+def to_rgb(image):
+    """RGB copy of any PIL image; transparent areas become white instead of black"""
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        rgba = image.convert('RGBA')
+        background = Image.new('RGB', rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel('A'))
+        return background
+    return image.convert('RGB') if image.mode != 'RGB' else image
+
+
+def preprocess_image(image, max_edge=MAX_EDGE, byte_budget=BYTE_BUDGET,
+                     min_quality=MIN_QUALITY, max_quality=MAX_QUALITY):
+    """
+    Prepare a photo for the vision model
+
+    Applies the EXIF orientation, converts to RGB, downscales so the longest
+    edge is at most max_edge and encodes a JPEG without EXIF/GPS metadata,
+    picking the highest quality that fits byte_budget (binary search).
+
+    Args:
+        image (PIL.Image.Image): Decoded upload
+        max_edge (int): Longest side in pixels after downscaling
+        byte_budget (int): Target size of the encoded JPEG
+        min_quality (int): Lowest JPEG quality tried; used even if it exceeds the budget
+        max_quality (int): Highest JPEG quality tried
+
+    Returns:
+        tuple: (jpeg_bytes, info) where info holds original/final size, quality and bytes
+    """
+    original_size = image.size
+    image = to_rgb(ImageOps.exif_transpose(image))
+    if max(image.size) > max_edge:
+        image = image.copy()
+        image.thumbnail((max_edge, max_edge), Image.LANCZOS)
+
+    def encode(quality):
+        buffered = io.BytesIO()
+        # No exif= argument, so no metadata is written
+        image.save(buffered, format="JPEG", quality=quality, optimize=True, progressive=True)
+        return buffered.getvalue()
+
+    best = encode(min_quality)
+    best_quality = min_quality
+    low, high = min_quality + 1, max_quality
+    while low <= high:
+        quality = (low + high) // 2
+        data = encode(quality)
+        if len(data) <= byte_budget:
+            best, best_quality = data, quality
+            low = quality + 1
+        else:
+            high = quality - 1
+
+    return best, {
+        'original_size': original_size,
+        'size': image.size,
+        'quality': best_quality,
+        'bytes': len(best),
+    }
+
+
+def aspect_ratio(image):
+    """Width / height as displayed, i.e. after the EXIF orientation is applied"""
+    width, height = image.size
+    if image.getexif().get(0x0112) in (5, 6, 7, 8):  # Rotated by 90 or 270 degrees
+        width, height = height, width
+    return width / height
+
+
+def perceptual_hash(image, hash_size=8):
+    """
+    64-bit difference hash (dHash) of an image
+
+    Near-identical photos (re-encoded, resized, slightly recompressed) get
+    hashes that differ in only a few bits.
+    """
+    gray = ImageOps.exif_transpose(image).convert('L').resize((hash_size + 1, hash_size), Image.LANCZOS)
+    pixels = list(gray.getdata())
+    value = 0
+    for row in range(hash_size):
+        for col in range(hash_size):
+            left = pixels[row * (hash_size + 1) + col]
+            right = pixels[row * (hash_size + 1) + col + 1]
+            value = (value << 1) | (left > right)
+    return value
@@ -1,16 +1,39 @@
 import streamlit as st
 import base64
 from PIL import Image
-import io
 import os
 from dotenv import load_dotenv
 from vision_analyzer import analyze_food_image
-from speech_processor import text_to_speech, speech_to_text
+from speech_processor import speech_to_text
 from calorie_calculator import estimate_calories
+from image_preprocessor import preprocess_image, perceptual_hash, aspect_ratio, MAX_EDGE, BYTE_BUDGET
+from analysis_cache import AnalysisCache
+from nutrition_db import NutritionDB, estimate_with_fallback
+from batch_analyzer import analyze_images, daily_totals
+from tts_cache import TTSCache
 
 # Load environment variables
 load_dotenv()
 
+@st.cache_resource
+def get_analysis_cache():
+    """Analysis results by perceptual hash, shared by all sessions"""
+    return AnalysisCache()
+
+@st.cache_resource
+def get_nutrition_db():
+    """Local food table for instant answers to common descriptions"""
+    return NutritionDB()
+
+@st.cache_resource
+def get_tts_cache():
+    """Synthesized audio by sentence, shared by all sessions"""
+    return TTSCache(lang='en', tld='com', slow=False)
+
+def analyze_description(food_description):
+    """Calories for a food description: local table when confident, otherwise the LLM"""
+    return estimate_with_fallback(food_description, get_nutrition_db(), estimate_calories)
+
 def main():
     st.set_page_config(
         page_title="Healthy Food Image Analyzer",
@@ -30,13 +53,22 @@ def main():
     # Sidebar for navigation
     st.sidebar.title("Navigation")
     app_mode = st.sidebar.radio("Choose Input Method:", 
-                               ["Image Upload", "Voice Description"])
+                               ["Image Upload", "Batch Upload", "Voice Description"])
     
     if app_mode == "Image Upload":
         image_analysis()
+    elif app_mode == "Batch Upload":
+        batch_analysis()
     else:
         voice_analysis()
 
+def image_settings():
+    """Upload settings: smaller images upload and analyze faster"""
+    with st.sidebar.expander("Image Settings"):
+        max_edge = st.slider("Max image edge (px)", 512, 2048, MAX_EDGE, step=128)
+        byte_budget_kb = st.slider("Target upload size (KB)", 100, 1000, BYTE_BUDGET // 1024, step=50)
+    return max_edge, byte_budget_kb * 1024
+
 def image_analysis():
     st.header("📸 Image Analysis")
     
@@ -46,6 +78,8 @@ def image_analysis():
         type=['jpg', 'jpeg', 'png']
     )
     
+    max_edge, byte_budget = image_settings()
+    
     if uploaded_file is not None:
         # Display image
         image = Image.open(uploaded_file)
@@ -55,14 +89,29 @@ def image_analysis():
         if st.button("Analyze Food Image"):
             with st.spinner("Analyzing your food image..."):
                 try:
-                    # Convert image to base64
-                    buffered = io.BytesIO()
-                    image.save(buffered, format="JPEG")
-                    img_str = base64.b64encode(buffered.getvalue()).decode()
+                    # Same or near-identical photo analyzed before?
+                    cache = get_analysis_cache()
+                    phash, aspect = perceptual_hash(image), aspect_ratio(image)
+                    cached_result = cache.get(phash, aspect)
                     
-                    # Analyze image
-                    analysis_result = analyze_food_image(img_str)
-                    st.session_state.result = analysis_result
+                    if cached_result is not None:
+                        st.session_state.result = cached_result
+                        st.success("⚡ This photo was analyzed before - showing the saved result")
+                    else:
+                        # Downscale, strip EXIF and compress to the byte budget before upload
+                        jpeg_bytes, info = preprocess_image(image, max_edge, byte_budget)
+                        img_str = base64.b64encode(jpeg_bytes).decode()
+                        st.caption(
+                            f"Sent {info['size'][0]}×{info['size'][1]} JPEG (quality {info['quality']}, "
+                            f"{info['bytes'] / 1024:.0f} KB) from a {info['original_size'][0]}×"
+                            f"{info['original_size'][1]} original"
+                        )
+                        
+                        # Analyze image
+                        analysis_result = analyze_food_image(img_str)
+                        st.session_state.result = analysis_result
+                        if isinstance(analysis_result, dict) and 'error' not in analysis_result:
+                            cache.put(phash, aspect, analysis_result)
                     
                 except Exception as e:
                     st.error(f"Error analyzing image: {str(e)}")
@@ -71,6 +120,72 @@ def image_analysis():
     if st.session_state.result:
         display_results(st.session_state.result)
 
+def batch_analysis():
+    st.header("🗂️ Batch Analysis")
+    st.markdown("Upload a whole day's meals and get every analysis plus daily totals.")
+    
+    max_edge, byte_budget = image_settings()
+    max_concurrent = st.sidebar.slider("Parallel analyses", 1, 8, 4)
+    
+    if 'batch_results' not in st.session_state:
+        st.session_state.batch_results = []
+    
+    uploaded_files = st.file_uploader(
+        "Choose food images...",
+        type=['jpg', 'jpeg', 'png'],
+        accept_multiple_files=True
+    )
+    
+    if uploaded_files and st.button(f"Analyze {len(uploaded_files)} Images"):
+        progress = st.progress(0.0)
+        status = st.empty()
+        results = [None] * len(uploaded_files)
+        done = 0
+        
+        # Results arrive as each image finishes; show them immediately
+        for index, result, info in analyze_images(uploaded_files, analyze_food_image, get_analysis_cache(),
+                                                  max_edge, byte_budget, max_concurrent):
+            results[index] = result
+            done += 1
+            progress.progress(done / len(uploaded_files))
+            status.write(f"Analyzed {done}/{len(uploaded_files)}: {uploaded_files[index].name}"
+                         f"{' (cached)' if info.get('cached') else ''}")
+            show_batch_item(uploaded_files[index], result)
+        
+        st.session_state.batch_results = [
+            (file.name, result) for file, result in zip(uploaded_files, results)
+        ]
+        status.write(f"✅ Analyzed {len(uploaded_files)} images")
+    
+    if st.session_state.batch_results:
+        display_daily_totals([result for _, result in st.session_state.batch_results])
+
+def show_batch_item(file, result):
+    """One row per analyzed image: thumbnail and key numbers"""
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        st.image(file, use_column_width=True)
+    with col2:
+        if 'error' in result:
+            st.error(f"{file.name}: {result['error']}")
+        else:
+            nutrition = result.get('nutrition', {})
+            st.write(f"**{result.get('food_name', 'Unknown')}** - {result.get('calories', 0)} calories")
+            st.caption(f"Protein {nutrition.get('protein', '0')}g · Carbs {nutrition.get('carbs', '0')}g · "
+                       f"Fat {nutrition.get('fat', '0')}g · Fiber {nutrition.get('fiber', '0')}g · "
+                       f"Health score {result.get('health_score', 0)}/100")
+
+def display_daily_totals(results):
+    totals = daily_totals(results)
+    st.header("📅 Daily Totals")
+    st.caption(f"From {totals['meals']} successfully analyzed images")
+    cols = st.columns(5)
+    cols[0].metric("Calories", f"{totals['calories']:.0f}")
+    cols[1].metric("Protein", f"{totals['protein']:.1f}g")
+    cols[2].metric("Carbs", f"{totals['carbs']:.1f}g")
+    cols[3].metric("Fat", f"{totals['fat']:.1f}g")
+    cols[4].metric("Fiber", f"{totals['fiber']:.1f}g")
+
 def voice_analysis():
     st.header("🎤 Voice Analysis")
     
@@ -89,7 +204,7 @@ def voice_analysis():
                         
                         # Analyze description
                         with st.spinner("Analyzing your description..."):
-                            analysis_result = estimate_calories(food_description)
+                            analysis_result = analyze_description(food_description)
                             st.session_state.result = analysis_result
                     else:
                         st.warning("No speech detected. Please try again.")
@@ -102,7 +217,7 @@ def voice_analysis():
         food_text = st.text_input("Or type food description:")
         if st.button("Analyze Text") and food_text:
             with st.spinner("Analyzing..."):
-                analysis_result = estimate_calories(food_text)
+                analysis_result = analyze_description(food_text)
                 st.session_state.result = analysis_result
     
     # Display results
@@ -111,6 +226,8 @@ def voice_analysis():
 
 def display_results(result):
     st.header("📊 Analysis Results")
+    if result.get('source') == 'local':
+        st.caption("⚡ Answered instantly from the local nutrition table")
     
     # Create columns for better layout
     col1, col2 = st.columns(2)
@@ -158,11 +275,11 @@ def display_results(result):
                 Estimated calories: {result.get('calories', 0)}.
                 {result.get('health_advice', 'Enjoy in moderation!')}
                 """
-                audio_file = text_to_speech(summary)
-                st.session_state.audio_file = audio_file
+                audio_bytes = get_tts_cache().speak(summary)
+                st.session_state.audio_file = audio_bytes
                 
-                # Play audio
-                st.audio(audio_file, format='audio/mp3')
+                # Play audio straight from memory
+                st.audio(audio_bytes, format='audio/mp3')
                 
             except Exception as e:
                 st.error(f"Error generating audio: {str(e)}")
@@ -0,0 +1,234 @@
+import csv
+import os
+import re
+from collections import defaultdict
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "nutrition_data.csv")
+MIN_CONFIDENCE = 0.6  # Below this the description goes to the LLM instead
+MIN_WORD_SIMILARITY = 0.5  # Dice score at which a query word counts as the same word (spelling variants)
+
+NUMBER_WORDS = {
+    'a': 1, 'an': 1, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6,
+    'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10, 'eleven': 11, 'twelve': 12,
+    'half': 0.5, 'quarter': 0.25, 'couple': 2, 'few': 3, 'dozen': 12,
+}
+
+# Household units in grams (or ml, treated as grams); a food's own unit overrides these
+UNIT_GRAMS = {
+    'g': 1, 'gm': 1, 'gram': 1, 'kg': 1000, 'ml': 1, 'l': 1000, 'litre': 1000, 'liter': 1000,
+    'cup': 240, 'bowl': 150, 'katori': 150, 'plate': 250, 'glass': 250, 'slice': 30,
+    'piece': None, 'serving': None, 'tbsp': 15, 'tablespoon': 15, 'tsp': 5, 'teaspoon': 5,
+    'handful': 28, 'bar': 40,
+}
+UNIT_ALIASES = {'grams': 'gram', 'gms': 'gm', 'cups': 'cup', 'bowls': 'bowl', 'plates': 'plate',
+                'glasses': 'glass', 'slices': 'slice', 'pieces': 'piece', 'pcs': 'piece', 'pc': 'piece',
+                'servings': 'serving', 'tbsps': 'tbsp', 'tsps': 'tsp', 'handfuls': 'handful',
+                'bars': 'bar', 'katoris': 'katori', 'litres': 'litre', 'liters': 'liter'}
+FILLER_WORDS = {'of', 'some', 'with', 'and', 'had', 'ate', 'i', 'for', 'my', 'small', 'medium', 'large'}
+
+_ITEM_SPLIT = re.compile(r'\s*(?:,|\+|&|\band\b|\bwith\b|\bplus\b)\s*')
+_NUMBER_UNIT = re.compile(r'^(\d+(?:\.\d+)?|\d+/\d+)([a-z]+)?$')
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def dice(a, b):
+    return 2 * len(a & b) / (len(a) + len(b)) if a or b else 0.0
+
+
+def word_matches(word, key_words):
+    """True if word is one of key_words, a plural of one, or a close spelling variant"""
+    for key_word in key_words:
+        if word == key_word or word.rstrip('s') == key_word.rstrip('s'):
+            return True
+        if dice(trigrams(word), trigrams(key_word)) >= MIN_WORD_SIMILARITY:
+            return True
+    return False
+
+
+def parse_number(token):
+    """Numeric value of a quantity token, or None"""
+    if token in NUMBER_WORDS:
+        return NUMBER_WORDS[token]
+    if '/' in token:
+        numerator, _, denominator = token.partition('/')
+        if numerator.isdigit() and denominator.isdigit() and int(denominator):
+            return int(numerator) / int(denominator)
+        return None
+    try:
+        return float(token)
+    except ValueError:
+        return None
+
+
+def parse_item(text):
+    """
+    Split one food mention into (quantity, unit, food words)
+
+    Handles "2 rotis", "200g rice", "1/2 cup dal", "a bowl of poha", "half banana".
+    quantity is None when no amount is given; unit is None when no unit is given.
+    """
+    tokens = re.sub(r"[^a-z0-9/.\s]", " ", text.lower()).split()
+    quantity, unit = None, None
+    while tokens:
+        token = tokens[0]
+        match = _NUMBER_UNIT.match(token)
+        if match and quantity is None:
+            quantity = parse_number(match.group(1))
+            suffix = match.group(2)
+            if suffix:
+                suffix = UNIT_ALIASES.get(suffix, suffix)
+                if suffix not in UNIT_GRAMS:
+                    break
+                unit = suffix
+            tokens.pop(0)
+        elif token in NUMBER_WORDS and quantity is None:
+            quantity = NUMBER_WORDS[token]
+            tokens.pop(0)
+        elif UNIT_ALIASES.get(token, token) in UNIT_GRAMS and unit is None and len(tokens) > 1:
+            unit = UNIT_ALIASES.get(token, token)
+            tokens.pop(0)
+        elif token in FILLER_WORDS:
+            tokens.pop(0)
+        else:
+            break
+    return quantity, unit, ' '.join(token for token in tokens if token not in FILLER_WORDS)
+
+
+class NutritionDB:
+    """
+    Local calorie and macro lookup for common foods
+
+    Foods and aliases come from a small CSV table (values per 100 g plus a
+    typical serving unit). Names are matched exactly first, then through a
+    trigram index scored with the Dice coefficient, so plurals and spelling
+    variants ("rotis", "chapatis", "idlis") still match. A fuzzy match also
+    needs every word of the query to appear in the matched name, so a
+    different dish that shares a word ("rice cake" vs "rice", "mutton
+    biryani" vs "chicken biryani") is not taken for it. A description is
+    answered locally only when every item parses and matches confidently;
+    otherwise lookup() returns None and the caller should ask the LLM.
+    """
+
+    def __init__(self, path=DATA_PATH, min_confidence=MIN_CONFIDENCE):
+        self.min_confidence = min_confidence
+        self.foods = []
+        self.names = {}  # exact name/alias -> food index
+        self.index = defaultdict(set)  # trigram -> food-name keys containing it
+        self.key_trigrams = {}  # name/alias -> its trigram set
+
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                food = {
+                    'name': row['name'], 'unit': row['unit'], 'unit_grams': float(row['unit_grams']),
+                    'health': int(row['health']),
+                    **{field: float(row[field]) for field in ('kcal', 'protein', 'carbs', 'fat', 'fiber')}
+                }
+                food_id = len(self.foods)
+                self.foods.append(food)
+                for key in [row['name'], *filter(None, row['aliases'].split('|'))]:
+                    self.names[key] = food_id
+                    grams = trigrams(key)
+                    self.key_trigrams[key] = grams
+                    for gram in grams:
+                        self.index[gram].add(key)
+
+    def match(self, name):
+        """(food, confidence) for the closest known food name, or (None, 0.0)"""
+        if not name:
+            return None, 0.0
+        if name in self.names:
+            return self.foods[self.names[name]], 1.0
+        if name.endswith('s') and name[:-1] in self.names:
+            return self.foods[self.names[name[:-1]]], 0.95
+
+        query = trigrams(name)
+        overlap = defaultdict(int)
+        for gram in query:
+            for key in self.index.get(gram, ()):
+                overlap[key] += 1
+        scored = sorted(((2 * shared / (len(query) + len(self.key_trigrams[key])), key)
+                         for key, shared in overlap.items()), reverse=True)
+
+        # Unit words left after the name ("pizza slice") do not have to match
+        words = [word for word in name.split() if UNIT_ALIASES.get(word, word) not in UNIT_GRAMS]
+        for score, key in scored:
+            if score < self.min_confidence:
+                break
+            key_words = key.split()
+            if all(word_matches(word, key_words) for word in words):
+                return self.foods[self.names[key]], score
+        return None, 0.0
+
+    def grams_for(self, food, quantity, unit):
+        """Weight in grams of quantity x unit of this food"""
+        quantity = 1 if quantity is None else quantity
+        if unit is None or unit == food['unit'] or UNIT_GRAMS.get(unit) is None:
+            return quantity * food['unit_grams']
+        return quantity * UNIT_GRAMS[unit]
+
+    def lookup(self, description):
+        """
+        Estimate calories for a description like "2 rotis with dal"
+
+        Returns:
+            dict: Result in the same shape as estimate_calories() plus
+                  'source': 'local' and 'confidence', or None when the LLM should answer
+        """
+        items = [item for item in _ITEM_SPLIT.split(description.strip().lower()) if item.strip()]
+        if not items:
+            return None
+
+        parsed = []
+        confidence = 1.0
+        for item in items:
+            quantity, unit, name = parse_item(item)
+            food, score = self.match(name)
+            confidence = min(confidence, score)
+            if food is None or confidence < self.min_confidence:
+                return None
+            parsed.append((food, quantity, unit, self.grams_for(food, quantity, unit)))
+
+        totals = {'calories': 0.0, 'protein': 0.0, 'carbs': 0.0, 'fat': 0.0, 'fiber': 0.0}
+        weighted_health = 0.0
+        names, insights = [], []
+        for food, quantity, unit, grams in parsed:
+            factor = grams / 100
+            calories = food['kcal'] * factor
+            totals['calories'] += calories
+            for nutrient in ('protein', 'carbs', 'fat', 'fiber'):
+                totals[nutrient] += food[nutrient] * factor
+            weighted_health += food['health'] * calories
+
+            amount = 1 if quantity is None else quantity
+            amount_text = f"{amount:g} {unit or food['unit']}"
+            names.append(f"{amount_text} {food['name']}")
+            insights.append(f"{amount_text} {food['name']} (~{grams:.0f} g): {calories:.0f} kcal")
+
+        health_score = round(weighted_health / totals['calories']) if totals['calories'] else 50
+        if health_score >= 75:
+            advice = "A nourishing choice - keep it up!"
+        elif health_score >= 50:
+            advice = "A reasonable meal. Add vegetables or protein to balance it."
+        else:
+            advice = "Enjoy in moderation!"
+
+        return {
+            'food_name': " + ".join(names),
+            'calories': round(totals['calories']),
+            'nutrition': {nutrient: round(totals[nutrient], 1) for nutrient in ('protein', 'carbs', 'fat', 'fiber')},
+            'health_score': health_score,
+            'insights': insights,
+            'health_advice': advice,
+            'source': 'local',
+            'confidence': round(confidence, 2),
+        }
+
+
+def estimate_with_fallback(description, db, llm_estimate):
+    """Answer from the local table when confident, otherwise call llm_estimate(description)"""
+    result = db.lookup(description)
+    return result if result is not None else llm_estimate(description)
@@ -0,0 +1,150 @@
+import hashlib
+import io
+import os
+import re
+import threading
+from collections import OrderedDict
+
+CACHE_DIR = "tts_cache"
+MAX_DISK_BYTES = 50 * 1024 * 1024
+MAX_MEMORY_BYTES = 10 * 1024 * 1024
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+
+def gtts_synthesize(text, lang='en', tld='com', slow=False):
+    """MP3 bytes for text using Google Text-to-Speech"""
+    try:
+        from gtts import gTTS
+    except ImportError:
+        raise ImportError("gTTS is required for audio summaries: pip install gTTS")
+    buffer = io.BytesIO()
+    gTTS(text=text, lang=lang, tld=tld, slow=slow).write_to_fp(buffer)
+    return buffer.getvalue()
+
+
+class TTSCache:
+    """
+    Text-to-speech with sentence-level caching
+
+    Text is split into sentences and each sentence's MP3 is cached under a
+    hash of the sentence and voice settings, so phrases shared by many
+    summaries ("Enjoy in moderation!") are synthesized once. MP3 streams are
+    sequences of independent frames, so sentence clips concatenate into one
+    playable file. Clips live in an in-memory LRU (bytes) over an on-disk
+    directory capped at max_disk_bytes; the least recently used files are
+    deleted first.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_disk_bytes=MAX_DISK_BYTES,
+                 max_memory_bytes=MAX_MEMORY_BYTES, synthesize_fn=gtts_synthesize, **voice):
+        """
+        Args:
+            cache_dir (str): Directory for cached MP3 clips
+            max_disk_bytes (int): Size cap of cache_dir
+            max_memory_bytes (int): Size cap of the in-memory clip cache
+            synthesize_fn (callable): f(text, **voice) -> MP3 bytes
+            **voice: Voice settings passed to synthesize_fn (e.g. lang, tld, slow);
+                part of every cache key
+        """
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self.synthesize_fn = synthesize_fn
+        self.voice = voice
+        self.lock = threading.Lock()
+        self.memory = OrderedDict()  # key -> mp3 bytes
+        self.memory_bytes = 0
+        self.stats = {'sentences': 0, 'memory_hits': 0, 'disk_hits': 0, 'synthesized': 0}
+
+        os.makedirs(cache_dir, exist_ok=True)
+        # Disk index ordered by last use (file mtime), oldest first
+        entries = []
+        for name in os.listdir(cache_dir):
+            if name.endswith('.mp3'):
+                stat = os.stat(os.path.join(cache_dir, name))
+                entries.append((stat.st_mtime, name[:-4], stat.st_size))
+        self.disk = OrderedDict((key, size) for _, key, size in sorted(entries))
+        self.disk_bytes = sum(self.disk.values())
+
+    @staticmethod
+    def split_sentences(text):
+        return [sentence for sentence in _SENTENCE_END.split(re.sub(r'\s+', ' ', text).strip()) if sentence]
+
+    def _key(self, sentence):
+        settings = "|".join(f"{name}={value}" for name, value in sorted(self.voice.items()))
+        return hashlib.sha256(f"{settings}\0{sentence}".encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+
+    def _remember(self, key, audio):
+        """Add to the in-memory LRU (call with lock held)"""
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return
+        self.memory[key] = audio
+        self.memory_bytes += len(audio)
+        while self.memory_bytes > self.max_memory_bytes and len(self.memory) > 1:
+            _, evicted = self.memory.popitem(last=False)
+            self.memory_bytes -= len(evicted)
+
+    def _store(self, key, audio):
+        """Write a clip to disk and evict least recently used files over the cap (lock held)"""
+        tmp_path = f"{self._path(key)}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(audio)
+        os.replace(tmp_path, self._path(key))
+        self.disk[key] = len(audio)
+        self.disk_bytes += len(audio)
+        while self.disk_bytes > self.max_disk_bytes and len(self.disk) > 1:
+            evicted, size = self.disk.popitem(last=False)
+            self.disk_bytes -= size
+            try:
+                os.remove(self._path(evicted))
+            except FileNotFoundError:
+                pass
+
+    def _clip(self, sentence):
+        key = self._key(sentence)
+        with self.lock:
+            self.stats['sentences'] += 1
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                self.stats['memory_hits'] += 1
+                return self.memory[key]
+            if key in self.disk:
+                try:
+                    with open(self._path(key), 'rb') as f:
+                        audio = f.read()
+                    os.utime(self._path(key))  # mark as recently used across restarts
+                    self.disk.move_to_end(key)
+                    self.stats['disk_hits'] += 1
+                    self._remember(key, audio)
+                    return audio
+                except FileNotFoundError:
+                    self.disk_bytes -= self.disk.pop(key)
+
+        # Synthesize outside the lock so other sentences are not blocked
+        audio = self.synthesize_fn(sentence, **self.voice)
+        with self.lock:
+            self.stats['synthesized'] += 1
+            if key not in self.disk:
+                self._store(key, audio)
+            self._remember(key, audio)
+        return audio
+
+    def speak(self, text):
+        """MP3 bytes for text, built from cached sentence clips"""
+        sentences = self.split_sentences(text)
+        # Whole summaries are memoized in memory only; disk holds sentences
+        key = self._key("\n".join(sentences))
+        with self.lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                return self.memory[key]
+        audio = b"".join(self._clip(sentence) for sentence in sentences)
+        if len(sentences) > 1:
+            with self.lock:
+                self._remember(key, audio)
+        return audio
@@ -5,6 +5,11 @@ from notion_client import Client
 from agent_manager import AgentManager
 from config import JOB_KEYWORDS, JOB_LOCATIONS, validate_config
 
+@st.cache_resource
+def get_scraper():
+    """One scraper (HTTP pool, shared browser) reused by every search"""
+    return JobScraper()
+
 class NotionClient:
     def __init__(self):
         # Validate configuration first
@@ -26,6 +31,8 @@ class NotionClient:
             st.session_state.jobs_saved = 0
         if 'search_completed' not in st.session_state:
             st.session_state.search_completed = False
+        if 'fetch_stats' not in st.session_state:
+            st.session_state.fetch_stats = {}
     
     def run_job_search(self, keywords, locations, max_jobs=20):
         """Run the job search workflow"""
@@ -33,15 +40,31 @@ class NotionClient:
         st.session_state.search_completed = False
         
         try:
-            # Initialize scraper
-            with st.spinner("🚀 Initializing browser..."):
-                self.scraper = JobScraper()
-                time.sleep(1)
+            self.scraper = get_scraper()
             
-            # Step 1: Search for jobs
-            with st.spinner(f"🔍 Scanning job sites for {len(keywords)} keywords in {len(locations)} locations..."):
-                jobs = self.scraper.search_jobs(keywords, locations, max_jobs//len(keywords))
-                st.session_state.jobs_found = jobs
+            # Step 1: Search for jobs, showing listings as each site answers
+            total_tasks = len(self.scraper.tasks(keywords, locations))
+            progress = st.progress(0, text=f"🔍 Scanning job sites for {len(keywords)} keywords in {len(locations)} locations...")
+            live_results = st.empty()
+            jobs, failed, done = [], [], 0
+            for (source, keyword, location), new_jobs, error in self.scraper.iter_jobs(keywords, locations, max_jobs):
+                done += 1
+                jobs.extend(new_jobs)
+                if error:
+                    failed.append(f"{source} ({keyword}, {location}): {error}")
+                progress.progress(min(done / total_tasks, 1.0),
+                                  text=f"🔍 {source}: '{keyword}' in {location} - {len(jobs)} jobs so far")
+                if new_jobs:
+                    live_results.dataframe(
+                        [{'Title': job['title'], 'Company': job['company'], 'Location': job['location'],
+                          'Source': job['source']} for job in jobs],
+                        use_container_width=True
+                    )
+            progress.empty()
+            st.session_state.fetch_stats = dict(self.scraper.stats)
+            if failed:
+                st.warning(f"⚠️ {len(failed)} site searches failed: " + "; ".join(failed[:3]))
+            st.session_state.jobs_found = jobs
             
             # Step 2: Save to Notion
             if jobs:
@@ -57,8 +80,6 @@ class NotionClient:
             st.error(f"❌ Error during job search: {str(e)}")
         finally:
             st.session_state.search_in_progress = False
-            if self.scraper:
-                self.scraper.close()
     
     def display_ui(self):
         """Display the main user interface"""
@@ -308,6 +329,11 @@ class NotionClient:
                 
                 for location, count in sorted(locations_found.items(), key=lambda x: x[1], reverse=True)[:5]:
                     st.write(f"- {location}: {count}")
+                
+                fetch_stats = st.session_state.fetch_stats
+                if fetch_stats:
+                    st.caption(f"Pages fetched since start: {fetch_stats['http_pages']} over HTTP, "
+                               f"{fetch_stats['browser_pages']} in the browser")
         
         else:
             # Welcome screen
@@ -337,7 +363,7 @@ class NotionClient:
                 **Prerequisites:**
                 1. ✅ Groq API Key (free at console.groq.com)
                 2. ✅ Notion API Key + Database ID
-                3. ✅ Chrome browser installed
+                3. ✅ Chrome browser installed (used only for pages that need JavaScript)
                 
                 **Steps:**
                 1. **Test Connections** - Click test buttons in sidebar
@@ -373,9 +399,8 @@ class NotionClient:
                 """)
     
     def close(self):
-        """Cleanup resources"""
-        if self.scraper:
-            self.scraper.close()
+        """Cleanup resources (the shared scraper stays open for the next search)"""
+        self.scraper = None
 
 def main():
     bot = NotionClient()
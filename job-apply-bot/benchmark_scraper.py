@@ -0,0 +1,114 @@
+"""
+Fixture-based benchmark for JobScraper
+
+Serves the saved result pages in fixtures/ from a local HTTP server (with a
+configurable per-page delay standing in for network and site latency) and
+runs the same search serially and with a worker pool, reporting jobs/minute
+and time to first result. Placeholders in the fixtures are filled from the
+query so every keyword/location gets distinct listings. The Indeed fixture
+carries its listings only as embedded JSON, as the live site does, so it
+exercises the HTTP-first parser rather than the browser.
+
+Run with:  python benchmark_scraper.py --latency 0.5 --workers 6
+"""
+import argparse
+import copy
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from job_scraper import JobScraper, SOURCES
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+KEYWORDS = ["python developer", "backend engineer", "data engineer"]
+LOCATIONS = ["remote", "new york", "san francisco"]
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = os.path.join(FIXTURE_DIR, f"{parsed.path.strip('/')}.html")
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+
+        query = parse_qs(parsed.query)
+        keyword, location = query.get('q', [''])[0], query.get('l', [''])[0]
+        with open(path, encoding='utf-8') as f:
+            html = (f.read().replace("{{keyword}}", keyword).replace("{{location}}", location)
+                    .replace("{{slug}}", f"{keyword}-{location}".replace(" ", "-")))
+        time.sleep(self.server.latency)
+
+        body = html.encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_fixture_server(port=0, latency=0.5):
+    """Serve fixtures/<site>.html at /<site>?q=...&l=... in a daemon thread; returns (server, base_url)"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), FixtureHandler)
+    server.latency = latency
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def local_sources(base_url, min_interval):
+    """Copies of SOURCES pointing at the fixture server (fixtures are static HTML, so no browser)"""
+    sources = []
+    for source in SOURCES:
+        local = copy.copy(source)
+        local.search_url = f"{base_url}/{source.name.lower()}?q={{keyword}}&l={{location}}"
+        local.browser_fallback = False
+        local.min_interval = min_interval
+        sources.append(local)
+    return sources
+
+
+def run(sources, workers):
+    scraper = JobScraper(sources=sources, workers=workers)
+    start = time.perf_counter()
+    first_result, jobs, errors = None, 0, 0
+    try:
+        for _, new_jobs, error in scraper.iter_jobs(KEYWORDS, LOCATIONS):
+            if first_result is None and new_jobs:
+                first_result = time.perf_counter() - start
+            jobs += len(new_jobs)
+            errors += error is not None
+    finally:
+        scraper.close()
+    return jobs, errors, time.perf_counter() - start, first_result, scraper.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JobScraper against saved result pages")
+    parser.add_argument("--latency", type=float, default=0.5, help="Seconds per page")
+    parser.add_argument("--min-interval", type=float, default=0.2, help="Per-site spacing between requests")
+    parser.add_argument("--workers", type=int, default=6)
+    args = parser.parse_args()
+
+    server, base_url = start_fixture_server(latency=args.latency)
+    sources = local_sources(base_url, args.min_interval)
+    tasks = len(KEYWORDS) * len(LOCATIONS) * len(sources)
+    print(f"{tasks} tasks ({len(KEYWORDS)} keywords x {len(LOCATIONS)} locations x {len(sources)} sites), "
+          f"{args.latency}s per page, {args.min_interval}s per-site interval")
+    print(f"{'mode':12s} {'jobs':>6s} {'errors':>7s} {'seconds':>8s} {'first':>7s} {'jobs/min':>9s} "
+          f"{'http':>5s} {'browser':>8s}")
+    for name, workers in (("serial", 1), (f"{args.workers} workers", args.workers)):
+        jobs, errors, elapsed, first, stats = run(sources, workers)
+        print(f"{name:12s} {jobs:6d} {errors:7d} {elapsed:8.2f} {first or 0:7.2f} {jobs / elapsed * 60:9.0f} "
+              f"{stats['http_pages']:5d} {stats['browser_pages']:8d}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,419 @@
+import atexit
+import json
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote_plus, urljoin
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+SCRAPER_WORKERS = 6  # keyword x location x source tasks in flight
+REQUEST_TIMEOUT = 20
+BROWSER_WAIT = 10  # Seconds to wait for listings to render in the browser
+HEADERS = {
+    "User-Agent": "job-apply-bot/1.0 (personal job search assistant)",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+class RateLimiter:
+    """Spaces requests to one site at least min_interval seconds apart (plus jitter), across threads"""
+
+    def __init__(self, min_interval, jitter=0.0):
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.min_interval + random.uniform(0, self.jitter)
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _job(source, page_url, title, company=None, location=None, url=None, date_posted=None):
+    return {
+        'title': title.strip(),
+        'company': (company or '').strip() or 'Unknown',
+        'location': (location or '').strip() or 'Not specified',
+        'source': source,
+        'url': urljoin(page_url, url) if url else '',
+        'date_posted': date_posted or 'Recent',
+    }
+
+
+def _json_ld_postings(data):
+    """JobPosting objects anywhere in a JSON-LD document (lists, @graph, ItemList)"""
+    if isinstance(data, list):
+        for item in data:
+            yield from _json_ld_postings(item)
+    elif isinstance(data, dict):
+        if data.get('@type') == 'JobPosting':
+            yield data
+        for key in ('@graph', 'itemListElement', 'item'):
+            if key in data:
+                yield from _json_ld_postings(data[key])
+
+
+def parse_json_ld(soup, source, page_url):
+    """Jobs from schema.org JobPosting markup, which many sites embed for search engines"""
+    jobs = []
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+        for posting in _json_ld_postings(data):
+            if not posting.get('title'):
+                continue
+            organization = posting.get('hiringOrganization') or {}
+            place = posting.get('jobLocation') or {}
+            place = place[0] if isinstance(place, list) and place else place
+            address = (place.get('address') or {}) if isinstance(place, dict) else {}
+            location = ", ".join(filter(None, (address.get('addressLocality'), address.get('addressRegion'))))
+            if posting.get('jobLocationType') == 'TELECOMMUTE':
+                location = location or 'Remote'
+            jobs.append(_job(source, page_url, posting['title'],
+                             organization.get('name') if isinstance(organization, dict) else organization,
+                             location, posting.get('url'), posting.get('datePosted')))
+    return jobs
+
+
+_INDEED_CARDS = re.compile(r'window\.mosaic\.providerData\["mosaic-provider-jobcards"\]\s*=\s*(\{.*?\});\s*$',
+                           re.MULTILINE | re.DOTALL)
+
+
+def parse_indeed_json(soup, source, page_url):
+    """Jobs from the job-card data Indeed embeds in an inline script"""
+    for script in soup.find_all('script'):
+        match = _INDEED_CARDS.search(script.string or '')
+        if not match:
+            continue
+        try:
+            data = json.loads(match.group(1))
+        except ValueError:
+            return []
+        results = data.get('metaData', {}).get('mosaicProviderJobCardsModel', {}).get('results', [])
+        return [_job(source, page_url, result['title'], result.get('company'), result.get('formattedLocation'),
+                     result.get('link') or f"/viewjob?jk={result.get('jobkey')}", result.get('formattedRelativeTime'))
+                for result in results if result.get('title')]
+    return []
+
+
+class JobSource:
+    """
+    One job site: how to build its search URL and read listings from its page
+
+    Listings are read from the HTML cards first, then from the site's embedded
+    JSON (json_parser) and finally from JSON-LD JobPosting markup, so pages
+    whose data ships in static HTML never need a browser. Selectors are CSS
+    selectors relative to each listing card; a field selector may end in
+    "@attr" to read an attribute instead of the text.
+    """
+
+    def __init__(self, name, search_url, card, title, company, location, link, date=None,
+                 json_parser=None, needs_browser=False, browser_fallback=True, min_interval=2.0):
+        """
+        Args:
+            json_parser (callable): f(soup, source name, page_url) -> jobs from embedded JSON
+            needs_browser (bool): Skip plain HTTP and always render in the browser
+            browser_fallback (bool): Render in the browser when a 200 page has no listings in its static HTML
+        """
+        self.name = name
+        self.search_url = search_url
+        self.selectors = {'card': card, 'title': title, 'company': company,
+                          'location': location, 'url': link, 'date_posted': date}
+        self.json_parser = json_parser
+        self.needs_browser = needs_browser
+        self.browser_fallback = browser_fallback
+        self.min_interval = min_interval
+
+    def url(self, keyword, location):
+        return self.search_url.format(keyword=quote_plus(keyword), location=quote_plus(location))
+
+    @staticmethod
+    def _select(card, selector):
+        if not selector:
+            return None
+        selector, _, attr = selector.partition('@')
+        element = card.select_one(selector) if selector else card
+        if element is None:
+            return None
+        value = element.get(attr) if attr else element.get_text(" ", strip=True)
+        return value.strip() if value else None
+
+    def parse(self, html, page_url):
+        """Job dicts found in a search results page"""
+        soup = BeautifulSoup(html, "html.parser")
+        jobs = []
+        for card in soup.select(self.selectors['card']):
+            fields = {field: self._select(card, selector)
+                      for field, selector in self.selectors.items() if field != 'card'}
+            if fields['title']:
+                jobs.append(_job(self.name, page_url, fields['title'], fields['company'],
+                                 fields['location'], fields['url'], fields['date_posted']))
+        if not jobs and self.json_parser:
+            jobs = self.json_parser(soup, self.name, page_url)
+        if not jobs:
+            jobs = parse_json_ld(soup, self.name, page_url)
+        return jobs
+
+
+SOURCES = [
+    JobSource(
+        "Indeed", "https://www.indeed.com/jobs?q={keyword}&l={location}",
+        card="div.job_seen_beacon", title="h2.jobTitle span[title]",
+        company="[data-testid=company-name]", location="[data-testid=text-location]",
+        link="h2.jobTitle a@href", date="[data-testid=myJobsStateDate]",
+        json_parser=parse_indeed_json,
+    ),
+    JobSource(
+        "LinkedIn",
+        "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords={keyword}&location={location}",
+        card="div.base-card", title="h3.base-search-card__title",
+        company="h4.base-search-card__subtitle", location="span.job-search-card__location",
+        link="a.base-card__full-link@href", date="time@datetime",
+    ),
+    JobSource(
+        "Glassdoor", "https://www.glassdoor.com/Job/jobs.htm?sc.keyword={keyword}&locKeyword={location}",
+        card="li[data-test=jobListing]", title="[data-test=job-title]",
+        company="[class*=EmployerProfile_compactEmployerName]", location="[data-test=emp-location]",
+        link="a[data-test=job-title]@href", date="[data-test=job-age]",
+        min_interval=3.0,
+    ),
+]
+
+
+class HttpFetcher:
+    """Keep-alive HTTP session shared by all worker threads, with a connection pool per host"""
+
+    def __init__(self, pool_size=SCRAPER_WORKERS, timeout=REQUEST_TIMEOUT):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def fetch(self, url):
+        """Page body; raises requests.HTTPError for any answer other than 200"""
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        if response.status_code != 200:
+            raise requests.HTTPError(f"{response.status_code} {response.reason} for url: {url}", response=response)
+        return response.text
+
+    def close(self):
+        self.session.close()
+
+
+class SharedBrowser:
+    """
+    One long-lived headless Chrome for pages that need JavaScript
+
+    Launched on the first page that needs it and kept for the life of the
+    process, so searches do not pay browser startup or hold one browser per
+    worker. Pages are rendered one at a time; a crashed driver is replaced
+    on the next fetch.
+    """
+
+    def __init__(self, wait=BROWSER_WAIT):
+        self.wait = wait
+        self.driver = None
+        self.lock = threading.Lock()
+
+    def _launch(self):
+        from selenium import webdriver
+
+        options = webdriver.ChromeOptions()
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        return webdriver.Chrome(options=options)
+
+    def fetch(self, url, wait_selector=None):
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        with self.lock:
+            if self.driver is None:
+                self.driver = self._launch()
+            try:
+                self.driver.get(url)
+            except WebDriverException:
+                self._quit()
+                self.driver = self._launch()
+                self.driver.get(url)
+            if wait_selector:
+                try:
+                    WebDriverWait(self.driver, self.wait).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector)))
+                except TimeoutException:
+                    pass  # Parse whatever rendered; an empty page yields no jobs
+            return self.driver.page_source
+
+    def _quit(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+    def close(self):
+        with self.lock:
+            self._quit()
+
+
+_browser = None
+_browser_lock = threading.Lock()
+
+
+def get_browser():
+    """The process-wide SharedBrowser (Chrome itself starts on first use)"""
+    global _browser
+    with _browser_lock:
+        if _browser is None:
+            _browser = SharedBrowser()
+            atexit.register(_browser.close)
+        return _browser
+
+
+class JobScraper:
+    """
+    Concurrent job search across sites, HTTP first
+
+    Every keyword x location x source combination is a task run on a pool of
+    worker threads. Pages are fetched with a pooled HTTP session and parsed
+    from their HTML or embedded JSON; only when a page loads (HTTP 200) but
+    its static HTML holds no listings is it rendered in the shared headless
+    browser, and sites that needed the browser go straight to it afterwards.
+    Error answers, including 401/403 from a site refusing the request, fail
+    the task; the browser is not used to get around them.
+    Requests to the same site are spaced by that site's RateLimiter, while
+    different sites are fetched in parallel. iter_jobs() yields listings as
+    each task finishes so the UI can show them immediately.
+
+    A JobScraper is cheap to keep and reuse across searches; close() releases
+    its HTTP connections, while the browser lives until the process exits.
+    """
+
+    def __init__(self, sources=None, workers=SCRAPER_WORKERS, http=None, browser=None):
+        """
+        Args:
+            sources (list): JobSource entries to search (defaults to SOURCES)
+            workers (int): Tasks in flight
+            http (HttpFetcher): HTTP client (a new pooled session by default)
+            browser (SharedBrowser): Browser for JavaScript pages (get_browser() by default)
+        """
+        self.sources = sources if sources is not None else SOURCES
+        self.workers = workers
+        self.http = http or HttpFetcher(pool_size=workers)
+        self.browser = browser
+        self.limiters = {source.name: RateLimiter(source.min_interval, jitter=source.min_interval / 2)
+                         for source in self.sources}
+        self.browser_sites = set()  # Sites whose listings only appeared in the browser
+        self.stats = {'http_pages': 0, 'browser_pages': 0}
+        self.lock = threading.Lock()
+
+    def _count(self, stat):
+        with self.lock:
+            self.stats[stat] += 1
+
+    def _render(self, source, url):
+        if self.browser is None:
+            self.browser = get_browser()
+        self.limiters[source.name].wait()
+        html = self.browser.fetch(url, wait_selector=source.selectors['card'])
+        self._count('browser_pages')
+        return source.parse(html, url)
+
+    def _run_task(self, source, keyword, location):
+        url = source.url(keyword, location)
+        if source.needs_browser or source.name in self.browser_sites:
+            return self._render(source, url)
+
+        self.limiters[source.name].wait()
+        html = self.http.fetch(url)
+        self._count('http_pages')
+        jobs = source.parse(html, url)
+        if jobs or not source.browser_fallback:
+            return jobs
+
+        jobs = self._render(source, url)
+        if jobs:
+            with self.lock:
+                self.browser_sites.add(source.name)
+        return jobs
+
+    def tasks(self, keywords, locations):
+        """(source, keyword, location) tasks, interleaving sources so every site is busy from the start"""
+        return [(source, keyword, location)
+                for keyword in keywords for location in locations for source in self.sources]
+
+    def iter_jobs(self, keywords, locations, max_jobs=None):
+        """
+        Search all sites concurrently, yielding results as they arrive
+
+        Yields:
+            tuple: (task, new_jobs, error) per finished task, where task is
+                   (source name, keyword, location), new_jobs excludes
+                   listings already yielded and error is None or a message.
+                   Pending tasks are cancelled once max_jobs jobs were yielded.
+        """
+        seen = set()
+        found = 0
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            futures = {executor.submit(self._run_task, *task): task for task in self.tasks(keywords, locations)}
+            for future in as_completed(futures):
+                source, keyword, location = futures[future]
+                task = (source.name, keyword, location)
+                try:
+                    jobs = future.result()
+                except Exception as e:
+                    yield task, [], str(e)
+                    continue
+
+                new_jobs = []
+                for job in jobs:
+                    key = job['url'] or (job['title'], job['company'], job['location'])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    job['keyword'] = keyword
+                    new_jobs.append(job)
+                if max_jobs is not None:
+                    new_jobs = new_jobs[:max_jobs - found]
+                found += len(new_jobs)
+                yield task, new_jobs, None
+                if max_jobs is not None and found >= max_jobs:
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def search_jobs(self, keywords, locations, max_jobs_per_keyword=10):
+        """All jobs found, at most max_jobs_per_keyword per keyword"""
+        per_keyword = {keyword: 0 for keyword in keywords}
+        jobs = []
+        for (_, keyword, _), new_jobs, _ in self.iter_jobs(keywords, locations):
+            take = new_jobs[:max(0, max_jobs_per_keyword - per_keyword[keyword])]
+            per_keyword[keyword] += len(take)
+            jobs.extend(take)
+            if all(count >= max_jobs_per_keyword for count in per_keyword.values()):
+                break
+        return jobs
+
+    def close(self):
+        self.http.close()
@@ -1,12 +1,12 @@
 import streamlit as st
 import os
-from groq import Groq
+from common.llm_client import get_llm
 from pdf_processor import extract_text_from_pdf, chunk_text
 from vector_store import VectorStoreManager
 from config import GROQ_API_KEY, MODEL_NAME
 
-# Initialize Groq client
-client = Groq(api_key=GROQ_API_KEY)
+# Shared Groq client (pooled, rate limited, retried)
+llm = get_llm(GROQ_API_KEY)
 
 # Initialize vector store manager
 vector_manager = VectorStoreManager()
@@ -48,7 +48,7 @@ def process_pdf(uploaded_file):
         return False
 
 def get_groq_response(query, context):
-    """Get response from Groq LLM"""
+    """Get response from Groq LLM (identical in-flight requests are coalesced)"""
     try:
         # Prepare prompt with context
         prompt = f"""Based on the following context from class notes, please answer the question.
@@ -64,7 +64,7 @@ If the context doesn't contain relevant information, please state that.
 Answer:"""
         
         # Call Groq API
-        completion = client.chat.completions.create(
+        completion = llm.create(
             model=MODEL_NAME,
             messages=[
                 {
@@ -79,7 +79,8 @@ Answer:"""
             temperature=0.1,
             max_tokens=1024,
             top_p=1,
-            stream=False
+            stream=False,
+            group="pdf_answer"  # identical concurrent questions share one call
         )
         
         return completion.choices[0].message.content
@@ -120,6 +121,14 @@ def main():
         if uploaded_file is not None:
             if st.button("Process PDF"):
                 process_pdf(uploaded_file)
+        
+        with st.expander("LLM call stats"):
+            stats = llm.stats()
+            flight = stats["single_flight"]
+            st.metric("Groq calls issued", flight["issued"])
+            st.metric("Coalesced duplicates", flight["coalesced"], f"{flight['coalesced_ratio']:.0%}")
+            if "latency_p50" in stats:
+                st.caption(f"Latency p50 {stats['latency_p50']:.2f}s, p95 {stats['latency_p95']:.2f}s")
     
     # Main content area
     col1, col2 = st.columns([1, 1])
@@ -0,0 +1,114 @@
+from collections import deque
+
+
+def count_tokens(text):
+    """
+    Approximate the token count of a message
+
+    Llama tokenizers average roughly 4 characters per token for English text,
+    which is close enough for budgeting without loading a tokenizer.
+    """
+    return max(1, (len(text) + 3) // 4) + 4  # + per-message role/formatting overhead
+
+
+class ConversationMemory:
+    """
+    Chat history that fits a token budget
+
+    Recent turns are kept verbatim in a deque together with their token counts,
+    so the running total is updated in O(1) per message. When the budget is
+    exceeded the oldest turns are evicted and folded into a rolling summary by
+    the summarizer, so earlier context survives in compressed form.
+    """
+
+    def __init__(self, system_prompt, token_budget=2000, summary_budget=250,
+                 summarizer=None, summarize_after=400):
+        """
+        Args:
+            system_prompt (str): Prompt always sent first
+            token_budget (int): Maximum prompt tokens (system + summary + turns)
+            summary_budget (int): Tokens reserved for the rolling summary
+            summarizer (callable): f(previous_summary, messages) -> new summary string;
+                leave as None to summarize externally via take_evicted()
+            summarize_after (int): Evicted tokens collected before calling the summarizer
+        """
+        self.system_message = {"role": "system", "content": system_prompt}
+        self.system_tokens = count_tokens(system_prompt)
+        self.token_budget = token_budget
+        self.summary_budget = summary_budget
+        self.summarizer = summarizer
+        self.summarize_after = summarize_after
+
+        self.turns = deque()  # (message, tokens)
+        self.turn_tokens = 0
+        self.summary = ""
+        self.evicted = []
+        self.evicted_tokens = 0
+
+    @property
+    def total_tokens(self):
+        """Tokens of the prompt that messages() would build"""
+        summary_tokens = min(count_tokens(self.summary), self.summary_budget) if self.summary else 0
+        return self.system_tokens + summary_tokens + self.turn_tokens
+
+    def add(self, role, content):
+        """Append a message and evict the oldest turns that no longer fit"""
+        tokens = count_tokens(content)
+        self.turns.append(({"role": role, "content": content}, tokens))
+        self.turn_tokens += tokens
+
+        available = self.token_budget - self.system_tokens - self.summary_budget
+        # Always keep the newest message, even if it alone exceeds the budget
+        while self.turn_tokens > available and len(self.turns) > 1:
+            message, message_tokens = self.turns.popleft()
+            self.turn_tokens -= message_tokens
+            self.evicted.append(message)
+            self.evicted_tokens += message_tokens
+
+        if self.summarizer and self.needs_summary:
+            self.flush_summary()
+
+    def discard_last(self):
+        """Remove the newest message, e.g. a user turn that never got a reply"""
+        if self.turns:
+            _, tokens = self.turns.pop()
+            self.turn_tokens -= tokens
+
+    @property
+    def needs_summary(self):
+        """True once enough evicted tokens have piled up to be worth a summary call"""
+        return bool(self.evicted) and self.evicted_tokens >= self.summarize_after
+
+    def take_evicted(self):
+        """Remove and return the evicted messages that are not summarized yet"""
+        evicted = self.evicted
+        self.evicted = []
+        self.evicted_tokens = 0
+        return evicted
+
+    def restore_evicted(self, messages):
+        """Put back evicted messages whose summarization failed"""
+        self.evicted[:0] = messages
+        self.evicted_tokens += sum(count_tokens(m["content"]) for m in messages)
+
+    def flush_summary(self):
+        """Fold evicted turns into the rolling summary with one summarizer call"""
+        if not self.evicted or not self.summarizer:
+            return
+        evicted = self.take_evicted()
+        try:
+            self.summary = self.summarizer(self.summary, evicted)
+        except Exception as e:
+            print(f"(Could not summarize earlier messages: {e})")
+            self.restore_evicted(evicted)
+
+    def messages(self):
+        """Messages to send: system prompt, summary of older turns, then recent turns"""
+        messages = [self.system_message]
+        if self.summary:
+            messages.append({
+                "role": "system",
+                "content": f"Summary of the earlier conversation: {self.summary}"
+            })
+        messages.extend(message for message, _ in self.turns)
+        return messages
@@ -0,0 +1,126 @@
+"""
+Load test for server.py against a local mock LLM endpoint
+
+Starts an OpenAI-compatible mock that streams canned tokens with a fixed delay,
+points the Motivation Buddy server at it and drives many concurrent sessions.
+
+Run with:  python load_test.py --sessions 200 --messages 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+
+os.environ.setdefault("GROQ_API_KEY", "mock-key")
+
+import aiohttp
+from aiohttp import web
+
+MOCK_REPLY = ("You're doing better than you think. Every small step counts, "
+              "and today is a great day to take one more. Keep going!").split(" ")
+
+
+def make_mock_llm(token_delay):
+    """Minimal stand-in for the Groq chat completions endpoint"""
+
+    async def completions(request):
+        body = await request.json()
+        if not body.get("stream"):
+            return web.json_response({
+                "id": "mock", "object": "chat.completion", "created": int(time.time()),
+                "model": body["model"],
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": "Mock summary."}}],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+            })
+
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for word in MOCK_REPLY:
+            await asyncio.sleep(token_delay)
+            chunk = {
+                "id": "mock", "object": "chat.completion.chunk", "created": int(time.time()),
+                "model": body["model"],
+                "choices": [{"index": 0, "delta": {"content": word + " "}, "finish_reason": None}]
+            }
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/openai/v1/chat/completions", completions)
+    return app
+
+
+async def start_app(app, port):
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner
+
+
+async def run_session(http, url, session_id, n_messages, first_token, totals):
+    for i in range(n_messages):
+        start = time.perf_counter()
+        async with http.post(f"{url}/chat", json={"session_id": session_id,
+                                                 "message": f"I feel stuck on task {i}"}) as response:
+            response.raise_for_status()
+            first = True
+            async for _ in response.content.iter_any():
+                if first:
+                    first_token.append(time.perf_counter() - start)
+                    first = False
+        totals.append(time.perf_counter() - start)
+
+
+def percentile(values, pct):
+    return sorted(values)[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Load test the Motivation Buddy server")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=5, help="Messages per session")
+    parser.add_argument("--token-delay", type=float, default=0.01, help="Mock seconds per token")
+    parser.add_argument("--mock-port", type=int, default=9000)
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    # Point every Groq client (including the sync one in models.py) at the mock
+    os.environ["GROQ_BASE_URL"] = f"http://127.0.0.1:{args.mock_port}"
+    from server import MotivationServer
+
+    mock = await start_app(make_mock_llm(args.token_delay), args.mock_port)
+    # Keep mock replies out of the pool file real runs load
+    server = MotivationServer(base_url=os.environ["GROQ_BASE_URL"], pool_path=None)
+    app = await start_app(server.make_app(), args.port)
+    url = f"http://127.0.0.1:{args.port}"
+
+    first_token, totals = [], []
+    start = time.perf_counter()
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0)) as http:
+        await asyncio.gather(*(
+            run_session(http, url, f"user-{i}", args.messages, first_token, totals)
+            for i in range(args.sessions)
+        ))
+        async with http.get(f"{url}/stats") as response:
+            stats = await response.json()
+    elapsed = time.perf_counter() - start
+
+    print(f"Sessions: {args.sessions}  Replies: {len(totals)}  Wall time: {elapsed:.2f}s")
+    print(f"Throughput: {len(totals) / elapsed:.1f} replies/sec")
+    print(f"First token  p50 {statistics.median(first_token) * 1000:7.1f} ms   "
+          f"p95 {percentile(first_token, 95) * 1000:7.1f} ms")
+    print(f"Full reply   p50 {statistics.median(totals) * 1000:7.1f} ms   "
+          f"p95 {percentile(totals, 95) * 1000:7.1f} ms")
+    print(f"Server stats: {stats}")
+
+    await app.cleanup()
+    await mock.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,11 +2,16 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import os
-from groq import Groq
+from common.llm_client import get_llm
 from datetime import datetime
+from conversation_memory import ConversationMemory
+from motivation_pool import MotivationPool
 
-# Initialize Groq client
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+# Shared Groq client (pooled, rate limited, retried)
+llm = get_llm()
+
+MODEL = "llama-3.3-70b-versatile"  # Fast and powerful
+SUMMARY_MODEL = "llama-3.1-8b-instant"  # Small model is plenty for summaries
 
 # System prompt that defines the Motivation Buddy's personality
 SYSTEM_PROMPT = """You are a warm, empathetic Motivation Buddy. Your role is to:
@@ -19,6 +24,26 @@ SYSTEM_PROMPT = """You are a warm, empathetic Motivation Buddy. Your role is to:
 
 Remember: Everyone struggles. Progress > Perfection."""
 
+# Prompts used for the 'daily' motivation boost
+DAILY_PROMPTS = [
+    "Give me a motivational message to start my day",
+    "I need encouragement for today",
+    "Tell me something inspiring for the morning"
+]
+
+def generate_motivation(user_message):
+    """Single LLM call for a motivational response; raises on API errors"""
+    response = llm.create(
+        model=MODEL,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_message}
+        ],
+        temperature=0.8,
+        max_tokens=300
+    )
+    return response.choices[0].message.content
+
 def get_motivation(user_message):
     """
     Get a motivational response from the chatbot
@@ -30,29 +55,54 @@ def get_motivation(user_message):
         str: Motivational response from the AI
     """
     try:
-        response = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",  # Fast and powerful
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": user_message}
-            ],
-            temperature=0.8,
-            max_tokens=300
-        )
-        return response.choices[0].message.content
+        return generate_motivation(user_message)
     
     except Exception as e:
         return f"Oops! Something went wrong: {str(e)}\nPlease check your API key and internet connection."
 
-def daily_motivation():
-    """Generate a random daily motivation message"""
-    prompts = [
-        "Give me a motivational message to start my day",
-        "I need encouragement for today",
-        "Tell me something inspiring for the morning"
+def build_summary_messages(previous_summary, messages):
+    """Prompt that folds evicted messages into the running summary"""
+    transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+    return [
+        {"role": "system", "content": "Summarize conversations in at most 120 words. Keep the user's situation, feelings, goals and any advice already given."},
+        {"role": "user", "content": f"Summary so far:\n{previous_summary or '(none)'}\n\nNew messages:\n{transcript}\n\nUpdated summary:"}
     ]
+
+def summarize_conversation(previous_summary, messages):
+    """
+    Fold older messages into a short running summary of the conversation
+    
+    Args:
+        previous_summary (str): Summary built so far (may be empty)
+        messages (list): Evicted chat messages to add to the summary
+    
+    Returns:
+        str: Updated summary
+    """
+    response = llm.create(
+        model=SUMMARY_MODEL,
+        messages=build_summary_messages(previous_summary, messages),
+        temperature=0.3,
+        max_tokens=200
+    )
+    return response.choices[0].message.content.strip()
+
+def daily_motivation(pool=None, user_id="local"):
+    """
+    Get a random daily motivation message
+    
+    Args:
+        pool (MotivationPool): Pre-generated messages to serve from, if available
+        user_id (str): User the message is served to (each user never sees a repeat)
+    
+    Returns:
+        str: Motivational message
+    """
     import random
-    return get_motivation(random.choice(prompts))
+    prompt = random.choice(DAILY_PROMPTS)
+    message = pool.serve(user_id, prompt) if pool else None
+    # Fall back to a live call when the pool has nothing unseen left for this user
+    return message if message is not None else get_motivation(prompt)
 
 def main():
     """Main function to run the Motivation Buddy chatbot"""
@@ -65,8 +115,13 @@ def main():
     print("Type 'daily' for a random motivation boost")
     print("-" * 60)
     
-    # Conversation history to maintain context
-    conversation_history = [{"role": "system", "content": SYSTEM_PROMPT}]
+    # Daily messages are pre-generated in the background and served instantly. The pool
+    # shares the rate limit with chat replies, so it fills lazily (on the first 'daily'
+    # for a prompt) and a few messages at a time instead of all prompts at startup
+    pool = MotivationPool(generate_motivation, DAILY_PROMPTS, low_watermark=1, refill_batch=3, workers=1)
+    
+    # Conversation memory: recent turns within a token budget plus a summary of older ones
+    memory = ConversationMemory(SYSTEM_PROMPT, token_budget=2000, summarizer=summarize_conversation)
     
     while True:
         user_input = input("\n🫵 You: ").strip()
@@ -78,24 +133,25 @@ def main():
         if user_input.lower() in ['quit', 'exit', 'bye']:
             print("\n💙 Remember: You're doing better than you think!")
             print("Keep going, champ! See you next time! 👋\n")
+            pool.close()
             break
         
         if user_input.lower() == 'daily':
             print("\n🤖 Motivation Buddy: ", end="")
-            response = daily_motivation()
+            response = daily_motivation(pool)
             print(response)
             continue
         
         # Add user message to history
-        conversation_history.append({"role": "user", "content": user_input})
+        memory.add("user", user_input)
         
         print("\n🤖 Motivation Buddy: ", end="")
         
         try:
             # Get response with conversation history
-            response = client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=conversation_history,
+            response = llm.create(
+                model=MODEL,
+                messages=memory.messages(),
                 temperature=0.8,
                 max_tokens=300
             )
@@ -103,12 +159,8 @@ def main():
             assistant_message = response.choices[0].message.content
             print(assistant_message)
             
-            # Add assistant response to history
-            conversation_history.append({"role": "assistant", "content": assistant_message})
-            
-            # Keep only last 10 messages to avoid token limits
-            if len(conversation_history) > 11:
-                conversation_history = [conversation_history[0]] + conversation_history[-10:]
+            # Add assistant response to history (older turns are summarized as needed)
+            memory.add("assistant", assistant_message)
         
         except Exception as e:
             print(f"Error: {str(e)}")
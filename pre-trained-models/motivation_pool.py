@@ -0,0 +1,174 @@
+import json
+import os
+import random
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class MotivationPool:
+    """
+    Pre-generated daily motivation messages
+
+    Each prompt keeps a window of generated messages. Every message has an
+    absolute position, and each user keeps a cursor per prompt, so serving is
+    O(1) and a user never gets the same message twice. When a user's unseen
+    messages for a prompt fall below the low watermark, more are generated in
+    a background thread. Cursors are kept for the max_users most recently
+    served users only. Anonymous callers get a random message and no cursor.
+    The pool is persisted to a JSON file after every refill; cursors go to a
+    separate file, written only by save().
+    """
+
+    def __init__(self, generate_fn, prompts, path="motivation_pool.json", cursors_path="motivation_cursors.json",
+                 low_watermark=5, refill_batch=10, max_size=200, max_users=10000, workers=2):
+        """
+        Args:
+            generate_fn (callable): f(prompt) -> message; should raise on failure
+                so error text is never stored in the pool
+            prompts (list): Prompts to keep pools for
+            path (str): JSON file the pool is persisted to (None disables)
+            cursors_path (str): JSON file the per-user cursors are persisted to (None disables)
+            low_watermark (int): Unseen messages left before a refill starts
+            refill_batch (int): Messages generated per refill
+            max_size (int): Messages kept per prompt; older ones are dropped
+            max_users (int): Users whose cursors are kept; least recently served are dropped
+            workers (int): Background generation threads
+        """
+        self.generate_fn = generate_fn
+        self.prompts = list(prompts)
+        self.path = path
+        self.cursors_path = cursors_path
+        self.low_watermark = low_watermark
+        self.refill_batch = refill_batch
+        self.max_size = max_size
+        self.max_users = max_users
+
+        self.lock = threading.Lock()
+        self.messages = {prompt: deque() for prompt in self.prompts}
+        self.base = {prompt: 0 for prompt in self.prompts}  # absolute index of messages[prompt][0]
+        self.cursors = OrderedDict()  # user_id -> {prompt: next absolute index}, least recently served first
+        self.refilling = set()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self._load()
+
+    def _load(self):
+        if self.path and os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for prompt, pool in data.get("pools", {}).items():
+                if prompt in self.messages:
+                    self.messages[prompt] = deque(pool["messages"])
+                    self.base[prompt] = pool["base"]
+        if self.cursors_path and os.path.exists(self.cursors_path):
+            with open(self.cursors_path, "r", encoding="utf-8") as f:
+                cursors = json.load(f)
+            self.cursors = OrderedDict(list(cursors.items())[-self.max_users:])
+
+    @staticmethod
+    def _write_json(path, data):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def save_pool(self):
+        """Write the message pool to disk"""
+        if not self.path:
+            return
+        with self.lock:
+            data = {"pools": {prompt: {"base": self.base[prompt], "messages": list(messages)}
+                              for prompt, messages in self.messages.items()}}
+        self._write_json(self.path, data)
+
+    def save(self):
+        """Write the pool and the per-user cursors to disk"""
+        self.save_pool()
+        if not self.cursors_path:
+            return
+        with self.lock:
+            data = {user: dict(cursors) for user, cursors in self.cursors.items()}
+        self._write_json(self.cursors_path, data)
+
+    def _refill(self, prompt):
+        """Generate a batch of messages for one prompt (runs in a worker thread)"""
+        try:
+            generated = []
+            for _ in range(self.refill_batch):
+                try:
+                    generated.append(self.generate_fn(prompt))
+                except Exception as e:
+                    print(f"(Could not pre-generate motivation: {e})")
+                    break
+            with self.lock:
+                messages = self.messages[prompt]
+                messages.extend(generated)
+                while len(messages) > self.max_size:
+                    messages.popleft()
+                    self.base[prompt] += 1
+        finally:
+            with self.lock:
+                self.refilling.discard(prompt)
+        self.save_pool()
+
+    def _schedule_refill(self, prompt):
+        """Start a background refill unless one is already running (call with lock held)"""
+        if prompt not in self.refilling:
+            self.refilling.add(prompt)
+            self.executor.submit(self._refill, prompt)
+
+    def start(self):
+        """Fill every prompt's pool up to the watermark in the background"""
+        with self.lock:
+            for prompt in self.prompts:
+                if len(self.messages[prompt]) < self.low_watermark:
+                    self._schedule_refill(prompt)
+
+    def serve(self, user_id=None, prompt=None):
+        """Return an unseen message for the user, or None if the pool is exhausted for them
+
+        Without a user_id any pooled message may be returned, and nothing is
+        tracked for the caller.
+        """
+        prompt = prompt or random.choice(self.prompts)
+        with self.lock:
+            messages = self.messages[prompt]
+            if user_id is None:
+                if len(messages) < self.low_watermark:
+                    self._schedule_refill(prompt)
+                return random.choice(messages) if messages else None
+
+            base = self.base[prompt]
+            end = base + len(messages)
+            user_cursors = self._user_cursors(str(user_id))
+            # Skip past messages already dropped from the front of the pool
+            position = max(user_cursors.get(prompt, base), base)
+
+            if end - position - 1 < self.low_watermark:
+                self._schedule_refill(prompt)
+            if position >= end:
+                return None
+
+            user_cursors[prompt] = position + 1
+            return messages[position - base]
+
+    def _user_cursors(self, user_id):
+        """The user's cursors, marked most recently used (call with lock held)"""
+        user_cursors = self.cursors.get(user_id)
+        if user_cursors is None:
+            user_cursors = self.cursors[user_id] = {}
+            if len(self.cursors) > self.max_users:
+                self.cursors.popitem(last=False)
+        else:
+            self.cursors.move_to_end(user_id)
+        return user_cursors
+
+    def forget(self, user_id):
+        """Drop a user's cursors, e.g. when their session expires"""
+        with self.lock:
+            self.cursors.pop(str(user_id), None)
+
+    def close(self):
+        """Wait for running refills and persist the pool and cursors"""
+        self.executor.shutdown(wait=True)
+        self.save()
@@ -0,0 +1,293 @@
+"""
+Multi-session Motivation Buddy server
+
+HTTP:      POST /chat   {"session_id": "...", "message": "..."} -> streamed plain text
+           GET  /daily?session_id=...  -> {"message": "..."} from the pre-generated pool
+WebSocket: GET  /ws?session_id=...  send {"message": "..."}, receive
+           {"type": "token", "content": "..."} chunks and then {"type": "done"}
+
+Run with:  python server.py [--port 8080] [--base-url http://localhost:9000]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+import uuid
+from collections import OrderedDict
+
+import httpx
+from aiohttp import web, WSMsgType
+from groq import AsyncGroq
+
+from conversation_memory import ConversationMemory
+from models import (SYSTEM_PROMPT, MODEL, SUMMARY_MODEL, DAILY_PROMPTS,
+                    build_summary_messages, generate_motivation, llm as sync_llm)
+from motivation_pool import MotivationPool
+
+
+class Session:
+    def __init__(self, session_id, max_concurrent):
+        self.id = session_id
+        self.memory = ConversationMemory(SYSTEM_PROMPT, token_budget=2000)
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.summarizing = False  # At most one background summary per session
+        self.last_used = time.monotonic()
+
+
+class SessionStore:
+    """Bounded LRU of sessions; idle sessions are evicted by a background sweep"""
+
+    def __init__(self, max_sessions=10000, idle_timeout=1800, max_concurrent_per_session=1, on_evict=None):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_concurrent_per_session = max_concurrent_per_session
+        self.on_evict = on_evict  # Called with the id of every dropped session
+        self.sessions = OrderedDict()
+
+    def _evict_oldest(self):
+        session_id, _ = self.sessions.popitem(last=False)
+        if self.on_evict:
+            self.on_evict(session_id)
+
+    def get(self, session_id=None):
+        """Fetch a session (creating it if needed) and mark it most recently used"""
+        session_id = session_id or uuid.uuid4().hex
+        session = self.sessions.get(session_id)
+        if session is None:
+            session = Session(session_id, self.max_concurrent_per_session)
+            self.sessions[session_id] = session
+            if len(self.sessions) > self.max_sessions:
+                self._evict_oldest()
+        else:
+            self.sessions.move_to_end(session_id)
+        session.last_used = time.monotonic()
+        return session
+
+    def evict_idle(self):
+        """Drop sessions idle for longer than idle_timeout; oldest are at the front"""
+        cutoff = time.monotonic() - self.idle_timeout
+        evicted = 0
+        while self.sessions:
+            session = next(iter(self.sessions.values()))
+            if session.last_used > cutoff:
+                break
+            self._evict_oldest()
+            evicted += 1
+        return evicted
+
+
+class MotivationServer:
+    def __init__(self, base_url=None, max_sessions=10000, idle_timeout=1800,
+                 max_concurrent_per_session=1, max_connections=100, pool_path="motivation_pool.json"):
+        # Session ids are random and die with the server, so cursors are not persisted;
+        # they are dropped together with their session. pool_path=None keeps the pool in
+        # memory only (load tests against a mock must not persist its replies)
+        self.pool = MotivationPool(generate_motivation, DAILY_PROMPTS, path=pool_path, cursors_path=None,
+                                   max_users=max_sessions)
+        self.sessions = SessionStore(max_sessions, idle_timeout, max_concurrent_per_session,
+                                     on_evict=self.pool.forget)
+        # One pooled HTTP client shared by every session
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections // 2),
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+        self.llm = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"), base_url=base_url,
+                             http_client=self.http_client)
+        self._background = set()
+
+    def _spawn(self, coro):
+        """Run a background task and keep a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _summarize(self, session):
+        """Fold evicted turns into the session summary without delaying replies
+
+        The caller sets session.summarizing before scheduling; it is cleared here.
+        """
+        evicted = session.memory.take_evicted()
+        try:
+            response = await self.llm.chat.completions.create(
+                model=SUMMARY_MODEL,
+                messages=build_summary_messages(session.memory.summary, evicted),
+                temperature=0.3,
+                max_tokens=200
+            )
+            session.memory.summary = response.choices[0].message.content.strip()
+        except Exception as e:
+            print(f"Summary failed for session {session.id}: {e}")
+            session.memory.restore_evicted(evicted)
+        finally:
+            session.summarizing = False
+
+    async def stream_reply(self, session, message):
+        """Yield reply tokens as they arrive and record the full turn in memory"""
+        session.memory.add("user", message)
+        parts = []
+        try:
+            stream = await self.llm.chat.completions.create(
+                model=MODEL,
+                messages=session.memory.messages(),
+                temperature=0.8,
+                max_tokens=300,
+                stream=True
+            )
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            # No reply to pair it with; keep the history alternating user/assistant
+            session.memory.discard_last()
+            yield f"Oops! Something went wrong: {str(e)}"
+            return
+
+        session.memory.add("assistant", "".join(parts))
+        if session.memory.needs_summary and not session.summarizing:
+            # Turns evicted meanwhile are picked up after the running summary finishes
+            session.summarizing = True
+            self._spawn(self._summarize(session))
+
+    async def handle_chat(self, request):
+        try:
+            payload = await request.json()
+        except json.JSONDecodeError:
+            return web.json_response({"error": "Body must be JSON"}, status=400)
+        if not isinstance(payload, dict):
+            return web.json_response({"error": "Body must be a JSON object"}, status=400)
+
+        message = payload.get("message") or ""
+        if not isinstance(message, str):
+            return web.json_response({"error": "'message' must be a string"}, status=400)
+        message = message.strip()
+        if not message:
+            return web.json_response({"error": "Please enter a message!"}, status=400)
+
+        session_id = payload.get("session_id")
+        if session_id is not None and not isinstance(session_id, str):
+            return web.json_response({"error": "'session_id' must be a string"}, status=400)
+
+        session = self.sessions.get(session_id)
+        if session.semaphore.locked():
+            return web.json_response({"error": "A reply is already in progress for this session"},
+                                     status=429)
+
+        async with session.semaphore:
+            response = web.StreamResponse(headers={
+                "Content-Type": "text/plain; charset=utf-8",
+                "X-Session-Id": session.id
+            })
+            await response.prepare(request)
+            async for token in self.stream_reply(session, message):
+                await response.write(token.encode("utf-8"))
+            await response.write_eof()
+            return response
+
+    async def handle_ws(self, request):
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+        session = self.sessions.get(request.query.get("session_id"))
+        await ws.send_json({"type": "session", "session_id": session.id})
+
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            try:
+                message = json.loads(msg.data).get("message", "").strip()
+            except (json.JSONDecodeError, AttributeError):
+                message = msg.data.strip()
+            if not message:
+                continue
+
+            session = self.sessions.get(session.id)
+            if session.semaphore.locked():
+                await ws.send_json({"type": "error", "content": "A reply is already in progress"})
+                continue
+            async with session.semaphore:
+                async for token in self.stream_reply(session, message):
+                    await ws.send_json({"type": "token", "content": token})
+                await ws.send_json({"type": "done"})
+        return ws
+
+    async def handle_daily(self, request):
+        # Anonymous requests get any pooled message and create no session or cursor
+        session_id = request.query.get("session_id")
+        session = self.sessions.get(session_id) if session_id else None
+        prompt = random.choice(DAILY_PROMPTS)
+        message = self.pool.serve(session.id if session else None, prompt)
+        if message is None:
+            # Pool exhausted for this user; a refill is already scheduled
+            try:
+                response = await self.llm.chat.completions.create(
+                    model=MODEL,
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.8,
+                    max_tokens=300
+                )
+                message = response.choices[0].message.content
+            except Exception as e:
+                return web.json_response({"error": f"Oops! Something went wrong: {str(e)}"}, status=502)
+        return web.json_response({"session_id": session.id if session else None, "message": message})
+
+    async def handle_stats(self, request):
+        return web.json_response({
+            "sessions": len(self.sessions.sessions),
+            "background_tasks": len(self._background),
+            "pool_llm": sync_llm.stats()
+        })
+
+    async def _sweep_idle(self, app):
+        while True:
+            await asyncio.sleep(60)
+            evicted = self.sessions.evict_idle()
+            if evicted:
+                print(f"Evicted {evicted} idle sessions")
+
+    async def _on_startup(self, app):
+        app["sweeper"] = asyncio.create_task(self._sweep_idle(app))
+        self.pool.start()
+
+    async def _on_cleanup(self, app):
+        app["sweeper"].cancel()
+        await asyncio.to_thread(self.pool.close)
+        await self.http_client.aclose()
+
+    def make_app(self):
+        app = web.Application()
+        app.router.add_post("/chat", self.handle_chat)
+        app.router.add_get("/ws", self.handle_ws)
+        app.router.add_get("/daily", self.handle_daily)
+        app.router.add_get("/stats", self.handle_stats)
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Motivation Buddy to many users at once")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--base-url", default=os.getenv("GROQ_BASE_URL"),
+                        help="Override the Groq API URL (e.g. a local mock for load tests)")
+    parser.add_argument("--max-sessions", type=int, default=10000)
+    parser.add_argument("--idle-timeout", type=int, default=1800, help="Seconds before an idle session is dropped")
+    parser.add_argument("--max-concurrent-per-session", type=int, default=1)
+    parser.add_argument("--pool-path", default="motivation_pool.json",
+                        help="JSON file the daily message pool is persisted to")
+    args = parser.parse_args()
+
+    server = MotivationServer(args.base_url, args.max_sessions, args.idle_timeout,
+                              args.max_concurrent_per_session, pool_path=args.pool_path)
+    web.run_app(server.make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
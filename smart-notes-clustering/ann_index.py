@@ -0,0 +1,210 @@
+import hashlib
+import os
+import numpy as np
+
+
+def normalize_rows(matrix):
+    """Return a contiguous float32 copy of the matrix with unit-length rows"""
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def fingerprint(embeddings, centroids=None, chunk_size=65536):
+    """Hash of the vectors (and centroids) an index was built from, read in chunks"""
+    digest = hashlib.sha1(f"{embeddings.shape}".encode('utf-8'))
+    for start in range(0, len(embeddings), chunk_size):
+        digest.update(np.ascontiguousarray(embeddings[start:start + chunk_size], dtype=np.float32).tobytes())
+    if centroids is not None:
+        digest.update(np.ascontiguousarray(centroids, dtype=np.float32).tobytes())
+    return digest.hexdigest()
+
+
+class IVFIndex:
+    """Inverted-file index: notes are bucketed by their nearest centroid and a
+    query only scores the buckets of its n_probe closest centroids."""
+
+    uses_centroids = True
+
+    def __init__(self, n_lists=None, n_probe=8, chunk_size=65536, random_state=42):
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.chunk_size = chunk_size
+        self.random_state = random_state
+        self.centroids = None
+        self.order = None
+        self.offsets = None
+        self.embeddings = None
+
+    def _train_centroids(self, embeddings):
+        """Fit coarse centroids on a sample when none were supplied"""
+        from sklearn.cluster import MiniBatchKMeans
+
+        n_lists = self.n_lists or max(1, int(np.sqrt(len(embeddings))))
+        rng = np.random.default_rng(self.random_state)
+        sample_size = min(len(embeddings), n_lists * 64)
+        sample = embeddings[rng.choice(len(embeddings), sample_size, replace=False)]
+
+        kmeans = MiniBatchKMeans(n_clusters=n_lists, random_state=self.random_state, n_init=3)
+        kmeans.fit(sample)
+        return kmeans.cluster_centers_
+
+    def _assign(self, embeddings):
+        """Nearest centroid of every row, computed in chunks to bound memory"""
+        assignments = np.empty(len(embeddings), dtype=np.int32)
+        for start in range(0, len(embeddings), self.chunk_size):
+            block = embeddings[start:start + self.chunk_size]
+            assignments[start:start + len(block)] = np.argmax(block @ self.centroids.T, axis=1)
+        return assignments
+
+    def build(self, embeddings, centroids=None):
+        """Build the inverted lists; embeddings must already be unit-normalized"""
+        self.embeddings = embeddings
+        if centroids is None:
+            centroids = self._train_centroids(embeddings)
+        self.centroids = normalize_rows(centroids)
+        self.n_lists = len(self.centroids)
+
+        assignments = self._assign(embeddings)
+        self.order = np.argsort(assignments, kind='stable').astype(np.int64)
+        counts = np.bincount(assignments, minlength=self.n_lists)
+        self.offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        return self
+
+    def search(self, queries, top_k, n_probe=None):
+        """Return (rows, similarities) arrays of shape (n_queries, top_k), padded with -1"""
+        n_probe = min(n_probe or self.n_probe, self.n_lists)
+        probes = np.argpartition(-(queries @ self.centroids.T), n_probe - 1, axis=1)[:, :n_probe]
+
+        rows_out = np.full((len(queries), top_k), -1, dtype=np.int64)
+        scores_out = np.full((len(queries), top_k), -np.inf, dtype=np.float32)
+
+        for i, query in enumerate(queries):
+            candidates = np.concatenate([
+                self.order[self.offsets[c]:self.offsets[c + 1]] for c in probes[i]
+            ])
+            if len(candidates) == 0:
+                continue
+
+            similarities = self.embeddings[candidates] @ query
+            k = min(top_k, len(candidates))
+            best = np.argpartition(-similarities, k - 1)[:k]
+            best = best[np.argsort(-similarities[best], kind='stable')]
+
+            rows_out[i, :k] = candidates[best]
+            scores_out[i, :k] = similarities[best]
+
+        return rows_out, scores_out
+
+    def save(self, path):
+        """Persist centroids and inverted lists (vectors are not duplicated)"""
+        with open(path, 'wb') as f:
+            np.savez(f, centroids=self.centroids, order=self.order,
+                     offsets=self.offsets, n_probe=self.n_probe)
+
+    def load(self, path, embeddings):
+        """Load a saved index and attach it to the matching embeddings"""
+        data = np.load(path)
+        if len(data['order']) != len(embeddings):
+            raise ValueError("Saved IVF index does not match the number of embeddings")
+        self.centroids = data['centroids']
+        self.order = data['order']
+        self.offsets = data['offsets']
+        self.n_probe = int(data['n_probe'])
+        self.n_lists = len(self.centroids)
+        self.embeddings = embeddings
+        return self
+
+
+class HNSWIndex:
+    """Hierarchical navigable small-world graph backed by hnswlib"""
+
+    uses_centroids = False
+
+    def __init__(self, m=16, ef_construction=200, ef_search=64, num_threads=-1):
+        try:
+            import hnswlib
+        except ImportError:
+            raise ImportError("HNSW index requires hnswlib: pip install hnswlib")
+
+        self._hnswlib = hnswlib
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.num_threads = num_threads
+        self.index = None
+
+    def build(self, embeddings, centroids=None):
+        """Insert every row into the graph; centroids are not used by HNSW"""
+        self.index = self._hnswlib.Index(space='ip', dim=embeddings.shape[1])
+        self.index.init_index(max_elements=len(embeddings), M=self.m,
+                              ef_construction=self.ef_construction)
+        self.index.add_items(embeddings, np.arange(len(embeddings)), num_threads=self.num_threads)
+        self.index.set_ef(self.ef_search)
+        return self
+
+    def search(self, queries, top_k, ef_search=None):
+        """Return (rows, similarities) arrays of shape (n_queries, top_k)"""
+        top_k = min(top_k, self.index.get_current_count())
+        self.index.set_ef(max(ef_search or self.ef_search, top_k))
+        rows, distances = self.index.knn_query(queries, k=top_k, num_threads=self.num_threads)
+        # hnswlib reports inner-product distance as 1 - similarity
+        return rows.astype(np.int64), (1.0 - distances).astype(np.float32)
+
+    def save(self, path):
+        """Persist the graph"""
+        self.index.save_index(path)
+
+    def load(self, path, embeddings):
+        """Load a saved graph for the given embeddings"""
+        self.index = self._hnswlib.Index(space='ip', dim=embeddings.shape[1])
+        self.index.load_index(path, max_elements=len(embeddings))
+        if self.index.get_current_count() != len(embeddings):
+            raise ValueError("Saved HNSW index does not match the number of embeddings")
+        self.index.set_ef(self.ef_search)
+        return self
+
+
+INDEX_TYPES = {
+    'ivf': IVFIndex,
+    'hnsw': HNSWIndex,
+}
+
+
+def build_index(index_type, embeddings, centroids=None, path=None, **params):
+    """
+    Create an ANN index, loading it from path if it was saved before
+
+    A fingerprint of the embeddings (and, for IVF, the supplied centroids) is
+    saved next to the index in <path>.fingerprint; a saved index is only
+    reused when it matches, so edited notes or re-clustered centroids
+    trigger a rebuild instead of searching stale lists or graphs.
+    """
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"Unknown index type '{index_type}'. Choose from: {', '.join(INDEX_TYPES)}")
+
+    index = INDEX_TYPES[index_type](**params)
+    if not path:
+        return index.build(embeddings, centroids=centroids)
+
+    expected = fingerprint(embeddings, centroids if index.uses_centroids else None)
+    fingerprint_path = f"{path}.fingerprint"
+    if os.path.exists(path) and os.path.exists(fingerprint_path):
+        with open(fingerprint_path, 'r') as f:
+            saved = f.read().strip()
+        if saved == expected:
+            try:
+                return index.load(path, embeddings)
+            except (ValueError, RuntimeError) as e:
+                print(f"Rebuilding index: {e}")
+        else:
+            print("Rebuilding index: embeddings or centroids changed since it was saved")
+
+    index.build(embeddings, centroids=centroids)
+    index.save(path)
+    with open(fingerprint_path, 'w') as f:
+        f.write(expected)
+    return index
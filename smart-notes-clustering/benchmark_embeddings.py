@@ -0,0 +1,64 @@
+"""
+Throughput of local note embedding: one process vs. the multi-process encode pool
+
+SentenceTransformer.encode() already sorts its inputs by length, so the
+explicit length sort only matters in the pool, where the input is split into
+chunks across workers; the pool is timed with and without it.
+"""
+import argparse
+import random
+import time
+from embeddings import NoteEmbedder
+
+WORDS = ("machine learning data model python cloud docker network vision language "
+         "cluster search index vector query server database training deploy api").split()
+
+
+def make_synthetic_notes(n_notes, seed=0):
+    """Notes of very uneven length, like a real archive of quick jots and long write-ups"""
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(int(rng.paretovariate(1.2) * 8)))[:2000]
+        for _ in range(n_notes)
+    ]
+
+
+def measure(embedder, texts):
+    start = time.perf_counter()
+    embedder.get_embeddings_local(texts)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark local note embedding throughput")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    configs = [
+        ("1 proc", dict(num_workers=0)),
+        (f"{args.workers} procs", dict(sort_by_length=False, num_workers=args.workers)),
+        (f"{args.workers} procs sorted", dict(sort_by_length=True, num_workers=args.workers)),
+    ]
+
+    embedders = {
+        name: NoteEmbedder(batch_size=args.batch_size, query_cache_path=None, **params)
+        for name, params in configs
+    }
+    # Warm up model loading and worker start-up so they are not timed
+    for embedder in embedders.values():
+        embedder.get_embeddings_local(make_synthetic_notes(args.batch_size * max(args.workers, 1)))
+
+    print(f"{'notes':>8} | " + " | ".join(f"{name:>18}" for name, _ in configs) + "   (notes/sec)")
+    for n_notes in args.sizes:
+        texts = make_synthetic_notes(n_notes)
+        rates = [measure(embedders[name], texts) for name, _ in configs]
+        print(f"{n_notes:>8} | " + " | ".join(f"{rate:>18.1f}" for rate in rates))
+
+    for embedder in embedders.values():
+        embedder.close()
+
+
+if __name__ == "__main__":
+    main()
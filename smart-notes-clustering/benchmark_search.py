@@ -0,0 +1,85 @@
+import argparse
+import time
+import numpy as np
+from search import SemanticSearch
+
+
+def make_synthetic_embeddings(n_vectors, dim, n_topics=256, seed=0):
+    """Clustered synthetic embeddings, closer to real notes than uniform noise"""
+    rng = np.random.default_rng(seed)
+    topics = rng.normal(size=(n_topics, dim)).astype(np.float32)
+    assignments = rng.integers(0, n_topics, n_vectors)
+
+    embeddings = np.empty((n_vectors, dim), dtype=np.float32)
+    chunk = 100000
+    for start in range(0, n_vectors, chunk):
+        stop = min(start + chunk, n_vectors)
+        noise = rng.normal(scale=0.6, size=(stop - start, dim)).astype(np.float32)
+        embeddings[start:stop] = topics[assignments[start:stop]] + noise
+
+    return embeddings
+
+
+def recall_at_k(approx, exact, k):
+    """Fraction of the exact top-k note ids that the approximate search found"""
+    hits = 0
+    for approx_results, exact_results in zip(approx, exact):
+        exact_ids = {r['note_id'] for r in exact_results[:k]}
+        hits += len(exact_ids & {r['note_id'] for r in approx_results[:k]})
+    return hits / (len(exact) * k)
+
+
+def time_queries(searcher, queries, top_k, exact):
+    """Run one query at a time, the way an interactive search does"""
+    start = time.perf_counter()
+    results = [searcher.search_many(q, top_k, exact=exact)[0] for q in queries]
+    elapsed = time.perf_counter() - start
+    return results, len(queries) / elapsed
+
+
+def run_benchmark(n_vectors, dim, n_queries, top_k, backends, n_probe):
+    print(f"\n=== {n_vectors:,} vectors x {dim} dims ===")
+    embeddings = make_synthetic_embeddings(n_vectors, dim)
+    rng = np.random.default_rng(1)
+    queries = embeddings[rng.choice(n_vectors, n_queries, replace=False)]
+    queries = queries + rng.normal(scale=0.3, size=queries.shape).astype(np.float32)
+
+    note_ids = np.arange(n_vectors)
+    texts = note_ids  # texts are not needed for timing
+
+    exact_searcher = SemanticSearch(embeddings, texts, note_ids)
+    exact_results, exact_qps = time_queries(exact_searcher, queries, top_k, exact=True)
+    print(f"{'exact':>6}: recall@{top_k}=1.000  {exact_qps:10.1f} queries/sec")
+
+    for backend in backends:
+        params = {'n_probe': n_probe} if backend == 'ivf' else {}
+        start = time.perf_counter()
+        try:
+            searcher = SemanticSearch(embeddings, texts, note_ids, index=backend, **params)
+        except ImportError as e:
+            print(f"{backend:>6}: skipped ({e})")
+            continue
+        build_time = time.perf_counter() - start
+
+        results, qps = time_queries(searcher, queries, top_k, exact=False)
+        recall = recall_at_k(results, exact_results, top_k)
+        print(f"{backend:>6}: recall@{top_k}={recall:.3f}  {qps:10.1f} queries/sec  "
+              f"(build {build_time:.1f}s, {qps / exact_qps:.1f}x exact)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ANN search against exact search")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100000, 1000000])
+    parser.add_argument('--dim', type=int, default=128)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--top-k', type=int, default=10)
+    parser.add_argument('--backends', nargs='+', default=['ivf', 'hnsw'])
+    parser.add_argument('--n-probe', type=int, default=8)
+    args = parser.parse_args()
+
+    for n_vectors in args.sizes:
+        run_benchmark(n_vectors, args.dim, args.queries, args.top_k, args.backends, args.n_probe)
+
+
+if __name__ == "__main__":
+    main()
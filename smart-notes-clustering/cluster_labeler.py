@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from config import (llm, GROQ_MODEL, LABEL_NOTES_PER_CLUSTER,
+                    LABEL_MAX_WORKERS, LABEL_CACHE_PATH)
+
+
+def _id_hash(note_id):
+    """64-bit stable hash of a note id"""
+    return int.from_bytes(hashlib.sha1(str(note_id).encode('utf-8')).digest()[:8], 'big')
+
+
+class ClusterLabeler:
+    """Name and summarize clusters with one LLM call per cluster.
+
+    Labels are cached by a hash of each cluster's member ids. A cluster whose
+    members changed only slightly since the last run (estimated Jaccard
+    similarity of bottom-k sketches >= 1 - change_threshold) keeps its label,
+    so only materially changed clusters are sent to the LLM again.
+    """
+
+    SKETCH_SIZE = 256
+
+    def __init__(self, notes_per_cluster=LABEL_NOTES_PER_CLUSTER, max_workers=LABEL_MAX_WORKERS,
+                 cache_path=LABEL_CACHE_PATH, change_threshold=0.2, model=GROQ_MODEL):
+        self.notes_per_cluster = notes_per_cluster
+        self.max_workers = max_workers
+        self.cache_path = cache_path
+        self.change_threshold = change_threshold
+        self.model = model
+        self.cache = self._load_cache()
+
+    def _load_cache(self):
+        if self.cache_path and os.path.exists(self.cache_path):
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.cache, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def _membership(self, member_ids):
+        """Exact membership hash plus a bottom-k sketch for estimating overlap"""
+        hashes = np.unique(np.fromiter((_id_hash(i) for i in member_ids), dtype=np.uint64,
+                                       count=len(member_ids)))
+        membership_hash = hashlib.sha1(hashes.tobytes()).hexdigest()
+        return membership_hash, hashes[:self.SKETCH_SIZE].tolist()
+
+    def _similarity(self, sketch_a, sketch_b):
+        """Estimated Jaccard similarity of two member sets from their bottom-k sketches"""
+        union = sorted(set(sketch_a) | set(sketch_b))[:self.SKETCH_SIZE]
+        if not union:
+            return 1.0
+        a, b = set(sketch_a), set(sketch_b)
+        return sum(1 for h in union if h in a and h in b) / len(union)
+
+    def _find_cached(self, membership_hash, sketch):
+        """Label from a previous run for the same or an almost identical cluster"""
+        if membership_hash in self.cache:
+            return self.cache[membership_hash]
+
+        best, best_similarity = None, 1.0 - self.change_threshold
+        for entry in self.cache.values():
+            similarity = self._similarity(sketch, entry['sketch'])
+            if similarity >= best_similarity:
+                best, best_similarity = entry, similarity
+        return best
+
+    def representative_notes(self, embeddings, labels, centroids, cluster_id):
+        """Rows of the notes closest to the cluster centroid, nearest first"""
+        rows = np.flatnonzero(labels == cluster_id)
+        distances = np.linalg.norm(np.asarray(embeddings[rows]) - centroids[cluster_id], axis=1)
+        n = min(self.notes_per_cluster, len(rows))
+        nearest = np.argpartition(distances, n - 1)[:n]
+        return rows[nearest[np.argsort(distances[nearest])]]
+
+    def _ask_llm(self, notes):
+        """One batched prompt containing every representative note of a cluster"""
+        note_list = "\n".join(f"- {note[:500]}" for note in notes)
+        prompt = f"""
+        The following notes belong to the same topic cluster:
+
+        {note_list}
+
+        Respond with JSON only, in the form:
+        {{"label": "<2-5 word topic name>", "summary": "<one sentence describing the cluster>"}}
+        """
+
+        response = llm.create(
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You name and summarize groups of personal notes concisely."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.2,
+            max_tokens=120
+        )
+
+        content = response.choices[0].message.content.strip()
+        try:
+            result = json.loads(content[content.index('{'):content.rindex('}') + 1])
+            return {'label': result['label'], 'summary': result.get('summary', '')}
+        except (ValueError, KeyError):
+            return {'label': content.splitlines()[0][:60], 'summary': ''}
+
+    def label_clusters(self, embeddings, labels, centroids, texts, note_ids):
+        """Return {cluster_id: {'label', 'summary', 'cached'}} for every cluster"""
+        labels = np.asarray(labels)
+        results = {}
+        pending = {}
+        # Only this run's clusters are kept, so the next run compares against them
+        current = {}
+
+        for cluster_id in np.unique(labels):
+            cluster_id = int(cluster_id)
+            members = [note_ids[i] for i in np.flatnonzero(labels == cluster_id)]
+            membership_hash, sketch = self._membership(members)
+
+            cached = self._find_cached(membership_hash, sketch)
+            if cached:
+                results[cluster_id] = {'label': cached['label'], 'summary': cached['summary'], 'cached': True}
+                current[membership_hash] = dict(cached, sketch=sketch)
+            else:
+                rows = self.representative_notes(embeddings, labels, centroids, cluster_id)
+                pending[cluster_id] = (membership_hash, sketch, [texts[i] for i in rows])
+
+        if pending:
+            print(f"Labeling {len(pending)} clusters ({len(results)} reused from cache)...")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    cluster_id: executor.submit(self._ask_llm, notes)
+                    for cluster_id, (_, _, notes) in pending.items()
+                }
+                for cluster_id, future in futures.items():
+                    membership_hash, sketch, _ = pending[cluster_id]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"  ⚠️ Could not label cluster {cluster_id}: {e}")
+                        results[cluster_id] = {'label': f"Cluster {cluster_id}", 'summary': '', 'cached': False}
+                        continue
+                    current[membership_hash] = dict(result, sketch=sketch)
+                    results[cluster_id] = dict(result, cached=False)
+
+        self.cache = current
+        self._save_cache()
+        return results
@@ -0,0 +1,182 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+import numpy as np
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import silhouette_score
+
+
+class NoteClustering:
+    def __init__(self, method='kmeans', n_clusters=4, batch_size=4096, k_range=(2, 12),
+                 silhouette_sample_size=5000, chunk_size=65536, n_epochs=5, random_state=42, profile=False):
+        """Cluster note embeddings
+
+        Args:
+            method (str): 'kmeans' (full, in-memory) or 'minibatch' (streaming, supports partial_fit)
+            n_clusters (int or str): Number of clusters, or 'auto' to pick k by sampled silhouette score
+            batch_size (int): Rows per mini-batch update
+            k_range (tuple): Inclusive range of k values tried when n_clusters='auto'
+            silhouette_sample_size (int): Notes sampled to score each candidate k
+            chunk_size (int): Rows processed at a time when streaming over the embeddings
+            n_epochs (int): Passes over the data when a 'minibatch' fit is larger than chunk_size
+            profile (bool): Track peak Python memory per phase (time is always recorded)
+        """
+        if method not in ('kmeans', 'minibatch'):
+            raise ValueError("method must be 'kmeans' or 'minibatch'")
+
+        self.method = method
+        self.n_clusters = n_clusters
+        self.batch_size = batch_size
+        self.k_range = k_range
+        self.silhouette_sample_size = silhouette_sample_size
+        self.chunk_size = chunk_size
+        self.n_epochs = n_epochs
+        self.random_state = random_state
+        self.profile = profile
+
+        self.model = None
+        self.labels = None
+        self.phase_stats = {}
+
+    @contextmanager
+    def _phase(self, name):
+        """Record wall time (and peak traced memory when profiling) for one phase"""
+        if self.profile:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats = {'seconds': time.perf_counter() - start}
+            if self.profile:
+                stats['peak_mb'] = tracemalloc.get_traced_memory()[1] / 1e6
+                tracemalloc.stop()
+            self.phase_stats[name] = stats
+
+    def print_phase_report(self):
+        """Print the time and memory recorded for each phase"""
+        for name, stats in self.phase_stats.items():
+            line = f"  {name:<12} {stats['seconds']:8.2f}s"
+            if 'peak_mb' in stats:
+                line += f"  peak {stats['peak_mb']:8.1f} MB"
+            print(line)
+
+    @property
+    def centroids(self):
+        """Cluster centers of the fitted model (reusable as an IVF quantizer)"""
+        return None if self.model is None else self.model.cluster_centers_
+
+    def _sample(self, embeddings, size):
+        """Random rows of the embeddings without loading the full matrix"""
+        if len(embeddings) <= size:
+            return np.asarray(embeddings)
+        rng = np.random.default_rng(self.random_state)
+        rows = np.sort(rng.choice(len(embeddings), size, replace=False))
+        return np.asarray(embeddings[rows])
+
+    def _new_model(self, n_clusters):
+        if self.method == 'minibatch':
+            return MiniBatchKMeans(n_clusters=n_clusters, batch_size=self.batch_size,
+                                   random_state=self.random_state, n_init=3)
+        return KMeans(n_clusters=n_clusters, random_state=self.random_state, n_init=10)
+
+    def select_k(self, embeddings):
+        """Pick the number of clusters with the best silhouette score on a sample"""
+        sample = self._sample(embeddings, self.silhouette_sample_size)
+        low, high = self.k_range
+        high = min(high, len(sample) - 1)
+
+        best_k, best_score = low, -1.0
+        for k in range(low, high + 1):
+            labels = MiniBatchKMeans(n_clusters=k, batch_size=self.batch_size,
+                                     random_state=self.random_state, n_init=3).fit_predict(sample)
+            score = silhouette_score(sample, labels)
+            if score > best_score:
+                best_k, best_score = k, score
+
+        print(f"Selected k={best_k} (silhouette {best_score:.3f} on {len(sample)} sampled notes)")
+        return best_k
+
+    def cluster_notes(self, embeddings):
+        """Fit the clustering model and return a label for every note"""
+        if self.n_clusters == 'auto':
+            with self._phase('select_k'):
+                self.n_clusters = self.select_k(embeddings)
+
+        self.model = self._new_model(self.n_clusters)
+        with self._phase('fit'):
+            if self.method == 'minibatch' and len(embeddings) > self.chunk_size:
+                self._fit_streaming(embeddings)
+            else:
+                # Fits within one chunk, so load it and let the model run its full schedule
+                self.model.fit(np.asarray(embeddings))
+
+        with self._phase('assign'):
+            self.labels = self.assign(embeddings)
+        return self.labels
+
+    def _fit_streaming(self, embeddings):
+        """
+        Fit on an archive larger than chunk_size with several epochs of mini-batch updates
+
+        Only one chunk is loaded at a time; rows are shuffled within each chunk
+        and fed to partial_fit in batch_size slices, so the model sees as many
+        updates as MiniBatchKMeans.fit would rather than one per chunk.
+        """
+        rng = np.random.default_rng(self.random_state)
+        for _ in range(self.n_epochs):
+            for start in rng.permutation(range(0, len(embeddings), self.chunk_size)):
+                chunk = np.asarray(embeddings[start:start + self.chunk_size])
+                chunk = chunk[rng.permutation(len(chunk))]
+                for batch_start in range(0, len(chunk), self.batch_size):
+                    batch = chunk[batch_start:batch_start + self.batch_size]
+                    if not hasattr(self.model, 'cluster_centers_') and len(batch) < self.n_clusters:
+                        continue  # too small to initialise the centroids
+                    self.model.partial_fit(batch)
+
+    def partial_fit(self, new_embeddings):
+        """Update the centroids with newly arrived notes and return their labels"""
+        if self.method != 'minibatch':
+            raise ValueError("partial_fit requires method='minibatch'")
+        if self.model is None:
+            if self.n_clusters == 'auto':
+                raise ValueError("Run cluster_notes first when n_clusters='auto'")
+            self.model = self._new_model(self.n_clusters)
+            self.labels = np.empty(0, dtype=np.int32)
+
+        if not hasattr(self.model, 'cluster_centers_') and len(new_embeddings) < self.n_clusters:
+            raise ValueError(f"The first batch needs at least {self.n_clusters} notes")
+
+        with self._phase('partial_fit'):
+            self.model.partial_fit(np.asarray(new_embeddings))
+
+        new_labels = self.assign(new_embeddings)
+        self.labels = np.concatenate([self.labels, new_labels])
+        return new_labels
+
+    def assign(self, embeddings):
+        """Label notes with their nearest existing centroid, without re-clustering"""
+        labels = np.empty(len(embeddings), dtype=np.int32)
+        for start in range(0, len(embeddings), self.chunk_size):
+            chunk = np.asarray(embeddings[start:start + self.chunk_size])
+            labels[start:start + len(chunk)] = self.model.predict(chunk)
+        return labels
+
+    def get_cluster_info(self, embeddings):
+        """Size and mean distance to centroid of each cluster, from the stored labels"""
+        with self._phase('cluster_info'):
+            sizes = np.bincount(self.labels, minlength=self.n_clusters)
+            distance_sums = np.zeros(self.n_clusters)
+            for start in range(0, len(embeddings), self.chunk_size):
+                chunk = np.asarray(embeddings[start:start + self.chunk_size])
+                chunk_labels = self.labels[start:start + len(chunk)]
+                distances = np.linalg.norm(chunk - self.centroids[chunk_labels], axis=1)
+                distance_sums += np.bincount(chunk_labels, weights=distances, minlength=self.n_clusters)
+
+        return {
+            cluster_id: {
+                'size': int(sizes[cluster_id]),
+                'avg_distance': float(distance_sums[cluster_id] / sizes[cluster_id]) if sizes[cluster_id] else 0.0
+            }
+            for cluster_id in range(self.n_clusters)
+        }
@@ -0,0 +1,27 @@
+import os
+from dotenv import load_dotenv
+
+from common.llm_client import get_llm
+
+load_dotenv()
+
+# Groq API Configuration
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+# Shared client: chat calls go through llm (rate limited, retried); client is its
+# pooled Groq SDK client for endpoints the wrapper does not cover (embeddings)
+llm = get_llm(GROQ_API_KEY)
+client = llm.client
+
+# Embedding Configuration
+EMBEDDING_BACKEND = "local"  # 'local' or 'groq'; notes and queries always use the same one
+GROQ_EMBEDDING_MODEL = "nomic-embed-text-v1_5"
+LOCAL_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_BATCH_SIZE = 64
+EMBEDDING_WORKERS = 0  # >1 starts a multi-process CPU encode pool
+QUERY_CACHE_PATH = "query_cache.sqlite3"
+
+# Cluster Labeling Configuration
+GROQ_MODEL = "llama-3.1-8b-instant"  # Fast model, good enough for short labels
+LABEL_NOTES_PER_CLUSTER = 8
+LABEL_MAX_WORKERS = 4
+LABEL_CACHE_PATH = "cluster_labels.json"
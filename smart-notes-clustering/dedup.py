@@ -0,0 +1,145 @@
+import re
+import zlib
+from collections import defaultdict
+from itertools import combinations
+import numpy as np
+
+# Smallest prime above 2^32; with 32-bit shingle hashes and a < 2^32, a * x fits in uint64
+_PRIME = np.uint64(4294967311)
+
+
+class NoteDeduplicator:
+    """Collapse near-duplicate notes with MinHash signatures and LSH banding.
+
+    Each note is reduced to a MinHash signature over its character shingles.
+    Signatures are split into bands; notes sharing any band land in the same
+    bucket and become candidate pairs, so only those pairs are compared instead
+    of all n^2. Candidates whose estimated Jaccard similarity reaches the
+    threshold are merged, and the first note of each group represents it.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=128, bands=32, shingle_size=5, max_bucket_size=50, seed=42):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_bucket_size = max_bucket_size
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 1 << 32, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, num_perm, dtype=np.uint64)
+
+        self.groups = {}
+        self.representative_of = {}
+
+    def _shingles(self, text):
+        """Hashes of the overlapping character n-grams of the normalized text"""
+        text = re.sub(r'\s+', ' ', text.lower()).strip()
+        if len(text) <= self.shingle_size:
+            return np.array([zlib.crc32(text.encode('utf-8'))], dtype=np.uint64)
+        return np.unique(np.fromiter(
+            (zlib.crc32(text[i:i + self.shingle_size].encode('utf-8'))
+             for i in range(len(text) - self.shingle_size + 1)),
+            dtype=np.uint64
+        ))
+
+    def signature(self, text):
+        """MinHash signature: the minimum of each permuted shingle hash"""
+        shingles = self._shingles(text)
+        permuted = (np.outer(self._a, shingles) % _PRIME + self._b[:, None]) % _PRIME
+        return permuted.min(axis=1)
+
+    def signatures(self, texts):
+        """Signature matrix with one row per text"""
+        if not texts:
+            return np.empty((0, self.num_perm), dtype=np.uint64)
+        return np.vstack([self.signature(text) for text in texts])
+
+    def candidate_pairs(self, signatures):
+        """Pairs of rows that share at least one LSH band
+
+        Every pair within a bucket is a candidate. A bucket larger than
+        max_bucket_size (typically many copies of the same note) has all
+        pairs among its first max_bucket_size rows checked, and every later
+        row paired with each of those, so the work stays linear in the
+        bucket size.
+        """
+        pairs = set()
+        for band in range(self.bands):
+            start = band * self.rows_per_band
+            buckets = defaultdict(list)
+            for row, band_values in enumerate(signatures[:, start:start + self.rows_per_band]):
+                buckets[band_values.tobytes()].append(row)
+            for rows in buckets.values():
+                head, tail = rows[:self.max_bucket_size], rows[self.max_bucket_size:]
+                pairs.update(combinations(head, 2))
+                pairs.update((row, other) for row in head for other in tail)
+        return pairs
+
+    def find_groups(self, texts):
+        """Lists of row indices that are near-duplicates of each other"""
+        signatures = self.signatures(texts)
+        parent = list(range(len(texts)))
+
+        def find(row):
+            while parent[row] != row:
+                parent[row] = parent[parent[row]]
+                row = parent[row]
+            return row
+
+        for a, b in self.candidate_pairs(signatures):
+            if np.mean(signatures[a] == signatures[b]) >= self.threshold:
+                root_a, root_b = find(a), find(b)
+                if root_a != root_b:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        groups = defaultdict(list)
+        for row in range(len(texts)):
+            groups[find(row)].append(row)
+        return list(groups.values())
+
+    def collapse(self, texts, note_ids):
+        """Keep one note per near-duplicate group and remember every original id"""
+        self.groups = {}
+        self.representative_of = {}
+        keep = []
+        for rows in sorted(self.find_groups(texts), key=lambda rows: rows[0]):
+            keep.append(rows[0])
+            if len(rows) == 1:
+                continue
+            # Only groups with duplicates are recorded; unique notes map to themselves
+            representative = note_ids[rows[0]]
+            self.groups[representative] = [note_ids[row] for row in rows]
+            for row in rows[1:]:
+                self.representative_of[note_ids[row]] = representative
+
+        removed = len(texts) - len(keep)
+        if removed:
+            print(f"Collapsed {removed} near-duplicate notes ({len(keep)} unique)")
+        return [texts[row] for row in keep], [note_ids[row] for row in keep]
+
+    def representative(self, note_id):
+        """Id of the kept note that stands in for note_id"""
+        return self.representative_of.get(note_id, note_id)
+
+    def expand_ids(self, note_id):
+        """Every original note id represented by a kept note"""
+        return self.groups.get(note_id, [note_id])
+
+    def expand_results(self, results):
+        """Add the ids of collapsed duplicates to search results"""
+        for result in results:
+            result['duplicate_ids'] = [i for i in self.expand_ids(result['note_id']) if i != result['note_id']]
+        return results
+
+    def expand_labels(self, note_ids, labels):
+        """Cluster label of every original note, including collapsed duplicates"""
+        return {
+            original: int(label)
+            for note_id, label in zip(note_ids, labels)
+            for original in self.expand_ids(note_id)
+        }
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import os
+import numpy as np
+from ann_index import normalize_rows
+
+
+class EmbeddingStore:
+    """Persistent note embeddings kept in a memory-mapped matrix on disk.
+
+    Layout of the store directory:
+        embeddings.bin  raw row-major matrix (float32 or float16)
+        index.json      note id -> row, content hash per note, dim, dtype and model
+
+    Only new or edited notes are embedded on sync; everything else is read
+    straight from the memory map, so separate processes share the same pages.
+    Rows are stored with unit length, so cosine search can use the map as is.
+    A store opened for a different model than the one that wrote it is
+    cleared and rebuilt, since vectors from two models cannot be compared.
+    """
+
+    DATA_FILE = 'embeddings.bin'
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, directory='embedding_store', dtype='float32', model=None):
+        if np.dtype(dtype) not in (np.float32, np.float16):
+            raise ValueError("dtype must be 'float32' or 'float16'")
+
+        self.directory = directory
+        self.data_path = os.path.join(directory, self.DATA_FILE)
+        self.index_path = os.path.join(directory, self.INDEX_FILE)
+        os.makedirs(directory, exist_ok=True)
+
+        self.dtype = np.dtype(dtype)
+        self.model = model
+        self.dim = None
+        self.rows = {}
+        self.hashes = {}
+        self._matrix = None
+        self._load_index()
+
+    @staticmethod
+    def content_hash(text):
+        """Stable fingerprint of a note's text"""
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _key(note_id):
+        """JSON object keys are strings, so note ids are stored as strings"""
+        return str(note_id)
+
+    def _load_index(self):
+        """Read the id/hash index written by a previous run"""
+        if not os.path.exists(self.index_path):
+            return
+
+        with open(self.index_path, 'r') as f:
+            index = json.load(f)
+
+        if np.dtype(index['dtype']) != self.dtype:
+            raise ValueError(f"Store at {self.directory} holds {index['dtype']}, not {self.dtype}")
+        if self.model is not None and index.get('model') != self.model:
+            print(f"Embedding store was built with {index.get('model') or 'an unknown model'}; "
+                  f"rebuilding it for {self.model}")
+            self.clear()
+            return
+        if not index.get('normalized'):
+            print("Embedding store holds unnormalized rows; rebuilding it")
+            self.clear()
+            return
+        self.model = index.get('model')
+        self.dim = index['dim']
+        self.rows = index['rows']
+        self.hashes = index['hashes']
+
+    def _save_index(self):
+        """Atomically replace the index so readers never see a partial file"""
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'dim': self.dim,
+                'dtype': self.dtype.name,
+                'model': self.model,
+                'normalized': True,
+                'rows': self.rows,
+                'hashes': self.hashes
+            }, f)
+        os.replace(tmp_path, self.index_path)
+
+    def clear(self):
+        """Remove every stored embedding"""
+        self._matrix = None
+        self.dim = None
+        self.rows = {}
+        self.hashes = {}
+        for path in (self.data_path, self.index_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def matrix(self):
+        """Read-only memory map over every stored row"""
+        if self._matrix is None and self.rows:
+            self._matrix = np.memmap(self.data_path, dtype=self.dtype, mode='r',
+                                     shape=(len(self.rows), self.dim))
+        return self._matrix
+
+    def stale_ids(self, note_ids, texts):
+        """Ids of notes that are missing from the store or whose text changed"""
+        return [
+            note_id for note_id, text in zip(note_ids, texts)
+            if self.hashes.get(self._key(note_id)) != self.content_hash(text)
+        ]
+
+    def put(self, note_ids, texts, embeddings):
+        """Write unit-length embeddings for new notes (appended) and edited notes (in place)"""
+        if len(embeddings) == 0:
+            return
+        embeddings = normalize_rows(embeddings).astype(self.dtype, copy=False)
+        if self.dim is None:
+            self.dim = embeddings.shape[1]
+        elif embeddings.shape[1] != self.dim:
+            raise ValueError(f"Embedding dim {embeddings.shape[1]} does not match store dim {self.dim}")
+
+        # An id repeated within the batch keeps only its last text, so it gets exactly one row
+        last = {self._key(note_id): i for i, note_id in enumerate(note_ids)}
+        if len(last) < len(note_ids):
+            keep = sorted(last.values())
+            note_ids = [note_ids[i] for i in keep]
+            texts = [texts[i] for i in keep]
+            embeddings = embeddings[keep]
+
+        existing = [i for i, note_id in enumerate(note_ids) if self._key(note_id) in self.rows]
+        new = [i for i, note_id in enumerate(note_ids) if self._key(note_id) not in self.rows]
+
+        # Drop the read-only map before the file changes underneath it
+        self._matrix = None
+
+        if existing:
+            rows = [self.rows[self._key(note_ids[i])] for i in existing]
+            writable = np.memmap(self.data_path, dtype=self.dtype, mode='r+',
+                                 shape=(len(self.rows), self.dim))
+            writable[rows] = embeddings[existing]
+            writable.flush()
+            del writable
+
+        if new:
+            # Trim rows left behind by an interrupted write before appending
+            expected_size = len(self.rows) * self.dim * self.dtype.itemsize
+            with open(self.data_path, 'ab') as f:
+                f.truncate(expected_size)
+                f.write(np.ascontiguousarray(embeddings[new]).tobytes())
+            for i in new:
+                self.rows[self._key(note_ids[i])] = len(self.rows)
+
+        for note_id, text in zip(note_ids, texts):
+            self.hashes[self._key(note_id)] = self.content_hash(text)
+        self._save_index()
+
+    def get(self, note_ids):
+        """Embeddings for note_ids in order; zero-copy when they cover the store in row order"""
+        rows = np.fromiter((self.rows[self._key(note_id)] for note_id in note_ids),
+                           dtype=np.int64, count=len(note_ids))
+        if len(rows) == len(self.rows) and np.array_equal(rows, np.arange(len(rows))):
+            return self.matrix
+        return np.asarray(self.matrix[rows])
+
+    def sync(self, note_ids, texts, embed_fn):
+        """Embed only new or edited notes with embed_fn, then return all embeddings"""
+        stale = set(self.stale_ids(note_ids, texts))
+        if stale:
+            pending = [(note_id, text) for note_id, text in zip(note_ids, texts) if note_id in stale]
+            pending_ids = [note_id for note_id, _ in pending]
+            pending_texts = [text for _, text in pending]
+            print(f"Embedding {len(pending)} new or edited notes ({len(note_ids) - len(pending)} cached)")
+            self.put(pending_ids, pending_texts, embed_fn(pending_texts))
+        else:
+            print(f"All {len(note_ids)} embeddings loaded from store")
+
+        return self.get(note_ids)
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import sqlite3
+import numpy as np
+from config import (client, EMBEDDING_BACKEND, GROQ_EMBEDDING_MODEL, LOCAL_EMBEDDING_MODEL,
+                    EMBEDDING_BATCH_SIZE, EMBEDDING_WORKERS, QUERY_CACHE_PATH)
+
+
+class QueryCache:
+    """Persistent query -> embedding cache backed by SQLite"""
+
+    def __init__(self, path=QUERY_CACHE_PATH):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS query_embeddings "
+            "(key TEXT PRIMARY KEY, dim INTEGER, vector BLOB)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def _key(model_name, query):
+        return hashlib.sha1(f"{model_name}\0{query}".encode('utf-8')).hexdigest()
+
+    def get(self, model_name, query):
+        row = self.conn.execute(
+            "SELECT vector FROM query_embeddings WHERE key = ?",
+            (self._key(model_name, query),)
+        ).fetchone()
+        return np.frombuffer(row[0], dtype=np.float32) if row else None
+
+    def put(self, model_name, query, vector):
+        vector = np.asarray(vector, dtype=np.float32)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO query_embeddings VALUES (?, ?, ?)",
+            (self._key(model_name, query), len(vector), vector.tobytes())
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+class NoteEmbedder:
+    def __init__(self, model_name=LOCAL_EMBEDDING_MODEL, backend=EMBEDDING_BACKEND, batch_size=EMBEDDING_BATCH_SIZE,
+                 num_workers=EMBEDDING_WORKERS, sort_by_length=True, query_cache_path=QUERY_CACHE_PATH):
+        """Embed notes with the Groq API or a local sentence-transformers model
+
+        Notes and queries are always embedded by the same backend, so their
+        vectors live in the same space.
+
+        Args:
+            model_name (str): Local sentence-transformers model
+            backend (str): 'local' or 'groq'
+            batch_size (int): Texts per forward pass / API request
+            num_workers (int): Size of the multi-process CPU encode pool (0 or 1 disables it)
+            sort_by_length (bool): Sort texts by length before splitting them across the encode
+                pool, so each worker's chunk holds similar lengths (encode() already sorts
+                within a single process)
+            query_cache_path (str): SQLite file for cached query embeddings (None disables it)
+        """
+        if backend not in ('local', 'groq'):
+            raise ValueError("backend must be 'local' or 'groq'")
+        self.model_name = model_name
+        self.backend = backend
+        self.batch_size = batch_size
+        self.num_workers = num_workers
+        self.sort_by_length = sort_by_length
+        self.query_cache = QueryCache(query_cache_path) if query_cache_path else None
+        self._model = None
+        self._pool = None
+
+    def load_notes_from_file(self, path):
+        """Load notes from a JSON file of {"id", "content"} objects"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def prepare_notes(self, notes_data):
+        """Split notes into parallel lists of texts and ids"""
+        texts = [note['content'].strip() for note in notes_data]
+        note_ids = [note['id'] for note in notes_data]
+        return texts, note_ids
+
+    @property
+    def embedding_model(self):
+        """Identifier of the model producing this embedder's vectors"""
+        if self.backend == 'groq':
+            return f"groq:{GROQ_EMBEDDING_MODEL}"
+        return f"local:{self.model_name}"
+
+    @property
+    def model(self):
+        """Load the local model once, on first use"""
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name, device='cpu')
+        return self._model
+
+    def _start_pool(self):
+        """Start the multi-process encode pool once and keep it for later calls"""
+        if self._pool is None:
+            self._pool = self.model.start_multi_process_pool(
+                target_devices=['cpu'] * self.num_workers
+            )
+        return self._pool
+
+    def close(self):
+        """Stop worker processes and close the query cache"""
+        if self._pool is not None:
+            self.model.stop_multi_process_pool(self._pool)
+            self._pool = None
+        if self.query_cache is not None:
+            self.query_cache.close()
+            self.query_cache = None
+
+    def _length_order(self, texts):
+        """Permutation that groups texts of similar length into the same chunk"""
+        if not self.sort_by_length:
+            return np.arange(len(texts))
+        return np.argsort([len(text) for text in texts], kind='stable')
+
+    def get_embeddings_local(self, texts, batch_size=None):
+        """Embed texts with the local model, across the encode pool for large inputs"""
+        if len(texts) == 0:
+            return np.empty((0, self.model.get_sentence_embedding_dimension()), dtype=np.float32)
+
+        batch_size = batch_size or self.batch_size
+        if self.num_workers <= 1 or len(texts) < batch_size * self.num_workers:
+            # encode() sorts its inputs by length itself
+            return self.model.encode(
+                texts, batch_size=batch_size, convert_to_numpy=True, show_progress_bar=False
+            ).astype(np.float32, copy=False)
+
+        # The pool splits the input into chunks in order and each worker only sorts its
+        # own chunk, so sort globally first to give every chunk similar lengths
+        order = self._length_order(texts)
+        sorted_embeddings = self.model.encode_multi_process(
+            [texts[i] for i in order], self._start_pool(), batch_size=batch_size
+        )
+        embeddings = np.empty_like(sorted_embeddings, dtype=np.float32)
+        embeddings[order] = sorted_embeddings
+        return embeddings
+
+    def get_embeddings_groq(self, texts, batch_size=None):
+        """Embed texts with the Groq embeddings endpoint, one request per batch"""
+        batch_size = batch_size or self.batch_size
+        embeddings = []
+        for start in range(0, len(texts), batch_size):
+            response = client.embeddings.create(
+                model=GROQ_EMBEDDING_MODEL,
+                input=texts[start:start + batch_size]
+            )
+            embeddings.extend(item.embedding for item in response.data)
+        return np.array(embeddings, dtype=np.float32)
+
+    def get_embeddings(self, texts):
+        """
+        Embed texts with the configured backend
+
+        There is no fallback to the other backend: its vectors have a different
+        dimension and space, so mixing them would corrupt the embedding store.
+        """
+        if self.backend == 'groq':
+            return self.get_embeddings_groq(texts)
+        return self.get_embeddings_local(texts)
+
+    def get_query_embeddings(self, queries):
+        """Embed search queries with the notes' backend, reusing cached vectors from earlier runs"""
+        results = [None] * len(queries)
+        missing = []
+        for i, query in enumerate(queries):
+            cached = self.query_cache.get(self.embedding_model, query) if self.query_cache else None
+            if cached is None:
+                missing.append(i)
+            else:
+                results[i] = cached
+
+        if missing:
+            # One model call for every uncached query instead of one per query
+            fresh = self.get_embeddings([queries[i] for i in missing])
+            for i, vector in zip(missing, fresh):
+                results[i] = vector
+                if self.query_cache:
+                    self.query_cache.put(self.embedding_model, queries[i], vector)
+
+        return np.vstack(results)
+
+    def get_query_embedding(self, query):
+        """Embed a single search query, using the persistent cache"""
+        return self.get_query_embeddings([query])[0]
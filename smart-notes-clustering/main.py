@@ -3,8 +3,10 @@ import numpy as np
 from embeddings import NoteEmbedder
 from clustering import NoteClustering
 from search import SemanticSearch
+from embedding_store import EmbeddingStore
 from visualization import Visualization
-from config import client
+from cluster_labeler import ClusterLabeler
+from dedup import NoteDeduplicator
 
 def create_sample_notes():
     """Create sample notes for testing"""
@@ -31,12 +33,11 @@ def create_sample_notes():
     
     return sample_notes
 
-def main():
+def run_demo(embedder):
     print("=== Smart Notes Clustering ===")
     
     # Step 1: Create or load notes
     try:
-        embedder = NoteEmbedder()
         notes_data = embedder.load_notes_from_file('sample_notes.json')
         print(f"Loaded {len(notes_data)} notes from file")
     except FileNotFoundError:
@@ -46,16 +47,15 @@ def main():
     
     # Step 2: Prepare notes and generate embeddings
     texts, note_ids = embedder.prepare_notes(notes_data)
+    
+    # Collapse pasted near-duplicates so each is embedded and clustered once
+    dedup = NoteDeduplicator()
+    texts, note_ids = dedup.collapse(texts, note_ids)
     print("Generating embeddings...")
     
-    # Try Groq API first, fallback to local model
-    try:
-        embeddings = embedder.get_embeddings_groq(texts)
-        print("Used Groq API for embeddings")
-    except Exception as e:
-        print(f"Groq API failed: {e}. Using local model...")
-        embeddings = embedder.get_embeddings_local(texts)
-        print("Used local model for embeddings")
+    # Reuse stored embeddings; only new or edited notes are sent to the embedder
+    store = EmbeddingStore('embedding_store', model=embedder.embedding_model)
+    embeddings = store.sync(note_ids, texts, embedder.get_embeddings)
     
     print(f"Embeddings shape: {embeddings.shape}")
     
@@ -65,25 +65,34 @@ def main():
     labels = clusterer.cluster_notes(embeddings)
     
     cluster_info = clusterer.get_cluster_info(embeddings)
+    cluster_labels = ClusterLabeler().label_clusters(
+        embeddings, labels, clusterer.centroids, texts, note_ids
+    )
     print(f"Created {clusterer.n_clusters} clusters")
     for cluster_id, info in cluster_info.items():
-        print(f"Cluster {cluster_id}: {info['size']} notes")
+        print(f"Cluster {cluster_id}: {info['size']} notes - {cluster_labels.get(cluster_id, {}).get('label', 'empty')}")
+    clusterer.print_phase_report()
     
     # Step 4: Initialize search
-    searcher = SemanticSearch(embeddings, texts, note_ids)
+    searcher = SemanticSearch(embeddings, texts, note_ids, labels, normalized=True)
     
     # Step 5: Visualize results
     viz = Visualization()
     print("\nReducing dimensions for visualization...")
-    reduced_embeddings = viz.reduce_dimensions(embeddings, method='umap')
+    # Plot a stratified sample so large archives stay fast and the HTML stays small
+    sample = viz.sample_indices(labels)
+    sample_labels = labels[sample]
+    sample_texts = [texts[i] for i in sample]
+    sample_ids = [note_ids[i] for i in sample]
+    reduced_embeddings = viz.reduce_dimensions(embeddings[sample], method='umap')
     
     # Matplotlib visualization
     print("Creating static visualization...")
-    viz.plot_clusters_matplotlib(reduced_embeddings, labels, texts)
+    viz.plot_clusters_matplotlib(reduced_embeddings, sample_labels, sample_texts)
     
     # Plotly interactive visualization
     print("Creating interactive visualization...")
-    viz.plot_clusters_plotly(reduced_embeddings, labels, texts, note_ids)
+    viz.plot_clusters_plotly(reduced_embeddings, sample_labels, sample_texts, sample_ids)
     
     # Cluster sizes
     viz.plot_cluster_sizes(cluster_info)
@@ -96,15 +105,17 @@ def main():
     print(f"Query: '{query}'")
     
     # Generate embedding for query
-    query_embedding = embedder.get_embeddings_local([query])[0]
+    query_embedding = embedder.get_query_embedding(query)
     
     # Find similar notes
-    similar_notes = searcher.search_similar(query_embedding, top_k=3)
+    similar_notes = dedup.expand_results(searcher.search_similar(query_embedding, top_k=3))
     
     print("Most similar notes:")
     for i, result in enumerate(similar_notes, 1):
         print(f"{i}. Note {result['note_id']} (Similarity: {result['similarity']:.3f}):")
         print(f"   {result['text']}")
+        if result['duplicate_ids']:
+            print(f"   Duplicates: {result['duplicate_ids']}")
         print()
     
     # Demonstrate cluster-based search
@@ -121,5 +132,13 @@ def main():
             print(f"   {result['text']}")
             print()
 
+def main():
+    embedder = NoteEmbedder()
+    try:
+        run_demo(embedder)
+    finally:
+        # Stop encode worker processes and close the query cache
+        embedder.close()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
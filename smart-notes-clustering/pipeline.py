@@ -0,0 +1,257 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+import tracemalloc
+import numpy as np
+from embeddings import NoteEmbedder
+from embedding_store import EmbeddingStore
+from clustering import NoteClustering
+from search import SemanticSearch
+from visualization import Visualization
+from cluster_labeler import ClusterLabeler
+from dedup import NoteDeduplicator
+
+
+class Pipeline:
+    """Headless embed -> cluster -> label -> reduce -> visualize -> index pipeline.
+
+    Every stage writes its output under cache_dir/<stage>/<key>, where the key
+    hashes the stage's parameters and the keys of the stages it depends on.
+    A stage whose key is already on disk is loaded instead of recomputed.
+    """
+
+    STAGES = ['embed', 'cluster', 'label', 'reduce', 'visualize', 'index']
+    DEPENDS = {
+        'embed': [],
+        'cluster': ['embed'],
+        'label': ['embed', 'cluster'],
+        'reduce': ['embed', 'cluster'],
+        'visualize': ['cluster', 'reduce'],
+        'index': ['embed', 'cluster'],
+    }
+    DEFAULT_PARAMS = {
+        'embed': {'store_dir': 'embedding_store', 'dtype': 'float32'},
+        'cluster': {'method': 'minibatch', 'n_clusters': 'auto'},
+        'label': {'notes_per_cluster': 8, 'change_threshold': 0.2},
+        'reduce': {'method': 'umap', 'max_points': 20000, 'pca_components': 50},
+        'visualize': {'hover_chars': 80},
+        'index': {'index': 'ivf'},
+    }
+    # Index parameters only some backends accept, applied once the backend is known
+    INDEX_DEFAULTS = {
+        'ivf': {'n_probe': 8},
+    }
+
+    def __init__(self, notes_path, cache_dir='pipeline_cache', params=None, dedup_threshold=0.8):
+        self.notes_path = notes_path
+        self.cache_dir = cache_dir
+        self.params = {stage: dict(defaults) for stage, defaults in self.DEFAULT_PARAMS.items()}
+        for stage, overrides in (params or {}).items():
+            self.params[stage].update(overrides)
+        index = self.params['index']['index']
+        self.params['index'] = {**self.INDEX_DEFAULTS.get(index, {}), **self.params['index']}
+
+        self.embedder = NoteEmbedder()
+        notes_data = self.embedder.load_notes_from_file(notes_path)
+        self.texts, self.note_ids = self.embedder.prepare_notes(notes_data)
+
+        # Near-duplicates are collapsed before any stage; dedup.expand_* maps back
+        self.dedup = NoteDeduplicator(threshold=dedup_threshold) if dedup_threshold else None
+        if self.dedup:
+            self.texts, self.note_ids = self.dedup.collapse(self.texts, self.note_ids)
+
+        self.outputs = {}
+        self._keys = {}
+        self.report = []
+
+    def _notes_fingerprint(self):
+        digest = hashlib.sha1()
+        for note_id, text in zip(self.note_ids, self.texts):
+            digest.update(f"{note_id}\0{text}\0".encode('utf-8'))
+        return digest.hexdigest()
+
+    def stage_key(self, stage):
+        """Hash of the stage's parameters and all of its upstream keys"""
+        if stage not in self._keys:
+            inputs = {
+                'stage': stage,
+                'params': self.params[stage],
+                'upstream': {dep: self.stage_key(dep) for dep in self.DEPENDS[stage]},
+            }
+            if stage == 'embed':
+                inputs['notes'] = self._notes_fingerprint()
+                inputs['model'] = self.embedder.embedding_model
+                inputs['normalized'] = True  # Store rows are unit length; older outputs were not
+            blob = json.dumps(inputs, sort_keys=True).encode('utf-8')
+            self._keys[stage] = hashlib.sha1(blob).hexdigest()[:16]
+        return self._keys[stage]
+
+    def stage_dir(self, stage):
+        return os.path.join(self.cache_dir, stage, self.stage_key(stage))
+
+    def _done_marker(self, stage):
+        return os.path.join(self.stage_dir(stage), 'DONE')
+
+    def is_cached(self, stage):
+        return os.path.exists(self._done_marker(stage))
+
+    # --- stages -------------------------------------------------------------
+
+    def _run_embed(self, out_dir):
+        params = self.params['embed']
+        store = EmbeddingStore(params['store_dir'], dtype=params['dtype'], model=self.embedder.embedding_model)
+        embeddings = store.sync(self.note_ids, self.texts, self.embedder.get_embeddings)
+        np.save(os.path.join(out_dir, 'embeddings.npy'), embeddings)
+
+    def _run_cluster(self, out_dir):
+        clusterer = NoteClustering(**self.params['cluster'])
+        labels = clusterer.cluster_notes(self.load('embed')['embeddings'])
+        np.savez(os.path.join(out_dir, 'cluster.npz'), labels=labels, centroids=clusterer.centroids)
+
+    def _run_label(self, out_dir):
+        cluster = self.load('cluster')
+        labeler = ClusterLabeler(**self.params['label'])
+        cluster_labels = labeler.label_clusters(self.load('embed')['embeddings'], cluster['labels'],
+                                                cluster['centroids'], self.texts, self.note_ids)
+        with open(os.path.join(out_dir, 'label.json'), 'w', encoding='utf-8') as f:
+            json.dump(cluster_labels, f, indent=2)
+
+    def _run_reduce(self, out_dir):
+        params = dict(self.params['reduce'])
+        method = params.pop('method')
+        viz = Visualization(**params)
+        sample = viz.sample_indices(self.load('cluster')['labels'])
+        reduced = viz.reduce_dimensions(self.load('embed')['embeddings'][sample], method=method)
+        np.savez(os.path.join(out_dir, 'reduce.npz'), sample=sample, reduced=reduced)
+
+    def _run_visualize(self, out_dir):
+        viz = Visualization(**self.params['visualize'])
+        labels = self.load('cluster')['labels']
+        reduced = self.load('reduce')
+        sample = reduced['sample']
+        sample_texts = [self.texts[i] for i in sample]
+        sample_ids = [self.note_ids[i] for i in sample]
+
+        viz.plot_clusters_matplotlib(reduced['reduced'], labels[sample], sample_texts,
+                                     output_path=os.path.join(out_dir, 'clusters.png'))
+        viz.plot_clusters_plotly(reduced['reduced'], labels[sample], sample_texts, sample_ids,
+                                 output_path=os.path.join(out_dir, 'clusters.html'))
+        sizes = np.bincount(labels)
+        viz.plot_cluster_sizes({i: {'size': int(size)} for i, size in enumerate(sizes)},
+                               output_path=os.path.join(out_dir, 'cluster_sizes.png'))
+
+    def _run_index(self, out_dir):
+        params = dict(self.params['index'])
+        index = params.pop('index')
+        cluster = self.load('cluster')
+        SemanticSearch(self.load('embed')['embeddings'], self.texts, self.note_ids,
+                       labels=cluster['labels'], index=index, centroids=cluster['centroids'],
+                       index_path=os.path.join(out_dir, f'{index}.index'), normalized=True, **params)
+
+    # --- orchestration ------------------------------------------------------
+
+    def load(self, stage):
+        """Load a stage's cached arrays, computing the stage first if needed"""
+        if stage not in self.outputs:
+            if not self.is_cached(stage):
+                self.run_stage(stage, reason='dependency')
+            out_dir = self.stage_dir(stage)
+            if stage == 'embed':
+                self.outputs[stage] = {
+                    'embeddings': np.load(os.path.join(out_dir, 'embeddings.npy'), mmap_mode='r')
+                }
+            elif os.path.exists(os.path.join(out_dir, f'{stage}.json')):
+                with open(os.path.join(out_dir, f'{stage}.json'), 'r', encoding='utf-8') as f:
+                    self.outputs[stage] = json.load(f)
+            else:
+                path = os.path.join(out_dir, f'{stage}.npz')
+                self.outputs[stage] = dict(np.load(path)) if os.path.exists(path) else {}
+        return self.outputs[stage]
+
+    def run_stage(self, stage, force=False, reason='requested'):
+        """Run one stage unless its output is already cached; records timing and memory"""
+        entry = {'stage': stage, 'key': self.stage_key(stage)}
+        if self.is_cached(stage) and not force:
+            entry['status'] = 'cached'
+            self.report.append(entry)
+            return
+
+        # Make sure upstream outputs are loaded before timing this stage alone
+        for dep in self.DEPENDS[stage]:
+            self.load(dep)
+
+        out_dir = self.stage_dir(stage)
+        os.makedirs(out_dir, exist_ok=True)
+        print(f"\n[{stage}] running ({reason})...")
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            getattr(self, f'_run_{stage}')(out_dir)
+            entry['seconds'] = round(time.perf_counter() - start, 3)
+            entry['peak_mb'] = round(tracemalloc.get_traced_memory()[1] / 1e6, 1)
+        finally:
+            tracemalloc.stop()
+
+        with open(self._done_marker(stage), 'w') as f:
+            f.write(entry['key'])
+        self.outputs.pop(stage, None)
+        entry['status'] = 'computed' if reason == 'requested' else 'computed (dependency)'
+        self.report.append(entry)
+
+    def run(self, stages=None, skip=(), force=False):
+        """Run the requested stages in pipeline order and return the report"""
+        start = time.perf_counter()
+        stages = stages or self.STAGES
+        for stage in self.STAGES:
+            if stage not in stages:
+                continue
+            if stage in skip:
+                self.report.append({'stage': stage, 'status': 'skipped'})
+                continue
+            self.run_stage(stage, force=force)
+
+        if self.dedup:
+            # Mapping from kept note id to every original id it stands for
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(os.path.join(self.cache_dir, 'duplicates.json'), 'w', encoding='utf-8') as f:
+                json.dump({str(k): v for k, v in self.dedup.groups.items()}, f)
+
+        return {
+            'notes': len(self.note_ids),
+            'duplicates_collapsed': len(self.dedup.representative_of) if self.dedup else 0,
+            'total_seconds': round(time.perf_counter() - start, 3),
+            'stages': self.report,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the smart notes clustering pipeline headlessly")
+    parser.add_argument('notes', help="JSON file of {\"id\", \"content\"} notes")
+    parser.add_argument('--stages', nargs='+', choices=Pipeline.STAGES, help="Stages to run (default: all)")
+    parser.add_argument('--skip', nargs='+', choices=Pipeline.STAGES, default=[], help="Stages to skip")
+    parser.add_argument('--force', action='store_true', help="Recompute requested stages even if cached")
+    parser.add_argument('--cache-dir', default='pipeline_cache')
+    parser.add_argument('--params', help="JSON overrides, e.g. '{\"cluster\": {\"n_clusters\": 8}}'")
+    parser.add_argument('--dedup-threshold', type=float, default=0.8,
+                        help="MinHash similarity at which notes are collapsed as duplicates (0 disables)")
+    parser.add_argument('--report', help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    pipeline = Pipeline(args.notes, cache_dir=args.cache_dir,
+                        params=json.loads(args.params) if args.params else None,
+                        dedup_threshold=args.dedup_threshold)
+    report = pipeline.run(stages=args.stages, skip=args.skip, force=args.force)
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.report}")
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
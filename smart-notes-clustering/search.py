@@ -0,0 +1,106 @@
+import numpy as np
+from ann_index import build_index, normalize_rows
+
+
+class SemanticSearch:
+    def __init__(self, embeddings, texts, note_ids, labels=None,
+                 index='exact', centroids=None, index_path=None, normalized=False, **index_params):
+        """Build a cosine-similarity index over the note embeddings
+
+        index selects the backend: 'exact' (brute force), 'ivf' (inverted file
+        over k-means centroids, pass NoteClustering's centroids to reuse them)
+        or 'hnsw' (graph index, requires hnswlib). index_path persists the
+        ANN index so it is only built once. normalized=True means the rows
+        already have unit length (EmbeddingStore writes them so) and are used
+        as given, keeping a memory map shared instead of copying it into RAM.
+        """
+        self.texts = texts
+        self.note_ids = note_ids
+        self.embeddings = embeddings if normalized else normalize_rows(embeddings)
+
+        # Row indices of every cluster, so in-cluster search only touches those rows
+        self._labels = None
+        self._cluster_rows = {}
+        if labels is not None:
+            self._index_clusters(labels)
+
+        self.index_type = index
+        self.index = None
+        if index != 'exact':
+            self.index = build_index(index, self.embeddings, centroids=centroids,
+                                     path=index_path, **index_params)
+
+    def _index_clusters(self, labels):
+        """Group row indices by cluster label"""
+        labels = np.asarray(labels)
+        order = np.argsort(labels, kind='stable')
+        unique, starts = np.unique(labels[order], return_index=True)
+        self._cluster_rows = {
+            int(cluster_id): rows
+            for cluster_id, rows in zip(unique, np.split(order, starts[1:]))
+        }
+        self._labels = labels
+
+    @staticmethod
+    def _top_k(similarities, top_k):
+        """Indices of the top_k largest similarities per row, best first"""
+        n = similarities.shape[1]
+        top_k = min(top_k, n)
+        if top_k <= 0:
+            return np.empty((similarities.shape[0], 0), dtype=np.intp)
+
+        if top_k < n:
+            candidates = np.argpartition(-similarities, top_k - 1, axis=1)[:, :top_k]
+        else:
+            candidates = np.broadcast_to(np.arange(n), similarities.shape)
+
+        candidate_scores = np.take_along_axis(similarities, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind='stable')
+        return np.take_along_axis(candidates, order, axis=1)
+
+    def _format_results(self, rows, similarities):
+        """Convert matched rows into result dicts"""
+        return [
+            {
+                'note_id': self.note_ids[row],
+                'text': self.texts[row],
+                'similarity': float(similarity)
+            }
+            for row, similarity in zip(rows, similarities)
+            if row >= 0
+        ]
+
+    def search_similar(self, query_embedding, top_k=5):
+        """Find the top_k notes most similar to a query embedding"""
+        return self.search_many(query_embedding, top_k)[0]
+
+    def search_many(self, query_matrix, top_k=5, exact=False):
+        """Search many queries at once with a single matrix multiplication"""
+        queries = normalize_rows(query_matrix)
+
+        if self.index is not None and not exact:
+            top_rows, top_scores = self.index.search(queries, top_k)
+        else:
+            similarities = queries @ self.embeddings.T
+            top_rows = self._top_k(similarities, top_k)
+            top_scores = np.take_along_axis(similarities, top_rows, axis=1)
+
+        return [
+            self._format_results(rows, scores)
+            for rows, scores in zip(top_rows, top_scores)
+        ]
+
+    def find_similar_in_cluster(self, query_embedding, labels, cluster_id, top_k=5):
+        """Find similar notes restricted to a single cluster"""
+        if self._labels is None or not np.array_equal(self._labels, labels):
+            self._index_clusters(labels)
+
+        rows = self._cluster_rows.get(int(cluster_id))
+        if rows is None or len(rows) == 0:
+            return []
+
+        query = normalize_rows(query_embedding)
+        similarities = query @ self.embeddings[rows].T
+
+        top = self._top_k(similarities, top_k)[0]
+        return self._format_results(rows[top], similarities[0, top])
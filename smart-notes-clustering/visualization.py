@@ -0,0 +1,151 @@
+import os
+import time
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import plotly.graph_objects as go
+from sklearn.decomposition import PCA
+
+
+class Visualization:
+    def __init__(self, max_points=20000, pca_components=50, hover_chars=80, random_state=42):
+        """Plot note clusters
+
+        Args:
+            max_points (int): Notes kept by stratified sampling before reducing (None keeps all)
+            pca_components (int): PCA dimensions computed before UMAP (None skips PCA)
+            hover_chars (int): Length hover and label text is truncated to
+        """
+        self.max_points = max_points
+        self.pca_components = pca_components
+        self.hover_chars = hover_chars
+        self.random_state = random_state
+        self.pca = None
+        self.reducer = None
+
+    def sample_indices(self, labels, max_points=None):
+        """Stratified sample: every cluster keeps its share of points, and at least one"""
+        max_points = max_points or self.max_points
+        labels = np.asarray(labels)
+        if max_points is None or len(labels) <= max_points:
+            return np.arange(len(labels))
+
+        rng = np.random.default_rng(self.random_state)
+        fraction = max_points / len(labels)
+        indices = []
+        for cluster_id in np.unique(labels):
+            members = np.flatnonzero(labels == cluster_id)
+            keep = max(1, int(round(len(members) * fraction)))
+            indices.append(rng.choice(members, keep, replace=False))
+        return np.sort(np.concatenate(indices))
+
+    def reduce_dimensions(self, embeddings, method='umap', n_components=2):
+        """Fit a 2D reducer (optionally after PCA) and return the projected embeddings"""
+        start = time.perf_counter()
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+
+        if self.pca_components and embeddings.shape[1] > self.pca_components and len(embeddings) > self.pca_components:
+            self.pca = PCA(n_components=self.pca_components, random_state=self.random_state)
+            embeddings = self.pca.fit_transform(embeddings)
+        else:
+            self.pca = None
+
+        if method == 'umap':
+            import umap
+            self.reducer = umap.UMAP(n_components=n_components, random_state=self.random_state,
+                                     n_neighbors=min(15, len(embeddings) - 1))
+        elif method == 'pca':
+            self.reducer = PCA(n_components=n_components, random_state=self.random_state)
+        elif method == 'tsne':
+            # t-SNE cannot project new points; transform() is unavailable for it
+            from sklearn.manifold import TSNE
+            self.reducer = TSNE(n_components=n_components, random_state=self.random_state,
+                                perplexity=min(30, len(embeddings) - 1))
+        else:
+            raise ValueError("method must be 'umap', 'pca' or 'tsne'")
+
+        reduced = self.reducer.fit_transform(embeddings)
+        print(f"Reduced {len(embeddings)} notes with {method} in {time.perf_counter() - start:.2f}s")
+        return reduced
+
+    def transform(self, embeddings):
+        """Project new notes with the already fitted reducer, without refitting"""
+        if self.reducer is None or not hasattr(self.reducer, 'transform'):
+            raise ValueError("Call reduce_dimensions with 'umap' or 'pca' before transform")
+
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if self.pca is not None:
+            embeddings = self.pca.transform(embeddings)
+        return self.reducer.transform(embeddings)
+
+    def _truncate(self, text):
+        text = str(text)
+        return text if len(text) <= self.hover_chars else text[:self.hover_chars - 1] + '…'
+
+    @staticmethod
+    def _report_file(path, start):
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"Saved {path} ({size_mb:.2f} MB) in {time.perf_counter() - start:.2f}s")
+
+    def plot_clusters_matplotlib(self, reduced_embeddings, labels, texts,
+                                 output_path='clusters.png', max_labels=30):
+        """Static scatter plot; only the first max_labels points get text annotations"""
+        start = time.perf_counter()
+        labels = np.asarray(labels)
+
+        fig, ax = plt.subplots(figsize=(12, 8))
+        scatter = ax.scatter(reduced_embeddings[:, 0], reduced_embeddings[:, 1], c=labels,
+                             cmap='tab10', s=8 if len(labels) > 1000 else 60, alpha=0.7,
+                             rasterized=True)
+        for i in range(min(max_labels, len(texts))):
+            ax.annotate(self._truncate(texts[i])[:30], reduced_embeddings[i], fontsize=7, alpha=0.8)
+
+        fig.colorbar(scatter, ax=ax, label='Cluster')
+        ax.set_title(f'Note Clusters ({len(labels)} notes)')
+        fig.tight_layout()
+        fig.savefig(output_path, dpi=120)
+        plt.close(fig)
+        self._report_file(output_path, start)
+
+    def plot_clusters_plotly(self, reduced_embeddings, labels, texts, note_ids,
+                             output_path='clusters.html'):
+        """Interactive WebGL scatter with truncated hover text, one trace per cluster"""
+        start = time.perf_counter()
+        labels = np.asarray(labels)
+        note_ids = np.asarray(note_ids)
+
+        fig = go.Figure()
+        for cluster_id in np.unique(labels):
+            members = np.flatnonzero(labels == cluster_id)
+            fig.add_trace(go.Scattergl(
+                x=reduced_embeddings[members, 0],
+                y=reduced_embeddings[members, 1],
+                mode='markers',
+                name=f'Cluster {cluster_id}',
+                marker=dict(size=5 if len(labels) > 1000 else 10, opacity=0.7),
+                customdata=note_ids[members],
+                hovertext=[self._truncate(texts[i]) for i in members],
+                hovertemplate='Note %{customdata}<br>%{hovertext}<extra></extra>'
+            ))
+
+        fig.update_layout(title=f'Note Clusters ({len(labels)} notes)', width=1000, height=700)
+        # Load plotly.js from the CDN instead of inlining ~3.5 MB into every file
+        fig.write_html(output_path, include_plotlyjs='cdn')
+        self._report_file(output_path, start)
+
+    def plot_cluster_sizes(self, cluster_info, output_path='cluster_sizes.png'):
+        """Bar chart of notes per cluster"""
+        start = time.perf_counter()
+        cluster_ids = list(cluster_info.keys())
+        sizes = [info['size'] for info in cluster_info.values()]
+
+        fig, ax = plt.subplots(figsize=(10, 5))
+        ax.bar([str(c) for c in cluster_ids], sizes, color='steelblue')
+        ax.set_xlabel('Cluster')
+        ax.set_ylabel('Number of notes')
+        ax.set_title('Cluster Sizes')
+        fig.tight_layout()
+        fig.savefig(output_path, dpi=120)
+        plt.close(fig)
+        self._report_file(output_path, start)